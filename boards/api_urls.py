@@ -2,10 +2,19 @@
 from .api_views import *
 
 urlpatterns = [
-    path('', create_background_view, name='api_create_background'),
+    path('', BoardListViews.as_view(), name='api_list_backgrounds'),
     path('<uuid:board_id>', BoardViews.as_view(), name='api_edit_background'),
-    path('', list_backgrounds_view, name='api_list_backgrounds'),
     path('my/', list_my_backgrounds_view, name='api_list_my_backgrounds'),
+    path('export', export_boards_view, name='api_export_boards'),
+    path('<uuid:board_id>/solve', solve_board_view, name='api_solve_board'),
+    path('<uuid:board_id>/uniqueness', check_uniqueness_view, name='api_check_uniqueness'),
+    path('<uuid:board_id>/hint', hint_view, name='api_hint'),
+    path('<uuid:board_id>/leaderboard', leaderboard_view, name='api_leaderboard'),
     path('<uuid:board_id>/solutions', create_solution_view, name='api_create_solution'),
     path('<uuid:board_id>/solutions/<uuid:solution_id>', edit_solution_view, name='api_edit_solution'),
+    path('<uuid:board_id>/solutions/<uuid:solution_id>/status', solution_status_view, name='api_solution_status'),
+    path('<uuid:board_id>/play', start_play_session_view, name='api_start_play_session'),
+    path('<uuid:board_id>/play/<uuid:session_id>', play_session_view, name='api_play_session'),
+    path('<uuid:board_id>/play/<uuid:session_id>/moves', play_move_view, name='api_play_move'),
+    path('<uuid:board_id>/play/<uuid:session_id>/hint', play_hint_view, name='api_play_hint'),
 ]
\ No newline at end of file
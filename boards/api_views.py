@@ -1,54 +1,178 @@
 ﻿import uuid
 from uuid import UUID
 
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 
-from .models import GameBoard, Solution
-from .serializers import GameBoardSerializer, SolutionSerializer
+from common.conditional import versioned_etag
+from . import canonical, play, solver, transfer, uniqueness, verification
+from .models import GameBoard, PlaySession, Solution
+from .pagination import BoardCursorPagination, filter_by_difficulty
+from .serializers import (
+    GameBoardPageSerializer, GameBoardSerializer, HintRequestSerializer, HintSerializer,
+    LeaderboardEntrySerializer, PlayMoveSerializer,
+    PlayProgressSerializer, PlaySessionSerializer, SolutionPatchSerializer, SolutionSerializer,
+    SolutionStatusSerializer, SolverResultSerializer
+)
+from .validation import PENDING, VERIFIED
 
+ENCODING_PARAMETER = OpenApiParameter(
+    name='encoding',
+    description="Use 'compact' to receive the points in the compact storage encoding.",
+    required=False,
+    type=str,
+    enum=['json', 'compact'],
+)
 
-@extend_schema(
-    request=GameBoardSerializer,
-    responses={
-        201: GameBoardSerializer,
-        400: OpenApiResponse(description="Invalid data")
-    },
-    description="Create a new game board.",
-    tags=["Game Boards"]
+
+ASYNC_PARAMETER = OpenApiParameter(
+    name='async',
+    description="Store the solution as pending and verify it in the background. "
+                "The response is 202 with the URL of the verification status.",
+    required=False,
+    type=bool,
 )
-@api_view(['POST'])
-def create_background_view(request):
-    serializer = GameBoardSerializer(data=request.data)
-    if serializer.is_valid():
-        serializer.save(user=request.user)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+LIST_PARAMETERS = [
+    OpenApiParameter(
+        name='fields',
+        description="Comma separated board fields to return, e.g. 'id,name'. "
+                    "Points are not loaded unless they are requested.",
+        required=False,
+        type=str,
+    ),
+    OpenApiParameter(name='cursor', description="Cursor of the page to return.", required=False, type=str),
+    OpenApiParameter(name='page_size', description="Number of boards per page.", required=False, type=int),
+    OpenApiParameter(
+        name='ordering',
+        description="Order by estimated difficulty instead of by ID. IDs are random UUIDs, so the default "
+                    "order is stable across pages but not chronological. "
+                    "Boards without an estimate are left out.",
+        required=False,
+        type=str,
+        enum=['difficulty', '-difficulty'],
+    ),
+    OpenApiParameter(name='min_difficulty', description="Lowest estimated difficulty.", required=False, type=float),
+    OpenApiParameter(name='max_difficulty', description="Highest estimated difficulty.", required=False, type=float),
+    ENCODING_PARAMETER,
+]
+
+
+def _wants_compact(request):
+    return request.query_params.get('encoding') == 'compact'
+
+
+def _wants_async(request):
+    return request.query_params.get('async') in ('1', 'true', 'True')
+
+
+def _pending_response(solution):
+    data = SolutionStatusSerializer(solution).data
+    return Response(data, status=status.HTTP_202_ACCEPTED, headers={'Location': data['job']})
+
+
+def _board_version(request, board_id):
+    # Solution statistics and the difficulty change without a new board version, so they are part of the ETag too
+    return GameBoard.objects.filter(pk=board_id, user=request.user) \
+        .values_list('version', 'solution_count', 'solver_count', 'best_solution_length', 'difficulty').first()
+
+def _list_boards(request, game_boards):
+    fields = None
+    if request.query_params.get('fields'):
+        fields = [name.strip() for name in request.query_params['fields'].split(',') if name.strip()]
+        unknown = set(fields) - set(GameBoardSerializer.Meta.fields)
+        if unknown:
+            return Response({"error": f"Unknown fields: {', '.join(sorted(unknown))}"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if 'points' not in fields:
+            game_boards = game_boards.defer('points')
+    try:
+        game_boards = filter_by_difficulty(game_boards, request.query_params)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    paginator = BoardCursorPagination()
+    page = paginator.paginate_queryset(game_boards, request)
+    serializer = GameBoardSerializer(page, many=True, fields=fields, context={'compact': _wants_compact(request)})
+    return paginator.get_paginated_response(serializer.data)
+
+class BoardListViews(APIView):
+    @extend_schema(
+        request=GameBoardSerializer,
+        responses={
+            201: GameBoardSerializer,
+            400: OpenApiResponse(description="Invalid data")
+        },
+        description="Create a new game board.",
+        tags=["Game Boards"]
+    )
+    def post(self, request):
+        serializer = GameBoardSerializer(data=request.data)
+        if serializer.is_valid():
+            board = GameBoard(**serializer.validated_data)
+            results = GameBoard.known_results(board.columns, board.rows, board.points)
+            serializer.save(user=request.user, **results)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    @extend_schema(
+        responses={
+            200: GameBoardPageSerializer,
+            400: OpenApiResponse(description="Unknown fields requested")
+        },
+        parameters=LIST_PARAMETERS,
+        operation_id='boards_list',
+        description="List all game boards, one page at a time.",
+        tags=["Game Boards"]
+    )
+    def get(self, request):
+        return _list_boards(request, GameBoard.objects.all())
 
 @extend_schema(
-    responses={200: GameBoardSerializer(many=True)},
-    description="List all game boards.",
+    responses={
+        200: GameBoardPageSerializer,
+        400: OpenApiResponse(description="Unknown fields requested")
+    },
+    parameters=LIST_PARAMETERS,
+    description="List all game boards for the current user, one page at a time.",
     tags=["Game Boards"]
 )
 @api_view(['GET'])
-def list_backgrounds_view(request):
-    game_boards = GameBoard.objects.all()
-    serializer = GameBoardSerializer(game_boards, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+def list_my_backgrounds_view(request):
+    return _list_boards(request, GameBoard.objects.filter(user=request.user))
 
 @extend_schema(
-    responses={200: GameBoardSerializer(many=True)},
-    description="List all game boards for the current user.",
+    responses={
+        200: OpenApiResponse(description="Newline delimited JSON: one record per board, then one per solution")
+    },
+    parameters=[
+        OpenApiParameter(name='solutions', description="Also export the solutions of the current user on these boards.",
+                         required=False, type=bool),
+        ENCODING_PARAMETER,
+    ],
+    description="Stream the game boards of the current user as NDJSON, in the format read by import_boards.",
     tags=["Game Boards"]
 )
 @api_view(['GET'])
-def list_my_backgrounds_view(request):
+def export_boards_view(request):
     game_boards = GameBoard.objects.filter(user=request.user)
-    serializer = GameBoardSerializer(game_boards, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    solutions = None
+    if request.query_params.get('solutions') in ('1', 'true', 'True'):
+        solutions = Solution.objects.filter(game_board__in=game_boards, user=request.user)
+
+    records = transfer.export_records(game_boards, solutions, compact=_wants_compact(request))
+    response = StreamingHttpResponse(transfer.to_ndjson(records), content_type=transfer.CONTENT_TYPE)
+    response['Content-Disposition'] = 'attachment; filename="boards.ndjson"'
+    return response
 
 class BoardViews(APIView):
     @extend_schema(
@@ -71,7 +195,14 @@ class BoardViews(APIView):
 
         serializer = GameBoardSerializer(game_board, data=request.data)
         if serializer.is_valid():
-            serializer.save(user=request.user)
+            board = GameBoard(**serializer.validated_data)
+            results = {}
+            # Solver results of the stored layout stay valid for edits that keep it, like a rename
+            if canonical.layout_hash(board.columns, board.rows, board.points) != game_board.layout_hash:
+                results = GameBoard.known_results(board.columns, board.rows, board.points, exclude=game_board.pk)
+            # A new version keeps cached validation outcomes of the old board from being reused
+            serializer.save(user=request.user, version=F('version') + 1, **results)
+            game_board.refresh_from_db(fields=['version'])
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -99,9 +230,11 @@ class BoardViews(APIView):
             200: GameBoardSerializer,
             404: OpenApiResponse(description="Game board not found")
         },
+        parameters=[ENCODING_PARAMETER],
         description="Retrieve details of a specific game board.",
         tags=["Game Boards"]
     )
+    @versioned_etag(_board_version)
     def get(self, request, board_id):
         try:
             game_board = GameBoard.objects.get(pk=board_id)
@@ -110,15 +243,132 @@ class BoardViews(APIView):
         except GameBoard.DoesNotExist:
             return Response({"error": "Game board not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        serializer = GameBoardSerializer(game_board)
+        serializer = GameBoardSerializer(game_board, context={'compact': _wants_compact(request)})
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+@extend_schema(
+    responses={
+        200: SolverResultSerializer,
+        404: OpenApiResponse(description="Game board not found")
+    },
+    description="Run the solver on a game board and return a witness solution if one was found.",
+    tags=["Game Boards"]
+)
+@api_view(['GET'])
+def solve_board_view(request, board_id):
+    try:
+        game_board = GameBoard.objects.get(pk=board_id)
+        if game_board.user != request.user:
+            raise GameBoard.DoesNotExist()
+    except GameBoard.DoesNotExist:
+        return Response({"error": "Game board not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    result = game_board.solve()
+    if game_board.solvability != result.status:
+        GameBoard.objects.filter(pk=game_board.pk).update(solvability=result.status, version=F('version') + 1)
+
+    serializer = SolverResultSerializer(result)
+    return Response(serializer.data, status=status.HTTP_200_OK)
+
+@extend_schema(
+    request=None,
+    responses={
+        202: GameBoardSerializer,
+        404: OpenApiResponse(description="Game board not found")
+    },
+    description="Queue a check whether a game board has exactly one solution. The board is returned with "
+                "uniqueness 'checking' and the URL of the board, which holds the result once the check is done.",
+    tags=["Game Boards"]
+)
+@api_view(['POST'])
+def check_uniqueness_view(request, board_id):
+    try:
+        game_board = GameBoard.objects.get(pk=board_id)
+        if game_board.user != request.user:
+            raise GameBoard.DoesNotExist()
+    except GameBoard.DoesNotExist:
+        return Response({"error": "Game board not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    # The search may take seconds, so it runs on the verification workers
+    with transaction.atomic():
+        game_board.uniqueness = solver.CHECKING
+        game_board.version = F('version') + 1
+        game_board.save(update_fields=['uniqueness', 'version'])
+        uniqueness.submit(game_board.pk)
+    game_board.refresh_from_db(fields=['version'])
+
+    serializer = GameBoardSerializer(game_board)
+    headers = {'Location': reverse('api_edit_background', args=[game_board.pk])}
+    return Response(serializer.data, status=status.HTTP_202_ACCEPTED, headers=headers)
+
+@extend_schema(
+    request=HintRequestSerializer,
+    responses={
+        200: HintSerializer,
+        400: OpenApiResponse(description="Invalid paths"),
+        404: OpenApiResponse(description="Game board not found")
+    },
+    description="Suggest the next move for the paths drawn so far. Moves forced by the drawn paths "
+                "are preferred; a dead end is reported with the color that cannot be connected.",
+    tags=["Game Boards"]
+)
+@api_view(['POST'])
+def hint_view(request, board_id):
+    try:
+        game_board = GameBoard.objects.get(pk=board_id)
+    except GameBoard.DoesNotExist:
+        return Response({"error": "Game board not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    serializer = HintRequestSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        hint = solver.hint(game_board.columns, game_board.rows, game_board.points,
+                           serializer.validated_data['paths'], settings.BOARDS_SOLVER_DEADLINE)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response(HintSerializer(hint).data, status=status.HTTP_200_OK)
+
+@extend_schema(
+    responses={
+        200: LeaderboardEntrySerializer(many=True),
+        404: OpenApiResponse(description="Game board not found")
+    },
+    parameters=[
+        OpenApiParameter(name='limit', description="Number of entries, at most the configured leaderboard size.",
+                         required=False, type=int),
+    ],
+    description="List the shortest verified solutions of a game board.",
+    tags=["Solutions"]
+)
+@api_view(['GET'])
+def leaderboard_view(request, board_id):
+    try:
+        game_board = GameBoard.objects.only('pk').get(pk=board_id)
+    except GameBoard.DoesNotExist:
+        return Response({"error": "Game board not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    limit = settings.BOARDS_LEADERBOARD_SIZE
+    try:
+        limit = max(1, min(limit, int(request.query_params.get('limit', limit))))
+    except ValueError:
+        pass
+
+    entries = list(game_board.leaderboard(limit))
+    for rank, entry in enumerate(entries, start=1):
+        entry.rank = rank
+    serializer = LeaderboardEntrySerializer(entries, many=True)
+    return Response(serializer.data, status=status.HTTP_200_OK)
+
 @extend_schema(
     responses={
         200: SolutionSerializer,
+        202: SolutionStatusSerializer,
         404: OpenApiResponse(description="Game board not found")
     },
     request=SolutionSerializer,
+    parameters=[ASYNC_PARAMETER],
     description="Create solution.",
     tags=["Solutions"]
 )
@@ -129,8 +379,15 @@ def create_solution_view(request, board_id):
     except GameBoard.DoesNotExist:
         return Response({"error": "Game board not found"}, status=status.HTTP_404_NOT_FOUND)
 
-    serializer = SolutionSerializer(data=request.data, context={'game_board': game_board, 'user': request.user})
+    asynchronous = _wants_async(request)
+    serializer = SolutionSerializer(data=request.data, context={
+        'game_board': game_board, 'user': request.user, 'defer_verification': asynchronous
+    })
     if serializer.is_valid():
+        if asynchronous:
+            solution = serializer.save(game_board=game_board, user=request.user, status=PENDING)
+            verification.submit(solution.pk)
+            return _pending_response(solution)
         serializer.save(game_board=game_board, user=request.user)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -139,13 +396,28 @@ def create_solution_view(request, board_id):
     request=SolutionSerializer,
     responses={
         200: SolutionSerializer,
+        202: SolutionStatusSerializer,
         404: OpenApiResponse(description="Game board or solution not found"),
         400: OpenApiResponse(description="Invalid data")
     },
+    parameters=[ASYNC_PARAMETER],
+    methods=['PUT'],
     description="Edit an existing solution.",
     tags=["Solutions"]
 )
-@api_view(['PUT'])
+@extend_schema(
+    request=SolutionPatchSerializer,
+    responses={
+        200: SolutionPatchSerializer,
+        404: OpenApiResponse(description="Game board or solution not found"),
+        400: OpenApiResponse(description="Invalid data")
+    },
+    methods=['PATCH'],
+    description="Replace the paths of single colors in an existing solution. Colors that are left out keep "
+                "their paths; only the replaced paths are validated again.",
+    tags=["Solutions"]
+)
+@api_view(['PUT', 'PATCH'])
 def edit_solution_view(request, board_id, solution_id):
     try:
         game_board = GameBoard.objects.get(pk=board_id)
@@ -159,8 +431,192 @@ def edit_solution_view(request, board_id, solution_id):
     except Solution.DoesNotExist:
         return Response({"error": "Solution not found"}, status=status.HTTP_404_NOT_FOUND)
 
-    serializer = SolutionSerializer(solution, data=request.data)
+    if request.method == 'PATCH':
+        return _patch_solution(request, game_board, solution)
+
+    asynchronous = _wants_async(request)
+    serializer = SolutionSerializer(solution, data=request.data, context={'defer_verification': asynchronous})
     if serializer.is_valid():
-        serializer.save()
+        if asynchronous:
+            solution = serializer.save(status=PENDING, rejection_reason='')
+            verification.submit(solution.pk)
+            return _pending_response(solution)
+        serializer.save(status=VERIFIED, rejection_reason='')
         return Response(serializer.data, status=status.HTTP_200_OK)
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+def _patch_solution(request, game_board, solution):
+    with transaction.atomic():
+        # Edits of one solution are applied one at a time to the latest revision
+        solution = Solution.objects.select_for_update(of=('self',)).get(pk=solution.pk)
+        solution.game_board = game_board
+        serializer = SolutionPatchSerializer(solution, data=request.data, partial=True)
+        if serializer.is_valid():
+            serializer.save(status=VERIFIED, rejection_reason='')
+            return Response(serializer.data, status=status.HTTP_200_OK)
+    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+@extend_schema(
+    responses={
+        200: SolutionStatusSerializer,
+        404: OpenApiResponse(description="Game board or solution not found")
+    },
+    description="Check the verification status of a solution submitted asynchronously.",
+    tags=["Solutions"]
+)
+@api_view(['GET'])
+def solution_status_view(request, board_id, solution_id):
+    try:
+        solution = Solution.objects.get(pk=solution_id, game_board_id=board_id)
+        if solution.user != request.user:
+            raise Solution.DoesNotExist()
+    except Solution.DoesNotExist:
+        return Response({"error": "Solution not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    serializer = SolutionStatusSerializer(solution)
+    return Response(serializer.data, status=status.HTTP_200_OK)
+
+@extend_schema(
+    request=None,
+    responses={
+        200: PlaySessionSerializer,
+        201: PlaySessionSerializer,
+        404: OpenApiResponse(description="Game board not found")
+    },
+    description="Start playing a game board, or resume the play session of the current user. "
+                "A session whose board layout was edited in the meantime starts over.",
+    tags=["Play"]
+)
+@api_view(['POST'])
+def start_play_session_view(request, board_id):
+    try:
+        game_board = GameBoard.objects.get(pk=board_id)
+    except GameBoard.DoesNotExist:
+        return Response({"error": "Game board not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    with transaction.atomic():
+        session, created = PlaySession.objects.select_for_update().get_or_create(
+            game_board=game_board, user=request.user, defaults={'layout_version': game_board.layout_version}
+        )
+        session.game_board = game_board
+        if session.layout_version != game_board.layout_version and session.solution_id is None:
+            play.restart(session, game_board)
+        session.state = play.take_state(session)
+        play.keep_state(session, session.state)
+
+    serializer = PlaySessionSerializer(session)
+    return Response(serializer.data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
+def _locked_play_session(request, board_id, session_id):
+    return PlaySession.objects.select_for_update(of=('self',)).select_related('game_board') \
+        .filter(pk=session_id, game_board_id=board_id, user=request.user).first()
+
+@extend_schema(
+    responses={
+        200: PlaySessionSerializer,
+        404: OpenApiResponse(description="Play session not found")
+    },
+    methods=['GET'],
+    description="Retrieve a play session with the paths drawn so far.",
+    tags=["Play"]
+)
+@extend_schema(
+    responses={
+        204: OpenApiResponse(description="Play session deleted"),
+        404: OpenApiResponse(description="Play session not found")
+    },
+    methods=['DELETE'],
+    description="Abandon a play session; a solution it produced is kept.",
+    tags=["Play"]
+)
+@api_view(['GET', 'DELETE'])
+def play_session_view(request, board_id, session_id):
+    with transaction.atomic():
+        session = _locked_play_session(request, board_id, session_id)
+        if session is None:
+            return Response({"error": "Play session not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        if request.method == 'DELETE':
+            session.delete()
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        session.state = play.take_state(session)
+        play.keep_state(session, session.state)
+
+    serializer = PlaySessionSerializer(session)
+    return Response(serializer.data, status=status.HTTP_200_OK)
+
+@extend_schema(
+    request=PlayMoveSerializer,
+    responses={
+        200: PlayProgressSerializer,
+        400: OpenApiResponse(description="Invalid move"),
+        404: OpenApiResponse(description="Play session not found"),
+        409: OpenApiResponse(description="Play session is complete or its board was edited")
+    },
+    description="Extend the path of a color by one cell, or take back its last cell. "
+                "Once every color is connected the paths are stored as a verified solution.",
+    tags=["Play"]
+)
+@api_view(['POST'])
+def play_move_view(request, board_id, session_id):
+    move = PlayMoveSerializer(data=request.data)
+    if not move.is_valid():
+        return Response(move.errors, status=status.HTTP_400_BAD_REQUEST)
+    move = move.validated_data
+
+    with transaction.atomic():
+        session = _locked_play_session(request, board_id, session_id)
+        if session is None:
+            return Response({"error": "Play session not found"}, status=status.HTTP_404_NOT_FOUND)
+        if session.solution_id is not None:
+            return Response({"error": "Play session is already complete"}, status=status.HTTP_409_CONFLICT)
+        if session.layout_version != session.game_board.layout_version:
+            return Response({"error": "Game board was edited since the play session started"},
+                            status=status.HTTP_409_CONFLICT)
+
+        state = play.take_state(session)
+        try:
+            if move['undo']:
+                token = state.undo(move['color'])
+            else:
+                token = state.extend(move['color'], move['x'], move['y'])
+        except ValueError as e:
+            # A rejected move leaves the state untouched
+            play.keep_state(session, state)
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        play.record_move(session, state, token)
+        if not state.complete:
+            play.keep_state(session, state)
+
+    session.state = state
+    serializer = PlayProgressSerializer(session)
+    return Response(serializer.data, status=status.HTTP_200_OK)
+
+@extend_schema(
+    responses={
+        200: HintSerializer,
+        404: OpenApiResponse(description="Play session not found"),
+        409: OpenApiResponse(description="Game board was edited since the play session started")
+    },
+    description="Suggest the next move of a play session. Following the hints is answered from the "
+                "plan of the previous hint without running the solver again.",
+    tags=["Play"]
+)
+@api_view(['GET'])
+def play_hint_view(request, board_id, session_id):
+    with transaction.atomic():
+        session = _locked_play_session(request, board_id, session_id)
+        if session is None:
+            return Response({"error": "Play session not found"}, status=status.HTTP_404_NOT_FOUND)
+        if session.layout_version != session.game_board.layout_version:
+            return Response({"error": "Game board was edited since the play session started"},
+                            status=status.HTTP_409_CONFLICT)
+
+        state = play.take_state(session)
+        hint = play.session_hint(session, state)
+        if not state.complete:
+            play.keep_state(session, state)
+
+    return Response(HintSerializer(hint).data, status=status.HTTP_200_OK)
@@ -5,3 +5,7 @@ class BoardsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'boards'
     verbose_name = 'Boards'
+
+    def ready(self):
+        # Import the signals to register them
+        import boards.signals
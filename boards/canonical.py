@@ -0,0 +1,65 @@
+import hashlib
+import json
+
+from . import encoding
+from .fields import EncodedValue
+
+# The 8 symmetries of a grid as functions of (x, y, columns, rows) returning the new
+# cell; the second item tells whether the transform swaps columns and rows
+SYMMETRIES = [
+    (lambda x, y, w, h: (x, y), False),
+    (lambda x, y, w, h: (w - 1 - x, y), False),
+    (lambda x, y, w, h: (x, h - 1 - y), False),
+    (lambda x, y, w, h: (w - 1 - x, h - 1 - y), False),
+    (lambda x, y, w, h: (y, x), True),
+    (lambda x, y, w, h: (h - 1 - y, x), True),
+    (lambda x, y, w, h: (y, w - 1 - x), True),
+    (lambda x, y, w, h: (h - 1 - y, w - 1 - x), True),
+]
+
+
+def _renumbered(columns: int, cells) -> list:
+    """Board points as ``[cell, color]`` pairs in cell order, colors numbered by first appearance."""
+    numbers = {}
+    return [
+        [y * columns + x, numbers.setdefault(color, len(numbers))]
+        for x, y, color in sorted(cells, key=lambda cell: (cell[1], cell[0]))
+    ]
+
+
+def canonical_form(columns: int, rows: int, points) -> list:
+    """
+    Representation shared by a board and its rotated, mirrored and recolored copies.
+
+    Every symmetry of the grid is applied and the colors of each variant are numbered in
+    the order they appear in; the smallest variant is the canonical one.
+    """
+    cells = [(point['x'], point['y'], point['color']['hex_value']) for point in points]
+    variants = []
+    for transform, swaps in SYMMETRIES:
+        width, height = (rows, columns) if swaps else (columns, rows)
+        moved = [(*transform(x, y, columns, rows), color) for x, y, color in cells]
+        variants.append([width, height, _renumbered(width, moved)])
+    return min(variants)
+
+
+def canonical_hash(columns: int, rows: int, points) -> str:
+    canonical = json.dumps(canonical_form(columns, rows, points), separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def stored_content(points):
+    """
+    Compact encoding of board points, taken as is from an ``EncodedValue`` loaded from the database.
+
+    Hashing it keeps an untouched board from decoding its points.
+    """
+    if isinstance(points, EncodedValue):
+        return points.payload
+    return encoding.encode_points(points) or points
+
+
+def layout_hash(columns: int, rows: int, points) -> str:
+    """Hash of the exact layout, unlike ``canonical_hash`` changed by any move or recoloring."""
+    layout = json.dumps([columns, rows, stored_content(points)], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(layout.encode()).hexdigest()
@@ -0,0 +1,56 @@
+import logging
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+from . import solver
+from .models import GameBoard
+from .verification import get_executor, run_solver
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_difficulty(board_id) -> float | None:
+    """
+    Estimate the difficulty of a board, or copy it from a board with the same canonical form, and store it.
+
+    The estimate is only stored if the layout version did not change while the search ran;
+    the edit queued an estimate of its own. Returns the estimated difficulty.
+    """
+    board = GameBoard.objects.only('columns', 'rows', 'points', 'layout_version', 'canonical_hash') \
+        .filter(pk=board_id).first()
+    if board is None:
+        return None
+
+    # A board with the same canonical form was estimated already
+    score = GameBoard.objects.filter(canonical_hash=board.canonical_hash, difficulty__isnull=False) \
+        .exclude(pk=board_id).values_list('difficulty', flat=True).first()
+    if score is None:
+        score = run_solver(
+            solver.estimate_difficulty, board.columns, board.rows, board.points, settings.BOARDS_DIFFICULTY_DEADLINE
+        )
+    GameBoard.objects.filter(pk=board_id, layout_version=board.layout_version).update(difficulty=score)
+    return score
+
+
+def _run(board_id):
+    close_old_connections()
+    try:
+        refresh_difficulty(board_id)
+    except Exception:
+        logger.exception(f"Difficulty estimate of board {board_id} failed")
+    finally:
+        connection.close()
+
+
+def submit(board_id):
+    """
+    Queue a difficulty estimate of a board once the current transaction commits.
+
+    Estimates share the worker pool of solution verification and search in the solver
+    processes; with ``BOARDS_VERIFICATION_WORKERS`` set to 0 they run in the calling thread.
+    """
+    if settings.BOARDS_VERIFICATION_WORKERS > 0:
+        transaction.on_commit(lambda: get_executor().submit(_run, board_id))
+    else:
+        transaction.on_commit(lambda: refresh_difficulty(board_id))
@@ -0,0 +1,181 @@
+import base64
+import re
+import sys
+from array import array
+
+POINTS_FORMAT = 'points/v1'
+PATHS_FORMAT = 'paths/v1'
+
+MAX_COORDINATE = 0xFFFF
+
+# Unit steps of a path keyed by the letter used in the run-length move string
+MOVES = {'R': (1, 0), 'L': (-1, 0), 'D': (0, 1), 'U': (0, -1)}
+STEPS = {step: letter for letter, step in MOVES.items()}
+RUN_PATTERN = re.compile(r'(\d+)([RLDU])')
+
+# Set on the color index of a logged play move that takes back the last cell of a path
+UNDO_FLAG = 0x8000
+# Characters of one encode_move token in a move log
+MOVE_TOKEN_LENGTH = 8
+
+
+def _pack(typecode: str, values) -> str:
+    packed = array(typecode, values)
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode('ascii')
+
+
+def _unpack(typecode: str, data: str) -> array:
+    unpacked = array(typecode)
+    unpacked.frombytes(base64.b64decode(data))
+    if sys.byteorder != 'little':
+        unpacked.byteswap()
+    return unpacked
+
+
+def _is_coordinate(value) -> bool:
+    return type(value) is int and 0 <= value <= MAX_COORDINATE
+
+
+def _is_cell(value) -> bool:
+    return isinstance(value, dict) and len(value) == 2 \
+        and _is_coordinate(value.get('x')) and _is_coordinate(value.get('y'))
+
+
+def _is_color(value) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and isinstance(value.get('hex_value'), str)
+
+
+def is_encoded(value, format: str) -> bool:
+    return isinstance(value, dict) and value.get('format') == format
+
+
+def encode_points(points):
+    """
+    Pack board points into a color palette plus coordinate and palette index arrays.
+
+    Returns ``None`` when the points cannot be represented losslessly.
+    """
+    if not isinstance(points, list):
+        return None
+
+    palette = {}
+    xs, ys, indexes = [], [], []
+    for point in points:
+        if not isinstance(point, dict) or len(point) != 3 or not _is_color(point.get('color')) \
+                or not _is_coordinate(point.get('x')) or not _is_coordinate(point.get('y')):
+            return None
+        xs.append(point['x'])
+        ys.append(point['y'])
+        indexes.append(palette.setdefault(point['color']['hex_value'], len(palette)))
+
+    return {
+        'format': POINTS_FORMAT,
+        'palette': list(palette),
+        'x': _pack('H', xs),
+        'y': _pack('H', ys),
+        'colors': _pack('I', indexes),
+    }
+
+
+def decode_points(payload) -> list:
+    palette = payload['palette']
+    xs = _unpack('H', payload['x'])
+    ys = _unpack('H', payload['y'])
+    indexes = _unpack('I', payload['colors'])
+    return [
+        {'color': {'hex_value': palette[index]}, 'x': x, 'y': y}
+        for x, y, index in zip(xs, ys, indexes)
+    ]
+
+
+def encode_moves(cells) -> str | None:
+    """Encode consecutive unit steps as a run-length string such as ``3R2D``."""
+    runs = []
+    letter, count = None, 0
+    for previous, current in zip(cells, cells[1:]):
+        step = STEPS.get((current['x'] - previous['x'], current['y'] - previous['y']))
+        if step is None:
+            return None
+        if step == letter:
+            count += 1
+        else:
+            if letter:
+                runs.append(f"{count}{letter}")
+            letter, count = step, 1
+    if letter:
+        runs.append(f"{count}{letter}")
+    return ''.join(runs)
+
+
+def decode_moves(origin, moves: str) -> list:
+    x, y = origin
+    cells = [{'x': x, 'y': y}]
+    for count, letter in RUN_PATTERN.findall(moves):
+        dx, dy = MOVES[letter]
+        for _ in range(int(count)):
+            x += dx
+            y += dy
+            cells.append({'x': x, 'y': y})
+    return cells
+
+
+def encode_paths(paths):
+    """
+    Store every path as its endpoints, color, first cell and a run-length move string.
+
+    Returns ``None`` when the paths cannot be represented losslessly, e.g. when a path
+    contains a step that is not between adjacent cells.
+    """
+    if not isinstance(paths, list):
+        return None
+
+    encoded = []
+    for path in paths:
+        if not isinstance(path, dict) or set(path) != {'start', 'end', 'color', 'path'} \
+                or not _is_cell(path['start']) or not _is_cell(path['end']) or not _is_color(path['color']) \
+                or not isinstance(path['path'], list) or not all(_is_cell(cell) for cell in path['path']):
+            return None
+
+        cells = path['path']
+        moves = encode_moves(cells)
+        if moves is None:
+            return None
+        encoded.append({
+            'color': path['color']['hex_value'],
+            'start': [path['start']['x'], path['start']['y']],
+            'end': [path['end']['x'], path['end']['y']],
+            'origin': [cells[0]['x'], cells[0]['y']] if cells else None,
+            'moves': moves,
+        })
+
+    return {'format': PATHS_FORMAT, 'paths': encoded}
+
+
+def decode_paths(payload) -> list:
+    return [
+        {
+            'start': {'x': path['start'][0], 'y': path['start'][1]},
+            'end': {'x': path['end'][0], 'y': path['end'][1]},
+            'color': {'hex_value': path['color']},
+            'path': decode_moves(path['origin'], path['moves']) if path['origin'] is not None else [],
+        }
+        for path in payload['paths']
+    ]
+
+
+def encode_move(color: int, x: int, y: int) -> str:
+    """
+    Pack one play move as a color index and cell into a fixed width token.
+
+    A token is six bytes, so its base64 form has no padding and a move log is extended
+    by plain concatenation.
+    """
+    return _pack('H', [color, x, y])
+
+
+def decode_move_log(log: str):
+    """Yield the ``(color, x, y)`` moves of a log built from ``encode_move`` tokens."""
+    values = _unpack('H', log)
+    return zip(values[0::3], values[1::3], values[2::3])
@@ -0,0 +1,97 @@
+from django.conf import settings
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+
+from . import encoding
+
+
+class EncodedValue:
+    """Compact payload loaded from the database that has not been decoded yet."""
+
+    def __init__(self, payload, decode):
+        self.payload = payload
+        self._decode = decode
+
+    def decode(self):
+        return self._decode(self.payload)
+
+
+class DecodingAttribute(DeferredAttribute):
+    """Decodes an ``EncodedValue`` on first access and caches the result on the instance."""
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if isinstance(value, EncodedValue):
+            value = value.decode()
+            instance.__dict__[self.field.attname] = value
+        return value
+
+    def __set__(self, instance, value):
+        # Defining __set__ makes this a data descriptor, so __get__ runs even when the
+        # value is already in the instance dict
+        instance.__dict__[self.field.attname] = value
+
+
+class CompactJSONField(models.JSONField):
+    """
+    JSON field storing its value in a compact encoded form.
+
+    Rows written before the encoding was introduced are still read as plain JSON.
+    Values the encoder cannot represent, or all values when ``BOARDS_COMPACT_STORAGE``
+    is off, are stored as plain JSON too.
+    """
+    descriptor_class = DecodingAttribute
+    format = None
+
+    def encode(self, value):
+        raise NotImplementedError
+
+    def decode(self, payload):
+        raise NotImplementedError
+
+    def from_db_value(self, value, expression, connection):
+        value = super().from_db_value(value, expression, connection)
+        if encoding.is_encoded(value, self.format):
+            return EncodedValue(value, self.decode)
+        return value
+
+    def raw_value(self, model_instance):
+        """Value of the field on the instance, still encoded if it was never accessed."""
+        if self.attname in model_instance.__dict__:
+            return model_instance.__dict__[self.attname]
+        return getattr(model_instance, self.attname)
+
+    def pre_save(self, model_instance, add):
+        # Read the raw value so that saving does not decode a payload nobody touched
+        return self.raw_value(model_instance)
+
+    def get_prep_value(self, value):
+        if isinstance(value, EncodedValue):
+            value = value.payload
+        elif settings.BOARDS_COMPACT_STORAGE:
+            encoded = self.encode(value)
+            if encoded is not None:
+                value = encoded
+        return super().get_prep_value(value)
+
+
+class CompactPointsField(CompactJSONField):
+    format = encoding.POINTS_FORMAT
+
+    def encode(self, value):
+        return encoding.encode_points(value)
+
+    def decode(self, payload):
+        return encoding.decode_points(payload)
+
+
+class CompactPathsField(CompactJSONField):
+    format = encoding.PATHS_FORMAT
+
+    def encode(self, value):
+        return encoding.encode_paths(value)
+
+    def decode(self, payload):
+        return encoding.decode_paths(payload)
@@ -1,5 +1,6 @@
 ﻿from django import forms
 from .models import GameBoard
+from .validation import validate_board_points
 
 MIN_BOARD_WIDTH = 1
 MAX_BOARD_WIDTH = 2000
@@ -35,9 +36,8 @@ class GameBoardForm(forms.ModelForm):
         """Validate that points data is properly formatted and each color has exactly 2 points"""
         points = self.cleaned_data.get('points')
 
-        game_board = GameBoard(points=points, columns=self.cleaned_data.get('columns', 1), rows=self.cleaned_data.get('rows', 1))
         try:
-            game_board.validate_points()
+            validate_board_points(points, self.cleaned_data.get('columns', 1), self.cleaned_data.get('rows', 1))
         except ValueError as e:
             raise forms.ValidationError(str(e))
 
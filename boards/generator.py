@@ -0,0 +1,100 @@
+import random
+
+EASY = 'easy'
+MEDIUM = 'medium'
+HARD = 'hard'
+
+# Longest path as a fraction of the cells available per color, chance to turn on each step
+DIFFICULTY_SETTINGS = {
+    EASY: (0.3, 0.2),
+    MEDIUM: (0.6, 0.4),
+    HARD: (1.0, 0.6),
+}
+
+MAX_ATTEMPTS_PER_COLOR = 20
+
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+def _random_colors(rng: random.Random, count: int) -> list[str]:
+    # A dict keeps the drawing order, a set would depend on the process hash seed
+    colors = {}
+    while len(colors) < count:
+        colors[f"#{rng.getrandbits(24):06x}"] = None
+    return list(colors)
+
+
+def _walk(rng: random.Random, taken: set, columns: int, rows: int, max_length: int, turn_chance: float):
+    """Self-avoiding random walk over free cells starting from a random free cell."""
+    x, y = rng.randrange(columns), rng.randrange(rows)
+    if (x, y) in taken:
+        return None
+
+    walk = [(x, y)]
+    visited = {(x, y)}
+    direction = rng.choice(DIRECTIONS)
+    while len(walk) < max_length:
+        candidates = []
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < columns and 0 <= ny < rows and (nx, ny) not in taken and (nx, ny) not in visited:
+                candidates.append((dx, dy))
+        if not candidates:
+            break
+        if direction not in candidates or rng.random() < turn_chance:
+            direction = rng.choice(candidates)
+        x, y = x + direction[0], y + direction[1]
+        walk.append((x, y))
+        visited.add((x, y))
+
+    return walk if len(walk) >= 2 else None
+
+
+def generate_board(columns: int, rows: int, colors: int, difficulty: str = MEDIUM, seed: int | None = None):
+    """
+    Lay out ``colors`` non-overlapping random walks and use their ends as board points.
+
+    The walks form a witness solution, so every generated board is solvable.
+    Returns ``(points, paths)`` in the board and solution formats, or ``None`` when the
+    walks did not fit on the board.
+    """
+    rng = random.Random(seed)
+    length_ratio, turn_chance = DIFFICULTY_SETTINGS[difficulty]
+    max_length = max(2, int(columns * rows / max(colors, 1) * length_ratio))
+
+    taken = set()
+    points = []
+    paths = []
+    for hex_value in _random_colors(rng, colors):
+        for _ in range(MAX_ATTEMPTS_PER_COLOR):
+            walk = _walk(rng, taken, columns, rows, rng.randint(2, max_length), turn_chance)
+            if walk:
+                break
+        else:
+            return None
+
+        taken.update(walk)
+        color = {'hex_value': hex_value}
+        start = {'x': walk[0][0], 'y': walk[0][1]}
+        end = {'x': walk[-1][0], 'y': walk[-1][1]}
+        points.append({'color': dict(color), **start})
+        points.append({'color': dict(color), **end})
+        paths.append({
+            'start': start,
+            'end': end,
+            'color': color,
+            'path': [{'x': x, 'y': y} for x, y in walk],
+        })
+
+    return points, paths
+
+
+def generate_points(columns: int, rows: int, colors: int, difficulty: str = MEDIUM, seed: int | None = None,
+                    attempts: int = 10):
+    """Generate board points only, retrying with derived seeds until the walks fit."""
+    rng = random.Random(seed)
+    for _ in range(attempts):
+        board = generate_board(columns, rows, colors, difficulty, rng.getrandbits(64))
+        if board is not None:
+            return board[0]
+    return None
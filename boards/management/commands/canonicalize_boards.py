@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from boards import canonical
+from boards.models import GameBoard
+from common.batches import update_in_batches
+
+
+def _fill_hash(board) -> bool:
+    board.canonical_hash = canonical.canonical_hash(board.columns, board.rows, board.points)
+    return True
+
+
+class Command(BaseCommand):
+    help = "Fill the canonical hashes of game boards that have none and report duplicated boards."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Rows per bulk update.")
+
+    def handle(self, *args, **options):
+        boards = GameBoard.objects.filter(canonical_hash='').only('pk', 'columns', 'rows', 'points')
+        filled = update_in_batches(boards, ['canonical_hash'], options['batch_size'], _fill_hash)
+
+        duplicated = GameBoard.objects.order_by().values('canonical_hash') \
+            .annotate(copies=Count('pk')).filter(copies__gt=1)
+        groups = copies = 0
+        for group in duplicated.iterator():
+            groups += 1
+            copies += group['copies'] - 1
+        self.stdout.write(self.style.SUCCESS(
+            f"Filled {filled} canonical hashes, found {copies} duplicates of {groups} boards."
+        ))
@@ -0,0 +1,61 @@
+﻿import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import F
+
+from boards import solver
+from boards.models import GameBoard
+from common.batches import batches
+
+
+class Command(BaseCommand):
+    help = "Check whether game boards have exactly one solution and store the result."
+
+    def add_arguments(self, parser):
+        parser.add_argument('board_ids', nargs='*', help="IDs of the boards to check.")
+        parser.add_argument('--all', action='store_true', help="Check every board.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Number of worker processes.")
+        parser.add_argument('--deadline', type=float, default=settings.BOARDS_UNIQUENESS_DEADLINE,
+                            help="Seconds allowed per board.")
+        parser.add_argument('--batch-size', type=int, default=100, help="Boards queued at a time.")
+
+    def handle(self, *args, **options):
+        if not options['board_ids'] and not options['all']:
+            raise CommandError("Provide board IDs or use --all.")
+
+        game_boards = GameBoard.objects.only('id', 'columns', 'rows', 'points', 'layout_version')
+        if not options['all']:
+            game_boards = game_boards.filter(pk__in=options['board_ids'])
+
+        checked = failed = 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+            # Boards are queued a batch at a time, so neither the boards nor their futures pile up in memory
+            for batch in batches(game_boards, options['batch_size']):
+                futures = {
+                    executor.submit(
+                        solver.check_uniqueness, board.columns, board.rows, board.points, options['deadline']
+                    ): board
+                    for board in batch
+                }
+                for future in as_completed(futures):
+                    board = futures[future]
+                    try:
+                        uniqueness = future.result()
+                    except Exception as e:
+                        self.stderr.write(f"{board.pk}: failed ({e})")
+                        failed += 1
+                        continue
+                    # The result of a board whose layout was edited meanwhile no longer applies to it
+                    if not GameBoard.objects.filter(pk=board.pk, layout_version=board.layout_version) \
+                            .update(uniqueness=uniqueness, version=F('version') + 1):
+                        self.stdout.write(f"{board.pk}: changed while checking, skipped")
+                        continue
+                    self.stdout.write(f"{board.pk}: {uniqueness}")
+                    checked += 1
+
+        message = f"Checked {checked} boards."
+        if failed:
+            message += f" {failed} failed."
+        self.stdout.write(self.style.SUCCESS(message))
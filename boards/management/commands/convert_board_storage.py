@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from boards.fields import EncodedValue
+from boards.models import GameBoard, Solution
+from common.batches import update_in_batches
+
+
+class Command(BaseCommand):
+    help = ("Rewrite stored board points and solution paths in the storage format "
+            "selected by BOARDS_COMPACT_STORAGE.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Rows per bulk update.")
+
+    def handle(self, *args, **options):
+        for model, field in ((GameBoard, 'points'), (Solution, 'paths')):
+            converted = self.convert(model, field, options['batch_size'])
+            self.stdout.write(f"{model._meta.verbose_name_plural}: converted {converted} rows.")
+        self.stdout.write(self.style.SUCCESS("Done."))
+
+    def convert(self, model, field, batch_size):
+        def change(obj):
+            is_compact = isinstance(obj.__dict__[field], EncodedValue)
+            if is_compact == settings.BOARDS_COMPACT_STORAGE:
+                return False
+            # Decode the value so that saving writes it in the selected format
+            getattr(obj, field)
+            return True
+
+        return update_in_batches(model.objects.only('pk', field), [field], batch_size, change)
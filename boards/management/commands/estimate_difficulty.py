@@ -0,0 +1,63 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from boards import solver
+from boards.models import GameBoard
+from common.batches import batches
+
+
+class Command(BaseCommand):
+    help = "Estimate the difficulty of game boards with the instrumented solver and store it."
+
+    def add_arguments(self, parser):
+        parser.add_argument('board_ids', nargs='*', help="IDs of the boards to estimate.")
+        parser.add_argument('--all', action='store_true', help="Estimate every board.")
+        parser.add_argument('--missing', action='store_true', help="Estimate every board without a difficulty.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Number of worker processes.")
+        parser.add_argument('--deadline', type=float, default=settings.BOARDS_DIFFICULTY_DEADLINE,
+                            help="Seconds allowed per board.")
+        parser.add_argument('--batch-size', type=int, default=100, help="Boards queued at a time.")
+
+    def handle(self, *args, **options):
+        if not options['board_ids'] and not options['all'] and not options['missing']:
+            raise CommandError("Provide board IDs or use --all or --missing.")
+
+        game_boards = GameBoard.objects.only('id', 'columns', 'rows', 'points', 'layout_version')
+        if options['missing']:
+            game_boards = game_boards.filter(difficulty__isnull=True)
+        elif not options['all']:
+            game_boards = game_boards.filter(pk__in=options['board_ids'])
+
+        estimated = failed = 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+            # Boards are queued a batch at a time, so neither the boards nor their futures pile up in memory
+            for batch in batches(game_boards, options['batch_size']):
+                futures = {
+                    executor.submit(
+                        solver.estimate_difficulty, board.columns, board.rows, board.points, options['deadline']
+                    ): board
+                    for board in batch
+                }
+                for future in as_completed(futures):
+                    board = futures[future]
+                    try:
+                        score = future.result()
+                    except Exception as e:
+                        self.stderr.write(f"{board.pk}: failed ({e})")
+                        failed += 1
+                        continue
+                    # A board edited meanwhile has a new layout version and gets an estimate of its own
+                    if not GameBoard.objects.filter(pk=board.pk, layout_version=board.layout_version) \
+                            .update(difficulty=score):
+                        self.stdout.write(f"{board.pk}: changed while estimating, skipped")
+                        continue
+                    self.stdout.write(f"{board.pk}: {score if score is not None else 'unknown'}")
+                    estimated += 1
+
+        message = f"Estimated {estimated} boards."
+        if failed:
+            message += f" {failed} failed."
+        self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from boards import transfer
+from boards.models import GameBoard, Solution
+
+
+class Command(BaseCommand):
+    help = "Write game boards and their solutions as NDJSON, one record per line."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default='-', help="File to write, standard output if omitted.")
+        parser.add_argument('--user', help="Only export boards and solutions of this user.")
+        parser.add_argument('--no-solutions', action='store_true', help="Only export boards.")
+        parser.add_argument('--compact', action='store_true',
+                            help="Write points and paths in the compact storage encoding.")
+        parser.add_argument('--chunk-size', type=int, default=500, help="Rows read per query.")
+
+    def handle(self, *args, **options):
+        game_boards = GameBoard.objects.all()
+        solutions = Solution.objects.all()
+        if options['user']:
+            game_boards = game_boards.filter(user__username=options['user'])
+            solutions = solutions.filter(user__username=options['user'])
+        solutions = None if options['no_solutions'] else solutions.filter(game_board__in=game_boards)
+
+        records = transfer.export_records(game_boards, solutions, options['compact'], options['chunk_size'])
+        if options['output'] == '-':
+            self.write(lambda line: self.stdout.write(line, ending=''), records)
+            return
+
+        try:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                count = self.write(output.write, records)
+        except OSError as e:
+            raise CommandError(f"Cannot write {options['output']}: {e}")
+        self.stdout.write(self.style.SUCCESS(f"Exported {count} records."))
+
+    def write(self, write, records) -> int:
+        count = 0
+        for line in transfer.to_ndjson(records):
+            write(line)
+            count += 1
+        return count
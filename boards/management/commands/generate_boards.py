@@ -0,0 +1,113 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from boards import canonical, thumbnails
+from boards.generator import DIFFICULTY_SETTINGS, MEDIUM, generate_points
+from boards.models import GameBoard
+from boards.serializers import MAX_BOARD_WIDTH, MAX_BOARD_HEIGHT
+from boards.solver import SOLVABLE
+
+
+def _parse_size(value):
+    try:
+        columns, rows = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise CommandError(f"Invalid size '{value}', expected COLUMNSxROWS.")
+    if not (1 <= columns <= MAX_BOARD_WIDTH and 1 <= rows <= MAX_BOARD_HEIGHT):
+        raise CommandError(f"Size '{value}' exceeds {MAX_BOARD_WIDTH}x{MAX_BOARD_HEIGHT}.")
+    return columns, rows
+
+
+def _parse_range(value):
+    try:
+        low, _, high = value.partition('-')
+        low = int(low)
+        high = int(high) if high else low
+    except ValueError:
+        raise CommandError(f"Invalid color count '{value}', expected N or MIN-MAX.")
+    if not 1 <= low <= high:
+        raise CommandError(f"Invalid color count '{value}'.")
+    return low, high
+
+
+class Command(BaseCommand):
+    help = "Generate solvable game boards in bulk."
+
+    def add_arguments(self, parser):
+        parser.add_argument('count', type=int, help="Number of boards to generate.")
+        parser.add_argument('--user', required=True, help="Username of the boards' owner.")
+        parser.add_argument('--size', action='append', dest='sizes', default=None,
+                            help="Board size as COLUMNSxROWS, can be repeated. Defaults to 10x10.")
+        parser.add_argument('--colors', default='3-6', help="Number of colors, N or MIN-MAX.")
+        parser.add_argument('--difficulty', choices=list(DIFFICULTY_SETTINGS), default=MEDIUM)
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows per bulk insert.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Number of worker processes.")
+        parser.add_argument('--seed', type=int, default=None, help="Seed for reproducible output.")
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['user']}' does not exist.")
+
+        sizes = [_parse_size(size) for size in options['sizes'] or ['10x10']]
+        min_colors, max_colors = _parse_range(options['colors'])
+        difficulty = options['difficulty']
+        batch_size = options['batch_size']
+
+        rng = random.Random(options['seed'])
+        specs = []
+        for _ in range(options['count']):
+            columns, rows = rng.choice(sizes)
+            colors = min(rng.randint(min_colors, max_colors), columns * rows // 2)
+            specs.append((columns, rows, colors, rng.getrandbits(64)))
+
+        workers = options['workers'] or 1
+        started = time.monotonic()
+        created = skipped = 0
+        batch = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                generate_points,
+                [spec[0] for spec in specs],
+                [spec[1] for spec in specs],
+                [spec[2] for spec in specs],
+                [difficulty] * len(specs),
+                [spec[3] for spec in specs],
+                chunksize=max(1, min(256, len(specs) // (4 * workers))),
+            )
+            for (columns, rows, colors, _), points in zip(specs, results):
+                if points is None:
+                    skipped += 1
+                    continue
+                batch.append(GameBoard(
+                    name=f"{columns}x{rows} {difficulty} #{created + len(batch) + 1}",
+                    user=user,
+                    columns=columns,
+                    rows=rows,
+                    points=points,
+                    solvability=SOLVABLE,
+                    # bulk_create skips GameBoard.save, so the preview and hashes are made here
+                    thumbnail=thumbnails.save_thumbnail(columns, rows, points),
+                    canonical_hash=canonical.canonical_hash(columns, rows, points),
+                    layout_hash=canonical.layout_hash(columns, rows, points),
+                ))
+                if len(batch) >= batch_size:
+                    GameBoard.objects.bulk_create(batch)
+                    created += len(batch)
+                    batch = []
+            if batch:
+                GameBoard.objects.bulk_create(batch)
+                created += len(batch)
+
+        elapsed = time.monotonic() - started
+        rate = created / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {created} boards in {elapsed:.2f}s ({rate:.1f} boards/s, {rate * 3600:.0f} boards/h)"
+            + (f", skipped {skipped} that did not fit." if skipped else ".")
+        ))
@@ -0,0 +1,61 @@
+import json
+import sys
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from boards import transfer
+
+
+class Command(BaseCommand):
+    help = "Read game boards and solutions from NDJSON written by export_boards."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="File to read, '-' for standard input.")
+        parser.add_argument('--user', help="Owner of records whose user does not exist here.")
+        parser.add_argument('--batch-size', type=int, default=500, help="Rows per bulk insert.")
+
+    def handle(self, *args, **options):
+        fallback = None
+        if options['user']:
+            fallback = User.objects.filter(username=options['user']).values_list('pk', flat=True).first()
+            if fallback is None:
+                raise CommandError(f"User '{options['user']}' does not exist.")
+
+        user_ids = {}
+
+        def users(username):
+            if username not in user_ids:
+                user_ids[username] = User.objects.filter(username=username).values_list('pk', flat=True).first()
+            user_id = user_ids[username] if user_ids[username] is not None else fallback
+            if user_id is None:
+                raise ValueError(f"User '{username}' does not exist, use --user to choose an owner.")
+            return user_id
+
+        importer = transfer.Importer(users, options['batch_size'])
+        if options['path'] == '-':
+            self.load(importer, sys.stdin)
+        else:
+            try:
+                with open(options['path'], encoding='utf-8') as lines:
+                    self.load(importer, lines)
+            except OSError as e:
+                raise CommandError(f"Cannot read {options['path']}: {e}")
+        importer.flush()
+
+        created, skipped = importer.created, importer.skipped
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {created[transfer.BOARD]} boards and {created[transfer.SOLUTION]} solutions, "
+            f"skipped {skipped[transfer.BOARD]} boards and {skipped[transfer.SOLUTION]} solutions already stored."
+        ))
+
+    def load(self, importer, lines):
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                importer.add(json.loads(line))
+            except ValueError as e:
+                # Records before the broken line are kept; importing again skips them
+                importer.flush()
+                raise CommandError(f"Line {number}: {e}")
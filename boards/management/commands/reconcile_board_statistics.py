@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from boards import statistics
+from boards.models import GameBoard, Solution
+from common.batches import update_in_batches
+
+
+def _fill_length(solution) -> bool:
+    solution.length = solution.compute_length()
+    return True
+
+
+class Command(BaseCommand):
+    help = "Recompute solution lengths and the solution statistics stored on game boards."
+
+    def add_arguments(self, parser):
+        parser.add_argument('board_ids', nargs='*', help="IDs of the boards to reconcile, all boards if omitted.")
+        parser.add_argument('--batch-size', type=int, default=500, help="Rows per bulk update.")
+
+    def handle(self, *args, **options):
+        game_boards = GameBoard.objects.all()
+        solutions = Solution.objects.filter(length__isnull=True)
+        if options['board_ids']:
+            game_boards = game_boards.filter(pk__in=options['board_ids'])
+            solutions = solutions.filter(game_board__in=options['board_ids'])
+
+        filled = self.fill_lengths(solutions, options['batch_size'])
+        reconciled = statistics.reconcile(game_boards)
+        self.stdout.write(self.style.SUCCESS(
+            f"Filled {filled} solution lengths, reconciled {reconciled} boards."
+        ))
+
+    def fill_lengths(self, solutions, batch_size):
+        return update_in_batches(solutions.only('pk', 'paths'), ['length'], batch_size, _fill_length)
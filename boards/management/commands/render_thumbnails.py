@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from boards.models import GameBoard
+from common.batches import update_in_batches
+
+
+class Command(BaseCommand):
+    help = "Render the list page previews of game boards that have none or an outdated one."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Rows per bulk update.")
+
+    def handle(self, *args, **options):
+        boards = GameBoard.objects.only('pk', 'columns', 'rows', 'points', 'thumbnail')
+        rendered = update_in_batches(
+            boards, ['thumbnail'], options['batch_size'], lambda board: board.refresh_thumbnail()
+        )
+        self.stdout.write(self.style.SUCCESS(f"Rendered {rendered} thumbnails."))
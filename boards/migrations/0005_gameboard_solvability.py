@@ -0,0 +1,18 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0004_rename_paths_solution_points'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboard',
+            name='solvability',
+            field=models.CharField(choices=[('solvable', 'Solvable'), ('unsolvable', 'Unsolvable'), ('unknown', 'Unknown')], default='unknown', max_length=16),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0005_gameboard_solvability'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboard',
+            name='uniqueness',
+            field=models.CharField(choices=[('unique', 'Unique'), ('multiple', 'Multiple solutions'), ('unsolvable', 'Unsolvable'), ('unknown', 'Unknown')], default='unknown', max_length=16),
+        ),
+    ]
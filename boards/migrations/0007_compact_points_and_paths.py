@@ -0,0 +1,24 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:21
+
+import boards.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0006_gameboard_uniqueness'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='gameboard',
+            name='points',
+            field=boards.fields.CompactPointsField(blank=True, default=list),
+        ),
+        migrations.AlterField(
+            model_name='solution',
+            name='paths',
+            field=boards.fields.CompactPathsField(blank=True, default=list),
+        ),
+    ]
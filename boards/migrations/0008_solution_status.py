@@ -0,0 +1,23 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0007_compact_points_and_paths'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solution',
+            name='rejection_reason',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('verified', 'Verified'), ('rejected', 'Rejected')], default='verified', max_length=16),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0008_solution_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboard',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
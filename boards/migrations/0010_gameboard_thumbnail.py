@@ -0,0 +1,18 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0009_gameboard_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboard',
+            name='thumbnail',
+            field=models.ImageField(blank=True, editable=False, upload_to='boards/thumbnails'),
+        ),
+    ]
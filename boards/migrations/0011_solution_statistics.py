@@ -0,0 +1,33 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0010_gameboard_thumbnail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboard',
+            name='best_solution_length',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='gameboard',
+            name='solution_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='gameboard',
+            name='solver_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='length',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
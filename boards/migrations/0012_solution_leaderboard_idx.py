@@ -0,0 +1,17 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0011_solution_statistics'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='solution',
+            index=models.Index(fields=['game_board', 'status', 'length', 'id'], name='solution_leaderboard_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0012_solution_leaderboard_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solution',
+            name='revision',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:59
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('boards', '0013_solution_revision'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlaySession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('board_version', models.PositiveIntegerField()),
+                ('moves', models.TextField(blank=True, default='')),
+                ('move_count', models.PositiveIntegerField(default=0)),
+                ('game_board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='play_sessions', to='boards.gameboard')),
+                ('solution', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='play_session', to='boards.solution')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='playsession',
+            constraint=models.UniqueConstraint(fields=('game_board', 'user'), name='play_session_per_user'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.25 on 2026-10-18 17:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0014_playsession'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboard',
+            name='difficulty',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='gameboard',
+            index=models.Index(fields=['difficulty', 'id'], name='gameboard_difficulty_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.25 on 2026-10-18 17:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0015_gameboard_difficulty'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboard',
+            name='canonical_hash',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=64),
+        ),
+    ]
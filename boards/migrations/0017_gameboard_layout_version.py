@@ -0,0 +1,33 @@
+# Generated by Django 4.2.25 on 2026-10-18 18:05
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def carry_over_sessions(apps, schema_editor):
+    # Sessions played on the current version of their board continue on layout version 1,
+    # the others were already out of date and start over when resumed
+    PlaySession = apps.get_model('boards', 'PlaySession')
+    PlaySession.objects.exclude(layout_version=F('game_board__version')).update(layout_version=0)
+    PlaySession.objects.exclude(layout_version=0).update(layout_version=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0016_gameboard_canonical_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboard',
+            name='layout_version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.RenameField(
+            model_name='playsession',
+            old_name='board_version',
+            new_name='layout_version',
+        ),
+        migrations.RunPython(carry_over_sessions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.25 on 2026-10-18 18:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0017_gameboard_layout_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='gameboard',
+            name='uniqueness',
+            field=models.CharField(choices=[('unique', 'Unique'), ('multiple', 'Multiple solutions'), ('unsolvable', 'Unsolvable'), ('unknown', 'Unknown'), ('checking', 'Checking')], default='unknown', max_length=16),
+        ),
+    ]
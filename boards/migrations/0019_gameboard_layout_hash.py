@@ -0,0 +1,36 @@
+# Generated by Django 4.2.25 on 2026-10-18 18:47
+
+from django.db import migrations, models
+
+from boards import canonical
+
+
+def fill_layout_hashes(apps, schema_editor):
+    # Stored boards get their hash up front, so the first edit of each one is told apart from a rename
+    GameBoard = apps.get_model('boards', 'GameBoard')
+    points = GameBoard._meta.get_field('points')
+    batch = []
+    for board in GameBoard.objects.only('pk', 'columns', 'rows', 'points').iterator(chunk_size=500):
+        board.layout_hash = canonical.layout_hash(board.columns, board.rows, points.raw_value(board))
+        batch.append(board)
+        if len(batch) >= 500:
+            GameBoard.objects.bulk_update(batch, ['layout_hash'])
+            batch = []
+    if batch:
+        GameBoard.objects.bulk_update(batch, ['layout_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0018_gameboard_uniqueness_checking'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboard',
+            name='layout_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.RunPython(fill_layout_hashes, migrations.RunPython.noop),
+    ]
@@ -2,6 +2,11 @@ import uuid
 from django.conf import settings
 from django.db import models
 
+from . import canonical, solver, thumbnails
+from .fields import CompactPathsField, CompactPointsField, EncodedValue
+from .solver import SOLVABILITY_CHOICES, UNIQUENESS_CHOICES, UNKNOWN
+from .validation import NUMBER_OF_POINTS_PER_COLOR, VERIFICATION_CHOICES, VERIFIED, validate_board_points
+
 class Point:
     x: int
     y: int
@@ -60,38 +65,117 @@ class ColorPoints(Point):
         if not isinstance(self.color, Color):
             raise ValueError("Color must be an instance of the Color class.")
 
-NUMBER_OF_POINTS_PER_COLOR = 2
-
 class GameBoard(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=255)
     user = models.ForeignKey(
         'auth.User', on_delete=models.CASCADE, related_name='game_boards'
     )
-    points = models.JSONField(default=list, blank=True)
+    points = CompactPointsField(default=list, blank=True)
     columns = models.PositiveIntegerField(default=1)
     rows = models.PositiveIntegerField(default=1)
+    solvability = models.CharField(max_length=16, choices=SOLVABILITY_CHOICES, default=UNKNOWN)
+    uniqueness = models.CharField(max_length=16, choices=UNIQUENESS_CHOICES, default=UNKNOWN)
+    version = models.PositiveIntegerField(default=1)
+    # Bumped only when points, columns or rows change, unlike version which also follows solver results
+    layout_version = models.PositiveIntegerField(default=1, editable=False)
+    # Hash of canonical.layout_hash, which tells an edit of the layout from other saves
+    layout_hash = models.CharField(max_length=64, blank=True, default='', editable=False)
+    solution_count = models.PositiveIntegerField(default=0)
+    solver_count = models.PositiveIntegerField(default=0)
+    best_solution_length = models.PositiveIntegerField(null=True, blank=True)
+    # Estimated by solver.estimate_difficulty in the background, None until then or when unknown
+    difficulty = models.FloatField(null=True, blank=True, editable=False)
+    thumbnail = models.ImageField(upload_to=thumbnails.THUMBNAIL_DIRECTORY, blank=True, editable=False)
+    # Hash of canonical.canonical_form, equal for rotated, mirrored and recolored copies
+    canonical_hash = models.CharField(max_length=64, blank=True, default='', db_index=True, editable=False)
+
+    # Whether the last save stored a new layout, for the post_save signal
+    layout_changed = False
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        layout_changed = False
+        self.layout_changed = False
+        if update_fields is None or {'points', 'columns', 'rows'} & set(update_fields):
+            # The layout hash is taken from the stored encoding, so the points are only decoded for a new layout
+            points = self._meta.get_field('points').raw_value(self)
+            layout_hash = canonical.layout_hash(self.columns, self.rows, points)
+            layout_changed = layout_hash != self.layout_hash and not self._state.adding
+            self.layout_changed = layout_changed or self._state.adding
+            self.layout_hash = layout_hash
+            self.refresh_thumbnail()
+            if layout_changed or not self.canonical_hash:
+                self.canonical_hash = canonical.canonical_hash(self.columns, self.rows, self.points)
+            if layout_changed:
+                self.layout_version = models.F('layout_version') + 1
+            if update_fields is not None:
+                kwargs['update_fields'] = {
+                    *update_fields, 'thumbnail', 'canonical_hash', 'layout_hash', 'layout_version'
+                }
+        super().save(*args, **kwargs)
+        if layout_changed:
+            self.refresh_from_db(fields=['layout_version'])
+
+    def refresh_thumbnail(self) -> bool:
+        """
+        Point the thumbnail at the rendering of the current points, rendering it only if it is missing.
+
+        Returns whether the thumbnail changed.
+        """
+        points = self._meta.get_field('points').raw_value(self)
+        if self.thumbnail.name == thumbnails.thumbnail_name(self.columns, self.rows, points):
+            return False
+        self.thumbnail.name = thumbnails.save_thumbnail(self.columns, self.rows, points)
+        return True
+
+    @classmethod
+    def known_results(cls, columns: int, rows: int, points, exclude=None) -> dict:
+        """
+        Solver results for a layout, as field values to store on a board.
+
+        A stored board with the same canonical form is found through the hash index and
+        its solvability, uniqueness and difficulty are copied, since no symmetry or
+        recoloring changes them. Otherwise the solver is run, and uniqueness and
+        difficulty go back to unknown until they are checked for this layout.
+        """
+        twins = cls.objects.filter(canonical_hash=canonical.canonical_hash(columns, rows, points)) \
+            .exclude(solvability=UNKNOWN)
+        if exclude is not None:
+            twins = twins.exclude(pk=exclude)
+        twin = twins.only('solvability', 'uniqueness', 'difficulty').first()
+        if twin is not None:
+            # A check still running belongs to the twin, none is queued for the copy
+            uniqueness = UNKNOWN if twin.uniqueness == solver.CHECKING else twin.uniqueness
+            return {'solvability': twin.solvability, 'uniqueness': uniqueness, 'difficulty': twin.difficulty}
+
+        return {
+            'solvability': solver.solve(columns, rows, points, settings.BOARDS_SOLVER_DEADLINE).status,
+            'uniqueness': UNKNOWN,
+            'difficulty': None,
+        }
 
     def validate_points(self):
-        if not isinstance(self.points, list):
-            raise ValueError("There must be a non empty list of colored points.")
-        color_count = {}
-        for point in self.points:
-            colorPoint = ColorPoints(
-                x=point['x'],
-                y=point['y'],
-                color=Color(hex_value=point['color']['hex_value'])
-            )
-            colorPoint.validate()
-
-            if colorPoint.x < 0 or colorPoint.x >= self.columns:
-                raise ValueError(f"Point {colorPoint} is out of bounds for columns {self.columns}.")
-            if colorPoint.y < 0 or colorPoint.y >= self.rows:
-                raise ValueError(f"Point {colorPoint} is out of bounds for rows {self.rows}.")
-
-        for color, count in color_count.items():
-            if not count == NUMBER_OF_POINTS_PER_COLOR:
-                raise ValueError(f"{color} has invalid number of points. Each color must have exactly {NUMBER_OF_POINTS_PER_COLOR} points.")
+        validate_board_points(self.points, self.columns, self.rows)
+
+    def leaderboard(self, limit: int | None = None):
+        """Shortest verified solutions of this board, best first, read straight off the leaderboard index."""
+        if limit is None:
+            limit = settings.BOARDS_LEADERBOARD_SIZE
+        solutions = self.solutions.filter(status=VERIFIED, length__isnull=False)
+        return solutions.select_related('user').order_by('length', 'id')[:limit]
+
+    def solve(self, deadline: float | None = None) -> solver.SolverResult:
+        """Run the time-bounded solver on this board."""
+        if deadline is None:
+            deadline = settings.BOARDS_SOLVER_DEADLINE
+        return solver.solve(self.columns, self.rows, self.points, deadline)
+
+    def check_uniqueness(self, deadline: float | None = None) -> str:
+        """Count solutions of this board up to two and return the uniqueness status."""
+        if deadline is None:
+            deadline = settings.BOARDS_UNIQUENESS_DEADLINE
+        return solver.check_uniqueness(self.columns, self.rows, self.points, deadline)
 
     def __str__(self):
         return self.name
@@ -100,6 +184,10 @@ class GameBoard(models.Model):
         verbose_name = 'Game Board'
         verbose_name_plural = 'Game Boards'
         ordering = ['-id']
+        indexes = [
+            # Serves board listings ordered or filtered by difficulty
+            models.Index(fields=['difficulty', 'id'], name='gameboard_difficulty_idx'),
+        ]
 
 class Path:
     points: list[Point]
@@ -117,4 +205,62 @@ class Solution(models.Model):
     name = models.CharField(max_length=255)
     game_board = models.ForeignKey(GameBoard, on_delete=models.CASCADE, related_name='solutions')
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
-    paths = models.JSONField(default=list, blank=True)
\ No newline at end of file
+    paths = CompactPathsField(default=list, blank=True)
+    status = models.CharField(max_length=16, choices=VERIFICATION_CHOICES, default=VERIFIED)
+    rejection_reason = models.TextField(blank=True, default='')
+    length = models.PositiveIntegerField(null=True, blank=True)
+    revision = models.PositiveIntegerField(default=1)
+
+    # Length the solution was counted with in its board statistics when it was loaded
+    counted_length = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'status' in instance.__dict__ and 'length' in instance.__dict__:
+            instance.counted_length = instance.length if instance.status == VERIFIED else None
+        return instance
+
+    def compute_length(self) -> int:
+        """Total number of cells covered by the paths."""
+        return sum(len(path['path']) for path in self.paths)
+
+    def save(self, *args, **kwargs):
+        paths = self._meta.get_field('paths').raw_value(self)
+        touched = not isinstance(paths, EncodedValue)
+        if touched:
+            # The paths were set or read since loading, so they may have changed
+            self.length = self.compute_length()
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None or 'paths' in update_fields:
+                if not self._state.adding:
+                    self.revision = models.F('revision') + 1
+                if update_fields is not None:
+                    kwargs['update_fields'] = {*update_fields, 'length', 'revision'}
+        super().save(*args, **kwargs)
+        if not isinstance(self.revision, int):
+            self.refresh_from_db(fields=['revision'])
+
+    class Meta:
+        indexes = [
+            # Serves the leaderboard: the shortest verified solutions of a board in index order
+            models.Index(fields=['game_board', 'status', 'length', 'id'], name='solution_leaderboard_idx'),
+        ]
+
+class PlaySession(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    game_board = models.ForeignKey(GameBoard, on_delete=models.CASCADE, related_name='play_sessions')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    # Layout version of the board the moves were played on
+    layout_version = models.PositiveIntegerField()
+    # Append-only log of encoding.encode_move tokens
+    moves = models.TextField(blank=True, default='')
+    move_count = models.PositiveIntegerField(default=0)
+    solution = models.OneToOneField(
+        Solution, on_delete=models.SET_NULL, null=True, blank=True, related_name='play_session'
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['game_board', 'user'], name='play_session_per_user'),
+        ]
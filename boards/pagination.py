@@ -0,0 +1,100 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+
+class BoardCursorPagination(CursorPagination):
+    """
+    Keyset pagination over game boards by primary key.
+
+    Every page is a single indexed range scan, so fetching a page costs the same no matter
+    how deep into the listing it is. Orderings over several fields keep all of them in the
+    cursor position, so boards sharing a difficulty are never skipped or repeated.
+    """
+    ordering = '-id'
+    page_size_query_param = 'page_size'
+    ordering_query_param = 'ordering'
+    # Orderings clients may ask for, each served by the difficulty index
+    orderings = {
+        'difficulty': ('difficulty', 'id'),
+        '-difficulty': ('-difficulty', '-id'),
+    }
+    # Set while DRF paginates a multi-field ordering whose position is already applied
+    _keyset = False
+
+    def get_ordering(self, request, queryset, view):
+        return self.orderings.get(request.query_params.get(self.ordering_query_param), (self.ordering,))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = self.orderings.get(request.query_params.get(self.ordering_query_param))
+        if ordering is None:
+            return super().paginate_queryset(queryset, request, view)
+
+        # Boards whose difficulty is not estimated yet have no place in the order
+        queryset = queryset.filter(difficulty__isnull=False)
+        # DRF only filters on the first ordering field and steps over ties with an OFFSET,
+        # so the position here covers every field and is applied before DRF sees the cursor
+        cursor = super().decode_cursor(request)
+        if cursor is not None and cursor.position is not None:
+            queryset = queryset.filter(self._after(queryset.model, ordering, cursor))
+        self._keyset = True
+        page = super().paginate_queryset(queryset, request, view)
+
+        if cursor is not None and cursor.position is not None:
+            self.cursor = cursor
+            if cursor.reverse:
+                self.has_next, self.next_position = True, cursor.position
+            else:
+                self.has_previous, self.previous_position = True, cursor.position
+            self.display_page_controls = self.template is not None
+        return page
+
+    def decode_cursor(self, request):
+        cursor = super().decode_cursor(request)
+        if cursor is not None and self._keyset:
+            return cursor._replace(position=None)
+        return cursor
+
+    def _after(self, model, ordering, cursor):
+        """Condition selecting the boards past the cursor position, one field after another."""
+        names = [order.lstrip('-') for order in ordering]
+        values = cursor.position.split('|')
+        try:
+            if len(values) != len(names):
+                raise ValueError
+            values = [model._meta.get_field(name).to_python(value) for name, value in zip(names, values)]
+        except (ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        lookup = 'lt' if ordering[0].startswith('-') != cursor.reverse else 'gt'
+        condition = Q()
+        for index, name in enumerate(names):
+            condition |= Q(**dict(zip(names[:index], values[:index])), **{f'{name}__{lookup}': values[index]})
+        return condition
+
+    def _get_position_from_instance(self, instance, ordering):
+        position = super()._get_position_from_instance
+        return '|'.join(position(instance, (order,)) for order in ordering)
+
+    def get_page_size(self, request):
+        self.page_size = settings.BOARDS_PAGE_SIZE
+        self.max_page_size = settings.BOARDS_MAX_PAGE_SIZE
+        return super().get_page_size(request)
+
+
+def filter_by_difficulty(game_boards, query_params):
+    """
+    Apply the ``min_difficulty`` and ``max_difficulty`` query parameters to a board listing.
+
+    Raises ``ValueError`` when a bound is not a number.
+    """
+    for param, lookup in (('min_difficulty', 'difficulty__gte'), ('max_difficulty', 'difficulty__lte')):
+        value = query_params.get(param)
+        if value:
+            try:
+                game_boards = game_boards.filter(**{lookup: float(value)})
+            except ValueError:
+                raise ValueError(f"{param} must be a number.")
+    return game_boards
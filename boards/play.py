@@ -0,0 +1,224 @@
+from collections import deque
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Concat
+
+from . import encoding, solver
+from .models import PlaySession, Solution
+from .validation import FREE, VERIFIED, OccupancyGrid, board_cells
+from .validation_cache import LRUCache
+
+
+class PlayState:
+    """
+    Paths drawn so far in a play session, rasterized into an occupancy grid.
+
+    A move touches one cell of the grid and the end of one path, so it is checked in
+    constant time whatever the size of the board or the length of the paths.
+    """
+
+    def __init__(self, columns: int, rows: int, points):
+        self.grid = OccupancyGrid(columns, rows)
+        self.cells = board_cells(points)
+        self.colors = list(dict.fromkeys(point['color']['hex_value'] for point in points))
+        self.owners = {color: owner for owner, color in enumerate(self.colors, start=1)}
+        self.paths = [[] for _ in self.colors]
+        self.connected = 0
+        self.move_count = 0
+
+    @property
+    def complete(self) -> bool:
+        return self.connected == len(self.colors)
+
+    def _owner(self, color: str) -> int:
+        owner = self.owners.get(color)
+        if owner is None:
+            raise ValueError(f"Color {color} is not on the board.")
+        return owner
+
+    def _is_connected(self, path, color: str) -> bool:
+        return len(path) > 1 and self.cells.get(path[-1]) == color
+
+    def extend(self, color: str, x: int, y: int) -> str:
+        """Draw the path of ``color`` into the cell ``(x, y)``; returns the move log token."""
+        owner = self._owner(color)
+        path = self.paths[owner - 1]
+        if not self.grid.contains(x, y):
+            raise ValueError(
+                f"Point ({x}, {y}) is out of bounds for the grid dimensions ({self.grid.columns}x{self.grid.rows})."
+            )
+
+        endpoint = self.cells.get((x, y))
+        if path:
+            if self._is_connected(path, color):
+                raise ValueError(f"Path for color {color} is already connected.")
+            last_x, last_y = path[-1]
+            if abs(x - last_x) + abs(y - last_y) != 1:
+                raise ValueError("Path must be continuous, with each point adjacent to the next.")
+        elif endpoint != color:
+            raise ValueError(f"Path for color {color} must start on a board point of its color.")
+        if endpoint is not None and endpoint != color:
+            raise ValueError(f"Cell ({x}, {y}) is a board point of color {endpoint}.")
+
+        previous = self.grid.claim(x, y, owner)
+        if previous != FREE:
+            raise ValueError(f"Cell ({x}, {y}) is already taken by the path for color {self.colors[previous - 1]}.")
+
+        path.append((x, y))
+        if self._is_connected(path, color):
+            self.connected += 1
+        self.move_count += 1
+        return encoding.encode_move(owner - 1, x, y)
+
+    def undo(self, color: str) -> str:
+        """Take back the last cell of the path of ``color``; returns the move log token."""
+        owner = self._owner(color)
+        path = self.paths[owner - 1]
+        if not path:
+            raise ValueError(f"Path for color {color} has no cells to take back.")
+
+        if self._is_connected(path, color):
+            self.connected -= 1
+        x, y = path.pop()
+        self.grid.release(x, y, owner)
+        self.move_count += 1
+        return encoding.encode_move((owner - 1) | encoding.UNDO_FLAG, x, y)
+
+    def replay(self, log: str):
+        """Apply the moves of a log written by ``extend`` and ``undo``."""
+        for index, x, y in encoding.decode_move_log(log):
+            if index & encoding.UNDO_FLAG:
+                self.undo(self.colors[index & ~encoding.UNDO_FLAG])
+            else:
+                self.extend(self.colors[index], x, y)
+
+    def to_paths(self) -> list:
+        """Drawn paths in the format of solution paths."""
+        return [
+            {
+                'start': {'x': cells[0][0], 'y': cells[0][1]},
+                'end': {'x': cells[-1][0], 'y': cells[-1][1]},
+                'color': {'hex_value': color},
+                'path': [{'x': x, 'y': y} for x, y in cells],
+            }
+            for color, cells in zip(self.colors, self.paths) if cells
+        ]
+
+
+state_cache = LRUCache(settings.BOARDS_PLAY_SESSION_CACHE_SIZE)
+
+
+def _state_key(session):
+    return session.pk, session.layout_version, session.move_count
+
+
+def take_state(session) -> PlayState:
+    """
+    Remove and return the state of a session, replaying its move log unless it is cached.
+
+    The caller holds the session row lock, so the state matches the stored log.
+    """
+    state = state_cache.pop(_state_key(session))
+    if state is None:
+        board = session.game_board
+        state = PlayState(board.columns, board.rows, board.points)
+        state.replay(session.moves)
+    return state
+
+
+def keep_state(session, state: PlayState):
+    state_cache.set(_state_key(session), state)
+
+
+def restart(session, board):
+    """Discard the moves of a session and play the current layout of the board."""
+    session.layout_version = board.layout_version
+    session.moves = ''
+    session.move_count = 0
+    session.solution = None
+    session.save(update_fields=['layout_version', 'moves', 'move_count', 'solution'])
+
+
+def record_move(session, state: PlayState, token: str):
+    """
+    Append a move to the session log and store the paths as a solution once all colors are connected.
+
+    The log is extended in the database, so a move writes a few bytes however long the
+    session is. Every move was checked on the grid, so the solution is stored as verified
+    without running the validator again.
+    """
+    changes = {
+        'moves': Concat('moves', Value(token), output_field=models.TextField()),
+        'move_count': state.move_count,
+    }
+    if state.complete:
+        board = session.game_board
+        session.solution = Solution.objects.create(
+            name=board.name, game_board=board, user_id=session.user_id, paths=state.to_paths(), status=VERIFIED
+        )
+        changes['solution'] = session.solution
+    PlaySession.objects.filter(pk=session.pk).update(**changes)
+    session.move_count = state.move_count
+
+
+class HintPlan:
+    """
+    Hint computed for a session, advanced along the moves played since.
+
+    Playing the planned moves keeps the plan valid: moves forced by the old paths are
+    still forced, and a solution continuing the old paths continues the new ones too. The
+    rest of the plan is then served without running the solver again. Taking a move back
+    or leaving the plan drops it.
+    """
+
+    def __init__(self, hint: solver.Hint, move_count: int):
+        self.status = hint.status
+        self.reason = hint.reason
+        self.move_count = move_count
+        self.queues = {}
+        for color, x, y in hint.moves:
+            self.queues.setdefault(color, deque()).append((x, y))
+
+    def advance(self, state: PlayState, log: str, move_count: int) -> bool:
+        """Follow the moves logged since the plan was made; returns whether the plan still holds."""
+        for index, x, y in encoding.decode_move_log(log[self.move_count * encoding.MOVE_TOKEN_LENGTH:]):
+            if index & encoding.UNDO_FLAG:
+                return False
+            if self.status == solver.DEAD_END:
+                # Drawing more never gets a player out of a dead end
+                continue
+            color = state.colors[index]
+            queue = self.queues.get(color)
+            if not queue or queue[0] != (x, y):
+                return False
+            queue.popleft()
+            if not queue:
+                del self.queues[color]
+        self.move_count = move_count
+        return self.status in (solver.DEAD_END, solver.SOLVED) or bool(self.queues)
+
+    def current(self) -> solver.Hint:
+        if not self.queues:
+            return solver.Hint(self.status, reason=self.reason)
+        color, queue = next(iter(self.queues.items()))
+        return solver.Hint(self.status, [(color, *queue[0])], self.reason)
+
+
+hint_cache = LRUCache(settings.BOARDS_PLAY_SESSION_CACHE_SIZE)
+
+
+def session_hint(session, state: PlayState) -> solver.Hint:
+    """Hint for the current state of a session, continuing the plan of the previous hint when it still holds."""
+    key = (session.pk, session.layout_version)
+    plan = hint_cache.get(key)
+    if plan is None or not plan.advance(state, session.moves, session.move_count):
+        board = session.game_board
+        hint = solver.hint(board.columns, board.rows, board.points, state.to_paths(), settings.BOARDS_SOLVER_DEADLINE)
+        if hint.status == solver.UNKNOWN:
+            hint_cache.pop(key)
+            return hint
+        plan = HintPlan(hint, session.move_count)
+        hint_cache.set(key, plan)
+    return plan.current()
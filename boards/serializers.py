@@ -1,11 +1,88 @@
 ﻿from django.core import serializers
+from django.db import models
+from django.urls import reverse
 from rest_framework import serializers
-from .models import GameBoard, Solution
+from common.serializers import UserSerializer
+from .models import GameBoard, PlaySession, Solution
+from . import encoding
+from .solver import HINT_CHOICES, SOLVABILITY_CHOICES
+from .validation import VERIFIED, merge_paths, replace_paths, validate_board_points
+from .validation_cache import keep_solution_grid, take_solution_grid, validate_solution_cached
 
 MAX_BOARD_WIDTH = 1000
 MAX_BOARD_HEIGHT = 1000
 
 
+def _is_plain_color(value) -> bool:
+    """Tell whether ``value`` is a color dict that ColorSerializer would return unchanged."""
+    if type(value) is not dict or len(value) != 1:
+        return False
+    hex_value = value.get('hex_value')
+    # Whitespace, null and surrogate characters are left to the validators of CharField
+    return type(hex_value) is str and len(hex_value) == 7 and hex_value[0] == '#' \
+        and not hex_value[-1].isspace() and '\x00' not in hex_value \
+        and not any('\ud800' <= char <= '\udfff' for char in hex_value)
+
+
+def _cell(value) -> dict:
+    # Validated data is a new dict, as the fields would build it, never the caller's own
+    return {'x': value['x'], 'y': value['y']}
+
+
+def _are_plain_coordinates(x, y, max_x=None, max_y=None) -> bool:
+    return type(x) is int and type(y) is int and x >= 0 and y >= 0 \
+        and (max_x is None or x <= max_x) and (max_y is None or y <= max_y)
+
+
+def _is_plain_cell(value) -> bool:
+    """Tell whether ``value`` is an ``{x, y}`` dict of non-negative integers."""
+    return type(value) is dict and len(value) == 2 and _are_plain_coordinates(value.get('x'), value.get('y'))
+
+
+def _are_plain_cells(values) -> bool:
+    if type(values) is not list:
+        return False
+    for value in values:
+        if type(value) is not dict or len(value) != 2:
+            return False
+        x = value.get('x')
+        y = value.get('y')
+        if type(x) is not int or type(y) is not int or x < 0 or y < 0:
+            return False
+    return True
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """
+    List serializer that accepts items already in their validated shape without running fields.
+
+    The child decides through ``plain_internal_value`` and ``plain_representation``; any
+    other item goes through the regular field machinery, so coercion, the OpenAPI schema
+    and the error structure stay those of ``many=True``.
+    """
+
+    def run_child_validation(self, data):
+        value = self.child.plain_internal_value(data)
+        if value is None:
+            value = super().run_child_validation(data)
+        return value
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        child = self.child
+        return [child.plain_representation(item) for item in iterable]
+
+
+# Hooks used by FastListSerializer. No docstring here, drf_spectacular would use it as
+# the schema description of every serializer mixing this in.
+class PlainListMixin:
+    def plain_internal_value(self, data):
+        return None
+
+    def plain_representation(self, instance):
+        return self.to_representation(instance)
+
+
 class ColorSerializer(serializers.Serializer):
     """
     Serializer for color validation.
@@ -18,23 +95,70 @@ class ColorSerializer(serializers.Serializer):
             raise serializers.ValidationError("Hex value must be a valid hex color code (e.g., #RRGGBB).")
         return value
 
-class PathPointSerializer(serializers.Serializer):
+class PathPointSerializer(PlainListMixin, serializers.Serializer):
     x = serializers.IntegerField(min_value=0)
     y = serializers.IntegerField(min_value=0)
 
+    class Meta:
+        list_serializer_class = FastListSerializer
+
+    def plain_internal_value(self, data):
+        return _cell(data) if _is_plain_cell(data) else None
+
+    def plain_representation(self, instance):
+        return instance if _is_plain_cell(instance) else self.to_representation(instance)
 
-class PathSerializer(serializers.Serializer):
+
+class PathSerializer(PlainListMixin, serializers.Serializer):
     start = PathPointSerializer()
     end = PathPointSerializer()
     color = ColorSerializer()
     path = PathPointSerializer(many=True)
 
-class PointWithColorSerializer(serializers.Serializer):
+    class Meta:
+        list_serializer_class = FastListSerializer
+
+    @staticmethod
+    def _is_plain(value) -> bool:
+        return type(value) is dict and len(value) == 4 \
+            and _is_plain_cell(value.get('start')) and _is_plain_cell(value.get('end')) \
+            and _is_plain_color(value.get('color')) and _are_plain_cells(value.get('path'))
+
+    def plain_internal_value(self, data):
+        if not self._is_plain(data):
+            return None
+        return {
+            'start': _cell(data['start']),
+            'end': _cell(data['end']),
+            'color': {'hex_value': data['color']['hex_value']},
+            'path': [_cell(cell) for cell in data['path']],
+        }
+
+    def plain_representation(self, instance):
+        return instance if self._is_plain(instance) else self.to_representation(instance)
+
+class PointWithColorSerializer(PlainListMixin, serializers.Serializer):
     color = ColorSerializer()
 
     x = serializers.IntegerField(min_value=0, max_value=MAX_BOARD_WIDTH - 1)
     y = serializers.IntegerField(min_value=0, max_value=MAX_BOARD_HEIGHT - 1)
 
+    class Meta:
+        list_serializer_class = FastListSerializer
+
+    @staticmethod
+    def _is_plain(value, max_x=None, max_y=None) -> bool:
+        return type(value) is dict and len(value) == 3 and _is_plain_color(value.get('color')) \
+            and _are_plain_coordinates(value.get('x'), value.get('y'), max_x, max_y)
+
+    def plain_internal_value(self, data):
+        if not self._is_plain(data, MAX_BOARD_WIDTH - 1, MAX_BOARD_HEIGHT - 1):
+            return None
+        return {'color': {'hex_value': data['color']['hex_value']}, 'x': data['x'], 'y': data['y']}
+
+    def plain_representation(self, instance):
+        return instance if self._is_plain(instance) else self.to_representation(instance)
+
 class GameBoardSerializer(serializers.ModelSerializer):
     """
     Serializer for creating and updating GameBoard objects with proper validation.
@@ -44,171 +168,225 @@ class GameBoardSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = GameBoard
-        fields = ['id','name', 'columns', 'rows', 'points']
+        fields = ['id','name', 'columns', 'rows', 'points', 'solvability', 'uniqueness',
+                  'solution_count', 'solver_count', 'best_solution_length', 'difficulty', 'canonical_hash']
         extra_kwargs = {
             'id': {'read_only': True},
+            'solvability': {'read_only': True},
+            'uniqueness': {'read_only': True},
+            'solution_count': {'read_only': True},
+            'solver_count': {'read_only': True},
+            'best_solution_length': {'read_only': True},
+            'difficulty': {'read_only': True},
+            'canonical_hash': {'read_only': True},
             'columns': {'min_value': 0, 'max_value': MAX_BOARD_WIDTH},
             'rows': {'min_value': 0, 'max_value': MAX_BOARD_HEIGHT},
         }
 
-    def validate_points(self, points):
-        """Validate that points data is properly formatted and each color has exactly 2 points"""
-        game_board = GameBoard(
-            points=points,
-            columns=self.initial_data.get('columns', 1),
-            rows=self.initial_data.get('rows', 1)
-        )
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if self.context.get('compact') and 'points' in data:
+            data['points'] = encoding.encode_points(instance.points) or data['points']
+        return data
+
+    def validate(self, data):
+        """Validate that points are within the grid, unique and each color has exactly 2 points."""
+        columns = data.get('columns', self.instance.columns if self.instance else 1)
+        rows = data.get('rows', self.instance.rows if self.instance else 1)
         try:
-            game_board.validate_points()
+            validate_board_points(data.get('points', []), columns, rows)
         except ValueError as e:
-            raise serializers.ValidationError(str(e))
-        return points
+            raise serializers.ValidationError({'points': [str(e)]})
+        return data
 
-    def validate(self, data):
-        """Ensure all points are within the grid dimensions."""
-        points = data.get('points', [])
-        width = data.get('columns')
-        height = data.get('rows')
 
-        for point in points:
-            if not (0 <= point['x'] < width) or not (0 <= point['y'] < height):
-                raise serializers.ValidationError(
-                    f"Point ({point['x']}, {point['y']}) is out of bounds for the grid dimensions ({width}x{height})."
-                )
+class GameBoardPageSerializer(serializers.Serializer):
+    """
+    Serializer for one page of a cursor-paginated game board listing.
+    """
+    next = serializers.URLField(allow_null=True)
+    previous = serializers.URLField(allow_null=True)
+    results = GameBoardSerializer(many=True)
+
+
+class SolutionSerializer(serializers.ModelSerializer):
+    """
+    Serializer for creating and updating solutions for a GameBoard.
+    """
+    game_board = serializers.PrimaryKeyRelatedField(read_only=True)
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+    paths = PathSerializer(many=True)
+    name = serializers.CharField(max_length=255, required=True)
+
+    class Meta:
+        model = Solution
+        fields = ['id', 'game_board', 'user', 'paths', 'name', 'status', 'rejection_reason']
+        read_only_fields = ['id', 'game_board', 'user', 'status', 'rejection_reason']
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if self.context.get('compact'):
+            data['paths'] = encoding.encode_paths(instance.paths) or data['paths']
         return data
 
+    def validate(self, data):
+        """Validate the entire solution, unless the view verifies it in the background."""
+        if self.context.get('defer_verification'):
+            return data
 
+        board = self.instance.game_board if self.instance else self.context['game_board']
+        paths = data.get('paths', [])
 
-def _validate_paths_edges(paths, points):
-    """Ensure that each path's start and end points match the board points."""
-    for path in paths:
-        color = path['color']['hex_value']
-        start = (path['start']['x'], path['start']['y'])
-        end = (path['end']['x'], path['end']['y'])
+        try:
+            validate_solution_cached(board, paths)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
 
-        # Verify start and end points match board points
-        board_color_points = [(p['x'], p['y']) for p in points]
-        if start not in board_color_points or end not in board_color_points:
-            raise serializers.ValidationError(f"Path points don't match board points for color {color}")
+        return data
 
-        # Ensure path contains both endpoints
-        path_points = [(p['x'], p['y']) for p in path['path']]
-        if start not in path_points or end not in path_points:
-            raise serializers.ValidationError(f"Path must include both start and end points")
 
+class SolutionPatchSerializer(serializers.ModelSerializer):
+    """
+    Serializer for partial updates of a solution that replace the paths of single colors.
+    """
+    paths = PathSerializer(many=True, required=False, write_only=True)
+    name = serializers.CharField(max_length=255, required=False)
 
-def _validate_color_points(points, paths):
-    colors = set()
-    board_points = {}
-    # Collect all points by color from the game board
-    for point in points:
-        color_hex = point['color']['hex_value']
-        if color_hex not in board_points:
-            board_points[color_hex] = []
-        board_points[color_hex].append(point)
+    class Meta:
+        model = Solution
+        fields = ['id', 'name', 'paths', 'status', 'length']
+        read_only_fields = ['id', 'status', 'length']
 
-    # Check if each color is connected by exactly one path
-    color_paths = {}
-    for path in paths:
-        color_hex = path['color']['hex_value']
-        if color_hex not in color_paths:
-            color_paths[color_hex] = []
-        color_paths[color_hex].append(path)
+    def validate(self, data):
+        """Merge the replaced paths into the stored ones, tracing only the replaced paths when possible."""
+        replacements = data.get('paths')
+        if not replacements:
+            return data
+
+        solution = self.instance
+        self.grid = None
+        if solution.status == VERIFIED:
+            try:
+                self.grid = take_solution_grid(solution)
+            except ValueError:
+                # The board changed since the solution was verified
+                pass
 
-    for color, paths in color_paths.items():
-        if len(paths) != 1:
-            raise serializers.ValidationError(f"Color {color} must have exactly one path.")
-        colors.add(color)
+        try:
+            if self.grid is not None:
+                data['paths'] = replace_paths(*self.grid, solution.paths, replacements)
+            else:
+                data['paths'] = merge_paths(solution.paths, replacements)
+                validate_solution_cached(solution.game_board, data['paths'])
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+        return data
 
+    def update(self, instance, validated_data):
+        instance = super().update(instance, validated_data)
+        if getattr(self, 'grid', None) is not None:
+            keep_solution_grid(instance, *self.grid)
+        return instance
 
-def _validate_path_continuity(path):
-    """Ensure that the path is continuous and does not skip points."""
-    points = path['path']
-    if len(points) < 2:
-        raise serializers.ValidationError("Path must have at least two points.")
 
-    for i in range(len(points) - 1):
-        diff = abs(points[i]['x'] - points[i + 1]['x']) + abs(points[i]['y'] - points[i + 1]['y'])
-        if diff != 1:
-            raise serializers.ValidationError("Path must be continuous, with each point adjacent to the next.")
+class SolutionStatusSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the verification state of a solution submitted asynchronously.
+    """
+    job = serializers.SerializerMethodField()
 
+    class Meta:
+        model = Solution
+        fields = ['id', 'status', 'rejection_reason', 'job']
+        read_only_fields = fields
 
-def _do_paths_cross(path1, path2):
-    """Check if two paths cross each other."""
-    for i in range(len(path1) - 1):
-        seg1_start = path1[i]
-        seg1_end = path1[i + 1]
+    def get_job(self, instance) -> str:
+        return reverse('api_solution_status', args=[instance.game_board_id, instance.id])
 
-        for j in range(len(path2) - 1):
-            seg2_start = path2[j]
-            seg2_end = path2[j + 1]
 
-            # Check for segment intersection similar to doSegmentsIntersect in JS
-            # This is a simplified check for orthogonal segments only
-            if (seg1_start['x'] == seg1_end['x'] and seg2_start['y'] == seg2_end['y']  # one vertical, one horizontal
-                or seg1_start['y'] == seg1_end['y'] and seg2_start['x'] == seg2_end['x']):
+class LeaderboardEntrySerializer(serializers.ModelSerializer):
+    """
+    Serializer for one ranked solution on a board leaderboard.
+    """
+    rank = serializers.IntegerField(read_only=True)
+    user = UserSerializer(read_only=True)
 
-                if seg1_start['x'] == seg1_end['x']:  # First segment is vertical
-                    x = seg1_start['x']
-                    min_y = min(seg1_start['y'], seg1_end['y'])
-                    max_y = max(seg1_start['y'], seg1_end['y'])
+    class Meta:
+        model = Solution
+        fields = ['rank', 'id', 'name', 'user', 'length']
+        read_only_fields = fields
 
-                    y = seg2_start['y']
-                    min_x = min(seg2_start['x'], seg2_end['x'])
-                    max_x = max(seg2_start['x'], seg2_end['x'])
 
-                    if min_x <= x <= max_x and min_y <= y <= max_y:
-                        return True
-                else:  # First segment is horizontal
-                    y = seg1_start['y']
-                    min_x = min(seg1_start['x'], seg1_end['x'])
-                    max_x = max(seg1_start['x'], seg1_end['x'])
+class SolverResultSerializer(serializers.Serializer):
+    """
+    Serializer for the outcome of the board solver with an optional witness solution.
+    """
+    status = serializers.ChoiceField(choices=SOLVABILITY_CHOICES)
+    paths = PathSerializer(many=True, allow_null=True)
 
-                    x = seg2_start['x']
-                    min_y = min(seg2_start['y'], seg2_end['y'])
-                    max_y = max(seg2_start['y'], seg2_end['y'])
 
-                    if min_x <= x <= max_x and min_y <= y <= max_y:
-                        return True
+class PlayMoveSerializer(serializers.Serializer):
+    """
+    Serializer for one move of a play session: a cell added to the path of a color, or its last cell taken back.
+    """
+    color = serializers.CharField(max_length=7)
+    x = serializers.IntegerField(min_value=0, required=False)
+    y = serializers.IntegerField(min_value=0, required=False)
+    undo = serializers.BooleanField(default=False)
 
-    return False
+    def validate(self, data):
+        if not data['undo'] and ('x' not in data or 'y' not in data):
+            raise serializers.ValidationError("A move needs the x and y of a cell unless it takes back the last one.")
+        return data
 
 
-class SolutionSerializer(serializers.ModelSerializer):
+class PlayProgressSerializer(serializers.ModelSerializer):
     """
-    Serializer for creating and updating solutions for a GameBoard.
+    Serializer for the progress of a play session, with its current state attached as ``state``.
     """
-    game_board = serializers.PrimaryKeyRelatedField(read_only=True)
-    user = serializers.PrimaryKeyRelatedField(read_only=True)
-    paths = PathSerializer(many=True)
-    name = serializers.CharField(max_length=255, required=True)
+    connected = serializers.IntegerField(source='state.connected', read_only=True)
+    colors = serializers.SerializerMethodField()
+    complete = serializers.BooleanField(source='state.complete', read_only=True)
 
     class Meta:
-        model = Solution
-        fields = ['id', 'game_board', 'user', 'paths', 'name']
-        read_only_fields = ['id', 'game_board', 'user']
+        model = PlaySession
+        fields = ['id', 'game_board', 'move_count', 'connected', 'colors', 'complete', 'solution']
+        read_only_fields = fields
 
-    def validate(self, data):
-        """Validate the entire solution."""
-        board = self.instance.game_board if self.instance else self.context['game_board']
-        paths = data.get('paths', [])
+    def get_colors(self, instance) -> int:
+        return len(instance.state.colors)
 
-        for path in paths:
-            _validate_path_continuity(path)
-        _validate_color_points(board.points, paths)
-        _validate_paths_edges(paths, board.points)
 
-        # Check for path crossings
-        for i, path1 in enumerate(paths):
-            for j, path2 in enumerate(paths):
-                if i >= j:
-                    continue  # Skip self-comparisons and duplicates
+class PlaySessionSerializer(PlayProgressSerializer):
+    """
+    Serializer for a play session including the paths drawn so far.
+    """
+    paths = PathSerializer(many=True, source='state.to_paths', read_only=True)
 
-                if _do_paths_cross(path1['path'], path2['path']):
-                    raise serializers.ValidationError(
-                        f"Paths for colors {path1['color']['hex_value']} and {path2['color']['hex_value']} cross each other"
-                    )
+    class Meta(PlayProgressSerializer.Meta):
+        fields = PlayProgressSerializer.Meta.fields + ['paths']
+        read_only_fields = fields
 
-        return data
 
+class HintRequestSerializer(serializers.Serializer):
+    """
+    Serializer for the paths drawn so far on a board when asking for a hint.
+    """
+    paths = PathSerializer(many=True)
+
+
+class HintSerializer(serializers.Serializer):
+    """
+    Serializer for a hint: the next move for a color, or why the drawn paths cannot be completed.
+    """
+    status = serializers.ChoiceField(choices=HINT_CHOICES)
+    color = serializers.CharField(allow_null=True)
+    x = serializers.IntegerField(allow_null=True)
+    y = serializers.IntegerField(allow_null=True)
+    reason = serializers.CharField(allow_blank=True)
@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from . import difficulty, statistics
+from .models import GameBoard, Solution
+from .validation import VERIFIED
+
+
+@receiver(post_save, sender=Solution)
+def handle_solution_saved(sender, instance, **kwargs):
+    """
+    Signal handler that keeps the board statistics in step with a created or edited Solution
+    """
+    counted_length = instance.length if instance.status == VERIFIED else None
+    statistics.record_change(instance, instance.counted_length, counted_length)
+    instance.counted_length = counted_length
+
+
+def _deleted_directly(origin) -> bool:
+    return isinstance(origin, Solution) or getattr(origin, 'model', None) is Solution
+
+
+@receiver(post_delete, sender=Solution)
+def handle_solution_deleted(sender, instance, origin=None, **kwargs):
+    """
+    Signal handler that removes a deleted Solution from the board statistics
+
+    Solutions deleted together with their board or user are skipped: the board goes
+    away with its counters, and the boards a deleted user solved are reconciled at once.
+    """
+    if not _deleted_directly(origin):
+        return
+    statistics.record_change(instance, instance.counted_length, None)
+    instance.counted_length = None
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def handle_user_deleting(sender, instance, **kwargs):
+    """
+    Signal handler that remembers the boards of other users a User being deleted has solved
+    """
+    instance.solved_board_ids = list(
+        Solution.objects.filter(user=instance).exclude(game_board__user=instance)
+        .order_by().values_list('game_board', flat=True).distinct()
+    )
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def handle_user_deleted(sender, instance, **kwargs):
+    """
+    Signal handler that recomputes the statistics of the boards a deleted User had solved
+    """
+    board_ids = getattr(instance, 'solved_board_ids', None)
+    if board_ids:
+        statistics.reconcile(GameBoard.objects.filter(pk__in=board_ids))
+
+
+@receiver(post_save, sender=GameBoard)
+def handle_game_board_saved(sender, instance, **kwargs):
+    """
+    Signal handler that queues a new difficulty estimate when the layout of a GameBoard changes
+    """
+    if instance.layout_changed:
+        difficulty.submit(instance.pk)
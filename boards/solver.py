@@ -0,0 +1,624 @@
+import math
+import time
+from array import array
+from collections import deque
+
+SOLVABLE = 'solvable'
+UNSOLVABLE = 'unsolvable'
+UNKNOWN = 'unknown'
+
+SOLVABILITY_CHOICES = [
+    (SOLVABLE, 'Solvable'),
+    (UNSOLVABLE, 'Unsolvable'),
+    (UNKNOWN, 'Unknown'),
+]
+
+UNIQUE = 'unique'
+MULTIPLE = 'multiple'
+# Stored on a board while a uniqueness check of it is queued or running
+CHECKING = 'checking'
+
+UNIQUENESS_CHOICES = [
+    (UNIQUE, 'Unique'),
+    (MULTIPLE, 'Multiple solutions'),
+    (UNSOLVABLE, 'Unsolvable'),
+    (UNKNOWN, 'Unknown'),
+    (CHECKING, 'Checking'),
+]
+
+FORCED = 'forced'
+SUGGESTED = 'suggested'
+DEAD_END = 'dead_end'
+SOLVED = 'solved'
+
+HINT_CHOICES = [
+    (FORCED, 'Forced move'),
+    (SUGGESTED, 'Move of a solution'),
+    (DEAD_END, 'Dead end'),
+    (SOLVED, 'Solved'),
+    (UNKNOWN, 'Unknown'),
+]
+
+DEFAULT_DEADLINE = 0.5  # seconds
+
+FREE = -1
+CHECK_DEADLINE_EVERY = 256
+
+
+class _DeadlineExceeded(Exception):
+    pass
+
+
+class SolverStats:
+    nodes: int
+    decisions: int
+    branches: int
+    forced_moves: int
+    backtracks: int
+
+    def __init__(self):
+        self.nodes = 0
+        self.decisions = 0
+        self.branches = 0
+        self.forced_moves = 0
+        self.backtracks = 0
+
+
+class SolverResult:
+    status: str
+    paths: list | None
+    stats: SolverStats
+
+    def __init__(self, status: str, paths: list | None = None, stats: SolverStats | None = None):
+        self.status = status
+        self.paths = paths
+        self.stats = stats or SolverStats()
+
+    def __str__(self):
+        return f"SolverResult({self.status})"
+
+
+class Hint:
+    status: str
+    moves: list
+    reason: str
+
+    def __init__(self, status: str, moves: list | None = None, reason: str = ''):
+        self.status = status
+        # Planned ``(color, x, y)`` moves, the first one is the hint
+        self.moves = moves or []
+        self.reason = reason
+
+    @property
+    def color(self) -> str | None:
+        return self.moves[0][0] if self.moves else None
+
+    @property
+    def x(self) -> int | None:
+        return self.moves[0][1] if self.moves else None
+
+    @property
+    def y(self) -> int | None:
+        return self.moves[0][2] if self.moves else None
+
+    def __str__(self):
+        return f"Hint({self.status})"
+
+
+class BoardSolver:
+    """
+    Connects every pair of same-colored board points with non-overlapping paths.
+
+    The search first tries cheap shortest-path routing and falls back to a depth-first
+    search with forced-move propagation and dead-end pruning. Every phase honours the
+    deadline; running out of time yields ``UNKNOWN``.
+    """
+
+    def __init__(self, columns: int, rows: int, points, deadline: float | None = DEFAULT_DEADLINE):
+        self.columns = columns
+        self.rows = rows
+        self.size = columns * rows
+        self.deadline = deadline
+        self.stats = SolverStats()
+        self._work = 0
+        self._expires_at = 0.0
+
+        self.colors = []
+        self.starts = []
+        self.targets = []
+        self.valid = self._load_points(points)
+
+    def _load_points(self, points) -> bool:
+        by_color = {}
+        seen = set()
+        for point in points:
+            x, y = point['x'], point['y']
+            if not (0 <= x < self.columns and 0 <= y < self.rows) or (x, y) in seen:
+                return False
+            seen.add((x, y))
+            by_color.setdefault(point['color']['hex_value'], []).append(y * self.columns + x)
+
+        for color, cells in by_color.items():
+            if len(cells) != 2:
+                return False
+            self.colors.append(color)
+            self.starts.append(cells[0])
+            self.targets.append(cells[1])
+        return True
+
+    # Grid helpers
+
+    def _neighbours(self, index: int):
+        x = index % self.columns
+        if x > 0:
+            yield index - 1
+        if x < self.columns - 1:
+            yield index + 1
+        if index >= self.columns:
+            yield index - self.columns
+        if index + self.columns < self.size:
+            yield index + self.columns
+
+    def _distance(self, a: int, b: int) -> int:
+        return abs(a % self.columns - b % self.columns) + abs(a // self.columns - b // self.columns)
+
+    def _tick(self):
+        self._work += 1
+        if self.deadline is not None and self._work % CHECK_DEADLINE_EVERY == 0 \
+                and time.monotonic() > self._expires_at:
+            raise _DeadlineExceeded()
+
+    def _empty_grid(self):
+        owners = array('i', [FREE]) * self.size
+        for color in range(len(self.colors)):
+            owners[self.starts[color]] = color
+            owners[self.targets[color]] = color
+        return owners
+
+    def _route(self, owners, color: int):
+        """Breadth-first shortest path for ``color`` over free cells, or ``None``."""
+        start, target = self.starts[color], self.targets[color]
+        parents = {start: start}
+        queue = deque([start])
+        while queue:
+            self._tick()
+            current = queue.popleft()
+            for neighbour in self._neighbours(current):
+                if neighbour in parents:
+                    continue
+                if neighbour == target:
+                    path = [target, current]
+                    while current != start:
+                        current = parents[current]
+                        path.append(current)
+                    path.reverse()
+                    return path
+                if owners[neighbour] == FREE:
+                    parents[neighbour] = current
+                    queue.append(neighbour)
+        return None
+
+    def _reachable(self, owners, head: int, target: int) -> bool:
+        seen = {head}
+        queue = deque([head])
+        while queue:
+            self._tick()
+            current = queue.popleft()
+            for neighbour in self._neighbours(current):
+                if neighbour == target:
+                    return True
+                if neighbour not in seen and owners[neighbour] == FREE:
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+        return False
+
+    def _coverable(self, owners, heads) -> bool:
+        """Every region of free cells must border a head, the only way a path can still enter it."""
+        seen = set()
+        for cell in range(self.size):
+            if owners[cell] != FREE or cell in seen:
+                continue
+            seen.add(cell)
+            queue = deque([cell])
+            bordered = False
+            while queue:
+                self._tick()
+                current = queue.popleft()
+                for neighbour in self._neighbours(current):
+                    if owners[neighbour] == FREE:
+                        if neighbour not in seen:
+                            seen.add(neighbour)
+                            queue.append(neighbour)
+                    elif neighbour in heads:
+                        bordered = True
+            if not bordered:
+                return False
+        return True
+
+    # Phases
+
+    def _check_connectivity(self) -> bool:
+        """Each color must at least reach its partner when only board points block the way."""
+        owners = self._empty_grid()
+        return all(self._reachable(owners, self.starts[c], self.targets[c]) for c in range(len(self.colors)))
+
+    def _greedy(self):
+        """Route colors one by one, moving a color that fails to the front and retrying."""
+        order = sorted(range(len(self.colors)), key=lambda c: self._distance(self.starts[c], self.targets[c]))
+        tried = set()
+        while tuple(order) not in tried:
+            tried.add(tuple(order))
+            owners = self._empty_grid()
+            routes = {}
+            for color in order:
+                route = self._route(owners, color)
+                if route is None:
+                    order.remove(color)
+                    order.insert(0, color)
+                    break
+                for cell in route:
+                    owners[cell] = color
+                routes[color] = route
+            else:
+                return [routes[c] for c in range(len(self.colors))]
+        return None
+
+    def _initial_state(self):
+        """Grid owners, path heads, routes and unconnected colors the search starts from."""
+        return self._empty_grid(), list(self.starts), [[start] for start in self.starts], set(range(len(self.colors)))
+
+    def _search(self, exhaustive: bool = False):
+        """
+        Depth-first search yielding the routes of every solution it reaches.
+
+        Unless ``exhaustive`` is set, a head next to its target always connects to it.
+        That keeps at least one solution but skips the others, so counting disables it.
+        Any paths may be widened by detours into free cells, so an exhaustive search only
+        yields solutions that fill every cell of the board.
+        """
+        owners, heads, routes, active = self._initial_state()
+        trail = []
+
+        def extend(color, cell):
+            trail.append((color, heads[color]))
+            routes[color].append(cell)
+            heads[color] = cell
+            if cell == self.targets[color]:
+                active.discard(color)
+            else:
+                owners[cell] = color
+
+        def undo(mark):
+            while len(trail) > mark:
+                color, previous_head = trail.pop()
+                cell = routes[color].pop()
+                if cell == self.targets[color]:
+                    active.add(color)
+                else:
+                    owners[cell] = FREE
+                heads[color] = previous_head
+
+        def moves(color):
+            target = self.targets[color]
+            result = []
+            for neighbour in self._neighbours(heads[color]):
+                if neighbour == target:
+                    if not exhaustive:
+                        return [target]
+                    result.append(target)
+                elif owners[neighbour] == FREE:
+                    result.append(neighbour)
+            return result
+
+        def propagate() -> bool:
+            changed = True
+            while changed:
+                changed = False
+                for color in list(active):
+                    options = moves(color)
+                    if not options:
+                        return False
+                    if len(options) == 1:
+                        self.stats.forced_moves += 1
+                        extend(color, options[0])
+                        changed = True
+            for color in active:
+                if not self._reachable(owners, heads[color], self.targets[color]):
+                    return False
+            return not exhaustive or self._coverable(owners, {heads[color] for color in active})
+
+        stack = []
+        ok = propagate()
+        while True:
+            self._tick()
+            self.stats.nodes += 1
+            if ok:
+                if not active:
+                    yield [list(route) for route in routes]
+                else:
+                    color, options = min(((c, moves(c)) for c in active), key=lambda item: len(item[1]))
+                    options.sort(key=lambda cell: self._distance(cell, self.targets[color]))
+                    self.stats.decisions += 1
+                    self.stats.branches += len(options)
+                    stack.append([len(trail), color, options, 0])
+
+            while stack:
+                frame = stack[-1]
+                mark, color, options, tried = frame
+                undo(mark)
+                if tried < len(options):
+                    frame[3] = tried + 1
+                    extend(color, options[tried])
+                    ok = propagate()
+                    break
+                stack.pop()
+                self.stats.backtracks += 1
+            else:
+                return
+
+    def _as_paths(self, routes):
+        paths = []
+        for color, route in enumerate(routes):
+            cells = [{'x': cell % self.columns, 'y': cell // self.columns} for cell in route]
+            paths.append({
+                'start': dict(cells[0]),
+                'end': dict(cells[-1]),
+                'color': {'hex_value': self.colors[color]},
+                'path': cells,
+            })
+        return paths
+
+    def _start_clock(self):
+        self._work = 0
+        self._expires_at = time.monotonic() + (self.deadline or 0)
+
+    def solve(self) -> SolverResult:
+        if not self.valid:
+            return SolverResult(UNSOLVABLE, stats=self.stats)
+        if not self.colors:
+            return SolverResult(SOLVABLE, [], self.stats)
+
+        self._start_clock()
+        try:
+            if not self._check_connectivity():
+                return SolverResult(UNSOLVABLE, stats=self.stats)
+            routes = self._greedy()
+            if routes is None:
+                routes = next(self._search(), None)
+        except _DeadlineExceeded:
+            return SolverResult(UNKNOWN, stats=self.stats)
+
+        if routes is None:
+            return SolverResult(UNSOLVABLE, stats=self.stats)
+        return SolverResult(SOLVABLE, self._as_paths(routes), self.stats)
+
+    def measure(self) -> SolverStats | None:
+        """
+        Search for a solution without the greedy shortcut and return the search statistics.
+
+        Returns ``None`` when the board has no solution or none is found before the deadline.
+        """
+        if not self.valid:
+            return None
+        if not self.colors:
+            return self.stats
+
+        self._start_clock()
+        try:
+            if not self._check_connectivity():
+                return None
+            routes = next(self._search(), None)
+        except _DeadlineExceeded:
+            return None
+        return self.stats if routes is not None else None
+
+    def count_solutions(self, limit: int = 2) -> tuple[int, bool]:
+        """
+        Count solutions filling the whole board, stopping as soon as ``limit`` of them are found.
+
+        Returns the count and whether it is exact, i.e. the search finished or hit the limit
+        before the deadline.
+        """
+        if not self.valid:
+            return 0, True
+        if not self.colors:
+            return 1, True
+
+        self._start_clock()
+        count = 0
+        try:
+            if not self._check_connectivity():
+                return 0, True
+            for _ in self._search(exhaustive=True):
+                count += 1
+                if count >= limit:
+                    break
+        except _DeadlineExceeded:
+            return count, False
+        return count, True
+
+    def check_uniqueness(self) -> str:
+        """
+        Whether exactly one solution fills the board, as in the classic puzzle.
+
+        A board no such solution exists for is reported ``UNSOLVABLE``.
+        """
+        count, exact = self.count_solutions(limit=2)
+        if count >= 2:
+            return MULTIPLE
+        if not exact:
+            return UNKNOWN
+        return UNIQUE if count == 1 else UNSOLVABLE
+
+
+class HintSolver(BoardSolver):
+    """
+    Continues a partial solution instead of solving the board from scratch.
+
+    The drawn paths are loaded as the starting state. Propagation from there reports the
+    moves the paths force, or the color that can no longer be connected; only when nothing
+    is forced does the depth-first search look for a solution continuing the paths.
+    """
+
+    def __init__(self, columns: int, rows: int, points, paths, deadline: float | None = DEFAULT_DEADLINE):
+        super().__init__(columns, rows, points, deadline)
+        if self.valid:
+            self._load_paths(paths)
+
+    def _load_paths(self, paths):
+        self.owners, self.heads, self.routes, self.active = super()._initial_state()
+        # Colors without a drawn path, whose first move is their board point
+        self.undrawn = set(range(len(self.colors)))
+        indexes = {color: index for index, color in enumerate(self.colors)}
+        seen = set()
+        for path in paths:
+            hex_value = path['color']['hex_value']
+            color = indexes.get(hex_value)
+            if color is None:
+                raise ValueError(f"Color {hex_value} is not on the board.")
+            if color in seen:
+                raise ValueError(f"Color {hex_value} must have exactly one path.")
+            seen.add(color)
+
+            cells = []
+            for point in path['path']:
+                x, y = point['x'], point['y']
+                if not (0 <= x < self.columns and 0 <= y < self.rows):
+                    raise ValueError(
+                        f"Point ({x}, {y}) is out of bounds for the grid dimensions ({self.columns}x{self.rows})."
+                    )
+                cells.append(y * self.columns + x)
+            if not cells:
+                continue
+            self.undrawn.discard(color)
+
+            # Paths may be drawn from either board point of their color
+            if cells[0] == self.targets[color]:
+                self.starts[color], self.targets[color] = self.targets[color], self.starts[color]
+                self.heads[color] = self.routes[color][0] = self.starts[color]
+            elif cells[0] != self.starts[color]:
+                raise ValueError(f"Path for color {hex_value} must start on a board point of its color.")
+
+            for cell in cells[1:]:
+                if color not in self.active:
+                    raise ValueError(f"Path for color {hex_value} is already connected.")
+                if self._distance(self.heads[color], cell) != 1:
+                    raise ValueError("Path must be continuous, with each point adjacent to the next.")
+                if cell != self.targets[color] and self.owners[cell] != FREE:
+                    raise ValueError(
+                        f"Cell ({cell % self.columns}, {cell // self.columns}) is already taken "
+                        f"by the path for color {self.colors[self.owners[cell]]}."
+                    )
+                self._extend(color, cell)
+
+    def _initial_state(self):
+        return array('i', self.owners), list(self.heads), [list(route) for route in self.routes], set(self.active)
+
+    def _extend(self, color: int, cell: int):
+        self.routes[color].append(cell)
+        self.heads[color] = cell
+        if cell == self.targets[color]:
+            self.active.discard(color)
+        else:
+            self.owners[cell] = color
+
+    def _moves(self, color: int):
+        target = self.targets[color]
+        result = []
+        for neighbour in self._neighbours(self.heads[color]):
+            if neighbour == target:
+                return [target]
+            if self.owners[neighbour] == FREE:
+                result.append(neighbour)
+        return result
+
+    def _plan(self, moves: list, color: int, cell: int):
+        for step in ((self.starts[color], cell) if color in self.undrawn else (cell,)):
+            moves.append((self.colors[color], step % self.columns, step // self.columns))
+        self.undrawn.discard(color)
+
+    def _propagate(self, forced: list) -> str | None:
+        """Apply forced moves until none is left; returns why the state is a dead end, if it is one."""
+        changed = True
+        while changed:
+            changed = False
+            for color in sorted(self.active):
+                self._tick()
+                options = self._moves(color)
+                if not options:
+                    return f"Path for color {self.colors[color]} is cut off."
+                if len(options) == 1:
+                    self.stats.forced_moves += 1
+                    self._plan(forced, color, options[0])
+                    self._extend(color, options[0])
+                    changed = True
+        for color in sorted(self.active):
+            if not self._reachable(self.owners, self.heads[color], self.targets[color]):
+                return f"Color {self.colors[color]} can no longer reach its partner."
+        return None
+
+    def hint(self) -> Hint:
+        if not self.valid:
+            return Hint(DEAD_END, reason="The board cannot be solved.")
+        if not self.active:
+            return Hint(SOLVED)
+
+        drawn = [len(route) for route in self.routes]
+        self._start_clock()
+        try:
+            forced = []
+            reason = self._propagate(forced)
+            if reason is not None:
+                return Hint(DEAD_END, reason=reason)
+            if forced:
+                return Hint(FORCED, forced)
+
+            routes = next(self._search(), None)
+        except _DeadlineExceeded:
+            return Hint(UNKNOWN)
+
+        if routes is None:
+            return Hint(DEAD_END, reason="No solution continues the drawn paths.")
+        moves = []
+        for color, route in enumerate(routes):
+            for cell in route[drawn[color]:]:
+                self._plan(moves, color, cell)
+        return Hint(SUGGESTED, moves)
+
+
+def hint(columns: int, rows: int, points, paths, deadline: float | None = DEFAULT_DEADLINE) -> Hint:
+    """
+    Find the next move for a partial solution, preferring moves forced by the drawn paths.
+
+    Raises ``ValueError`` when the paths are not a valid partial solution of the board.
+    """
+    return HintSolver(columns, rows, points, paths, deadline).hint()
+
+
+def difficulty(stats: SolverStats) -> float:
+    """
+    Score how hard the search found a board, 0 for a board that propagation alone solves.
+
+    The share of moves that had to be guessed rather than forced is weighted by the average
+    number of options per guess, and every doubling of the backtracks adds as much as a
+    board where every move is a guess between two options.
+    """
+    guessed = stats.decisions / (stats.decisions + stats.forced_moves) if stats.decisions else 0.0
+    branching = stats.branches / stats.decisions if stats.decisions else 1.0
+    return round(10 * guessed * branching / 2 + 10 * math.log2(1 + stats.backtracks), 2)
+
+
+def estimate_difficulty(columns: int, rows: int, points, deadline: float | None = DEFAULT_DEADLINE) -> float | None:
+    """Difficulty score of a board, or ``None`` when the search finds no solution in time."""
+    stats = BoardSolver(columns, rows, points, deadline).measure()
+    return difficulty(stats) if stats is not None else None
+
+
+def solve(columns: int, rows: int, points, deadline: float | None = DEFAULT_DEADLINE) -> SolverResult:
+    """Decide whether the board can be solved and return a witness solution if it can."""
+    return BoardSolver(columns, rows, points, deadline).solve()
+
+
+def check_uniqueness(columns: int, rows: int, points, deadline: float | None = DEFAULT_DEADLINE) -> str:
+    """Tell whether the board has exactly one solution, stopping at the second one found."""
+    return BoardSolver(columns, rows, points, deadline).check_uniqueness()
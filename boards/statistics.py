@@ -0,0 +1,58 @@
+from django.db.models import Case, Count, F, Min, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce, Least
+
+from .models import GameBoard, Solution
+from .validation import VERIFIED
+
+
+def _verified(**filters):
+    return Solution.objects.filter(status=VERIFIED, **filters)
+
+
+def _best_length_subquery(board_id):
+    return Subquery(
+        _verified(game_board=board_id).order_by().values('game_board').annotate(best=Min('length')).values('best')
+    )
+
+
+def record_change(solution, before: int | None, after: int | None):
+    """
+    Apply a change of one solution to the counters of its board.
+
+    ``before`` and ``after`` are the lengths of the solution when it counted, i.e. was
+    verified, before and after the change, and ``None`` when it did not. Counters move by
+    ``F()`` expressions in a single ``UPDATE``; only when the best solution gets worse or
+    disappears is the best length looked up again.
+    """
+    if before == after:
+        return
+
+    board_id = solution.game_board_id
+    changes = {}
+    if before is None or after is None:
+        step = 1 if before is None else -1
+        changes['solution_count'] = F('solution_count') + step
+        if not _verified(game_board=board_id, user=solution.user_id).exclude(pk=solution.pk).exists():
+            changes['solver_count'] = F('solver_count') + step
+
+    if after is not None and (before is None or after < before):
+        changes['best_solution_length'] = Least(Coalesce('best_solution_length', Value(after)), Value(after))
+    else:
+        changes['best_solution_length'] = Case(
+            When(best_solution_length=before, then=_best_length_subquery(board_id)),
+            default=F('best_solution_length'),
+        )
+
+    GameBoard.objects.filter(pk=board_id).update(**changes)
+
+
+def reconcile(game_boards=None) -> int:
+    """Recompute the counters of the given boards, or of all boards, from their solutions."""
+    if game_boards is None:
+        game_boards = GameBoard.objects.all()
+    verified = _verified(game_board=OuterRef('pk')).order_by().values('game_board')
+    return game_boards.update(
+        solution_count=Coalesce(Subquery(verified.annotate(count=Count('pk')).values('count')), 0),
+        solver_count=Coalesce(Subquery(verified.annotate(count=Count('user', distinct=True)).values('count')), 0),
+        best_solution_length=Subquery(verified.annotate(best=Min('length')).values('best')),
+    )
@@ -0,0 +1,250 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from boards import uniqueness
+from boards.models import GameBoard
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+
+
+class BoardViewsTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.other_user = User.objects.create_user(username="otheruser", password="otherpassword")
+        self.points = [
+            point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+            point(0, 2, '#0000ff'), point(2, 2, '#0000ff'),
+        ]
+        self.board = GameBoard.objects.create(
+            name="Test Board", user=self.user, columns=3, rows=3, points=self.points
+        )
+        self.board_url = f"/api/boards/{self.board.id}"
+        self.solve_url = f"/api/boards/{self.board.id}/solve"
+
+    def test_create_board_stores_solvability(self):
+        self.client.force_login(self.user)
+        data = {"name": "New Board", "columns": 3, "rows": 3, "points": self.points}
+        response = self.client.post("/api/boards/", data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["solvability"], "solvable")
+        self.assertEqual(GameBoard.objects.get(pk=response.data["id"]).solvability, "solvable")
+
+    def test_update_board_recomputes_solvability(self):
+        self.client.force_login(self.user)
+        crossing = [
+            point(0, 0, '#ff0000'), point(2, 2, '#ff0000'),
+            point(2, 0, '#0000ff'), point(0, 2, '#0000ff'),
+        ]
+        data = {"name": "Test Board", "columns": 3, "rows": 3, "points": crossing}
+        response = self.client.put(self.board_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["solvability"], "unsolvable")
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.version, 2)
+
+    def test_update_board_layout_resets_uniqueness(self):
+        GameBoard.objects.filter(pk=self.board.pk).update(uniqueness='unique', difficulty=3.0)
+        self.client.force_login(self.user)
+        data = {"name": "Test Board", "columns": 4, "rows": 4, "points": self.points}
+        response = self.client.put(self.board_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["uniqueness"], "unknown")
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.uniqueness, "unknown")
+
+    def test_rename_keeps_solver_results(self):
+        GameBoard.objects.filter(pk=self.board.pk).update(solvability='solvable', uniqueness='unique')
+        self.client.force_login(self.user)
+        data = {"name": "Renamed", "columns": 3, "rows": 3, "points": self.points}
+        with mock.patch('boards.models.solver.solve') as solve:
+            response = self.client.put(self.board_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        solve.assert_not_called()
+        self.assertEqual(response.data["uniqueness"], "unique")
+
+    def test_solve_board_returns_witness(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.solve_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "solvable")
+        self.assertEqual(len(response.data["paths"]), 2)
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.solvability, "solvable")
+
+    def test_solve_board_other_user_not_found(self):
+        self.client.force_login(self.other_user)
+        response = self.client.get(self.solve_url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data["error"], "Game board not found")
+
+    @override_settings(BOARDS_VERIFICATION_WORKERS=0, BOARDS_SOLVER_WORKERS=0)
+    def test_check_uniqueness_stores_result(self):
+        self.client.force_login(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f"/api/boards/{self.board.id}/uniqueness")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["uniqueness"], "checking")
+        self.assertEqual(response['Location'], f"/api/boards/{self.board.id}")
+        self.board.refresh_from_db()
+        # No solution fills the middle row
+        self.assertEqual(self.board.uniqueness, "unsolvable")
+
+    def test_check_uniqueness_runs_in_background(self):
+        self.client.force_login(self.user)
+        with mock.patch('boards.uniqueness.get_executor') as get_executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(f"/api/boards/{self.board.id}/uniqueness")
+
+        get_executor.return_value.submit.assert_called_once_with(uniqueness._run, self.board.id)
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.uniqueness, "checking")
+
+        with mock.patch('boards.solver.check_uniqueness', side_effect=RuntimeError("solver crashed")):
+            uniqueness._run(self.board.id)
+
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.uniqueness, "unknown")
+
+    def test_get_board_compact_encoding(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.board_url, {"encoding": "compact"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["points"]["format"], "points/v1")
+        self.assertEqual(response.data["points"]["palette"], ["#ff0000", "#0000ff"])
+
+    def test_get_board_default_encoding(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.board_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["points"], self.points)
+
+    def test_create_board_point_out_of_bounds(self):
+        self.client.force_login(self.user)
+        data = {"name": "New Board", "columns": 2, "rows": 3, "points": self.points}
+        response = self.client.post("/api/boards/", data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["points"],
+            ["Point (2, 0) is out of bounds for the grid dimensions (2x3)."]
+        )
+
+    def test_create_board_unpaired_color(self):
+        self.client.force_login(self.user)
+        data = {"name": "New Board", "columns": 3, "rows": 3, "points": self.points[:3]}
+        response = self.client.post("/api/boards/", data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["points"],
+            ["#0000ff has invalid number of points. Each color must have exactly 2 points."]
+        )
+
+    def test_get_board_not_modified(self):
+        self.client.force_login(self.user)
+        etag = self.client.get(self.board_url)['ETag']
+
+        response = self.client.get(self.board_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_update_board_invalidates_etag(self):
+        self.client.force_login(self.user)
+        etag = self.client.get(self.board_url)['ETag']
+        data = {"name": "Renamed", "columns": 3, "rows": 3, "points": self.points}
+        self.client.put(self.board_url, data, format='json')
+
+        response = self.client.get(self.board_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["name"], "Renamed")
+
+    def test_etag_differs_per_encoding(self):
+        self.client.force_login(self.user)
+        etag = self.client.get(self.board_url)['ETag']
+
+        response = self.client.get(f"{self.board_url}?encoding=compact", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_board_other_user_has_no_etag(self):
+        self.client.force_login(self.other_user)
+        response = self.client.get(self.board_url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn('ETag', response)
+
+
+@override_settings(BOARDS_PAGE_SIZE=2, BOARDS_MAX_PAGE_SIZE=3)
+class BoardListTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.other_user = User.objects.create_user(username="otheruser", password="otherpassword")
+        points = [point(0, 0, '#ff0000'), point(1, 0, '#ff0000')]
+        for index in range(5):
+            GameBoard.objects.create(name=f"Board {index}", user=self.user, columns=2, rows=1, points=points)
+        GameBoard.objects.create(name="Other", user=self.other_user, columns=2, rows=1, points=points)
+        self.client.force_login(self.user)
+
+    def collect(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 2)
+            ids.extend(board['id'] for board in response.data['results'])
+            url = response.data['next']
+        return ids
+
+    def test_list_pages_through_all_boards(self):
+        ids = self.collect("/api/boards/")
+
+        self.assertEqual(len(ids), 6)
+        self.assertEqual(set(ids), {str(pk) for pk in GameBoard.objects.values_list('pk', flat=True)})
+
+    def test_list_my_boards(self):
+        ids = self.collect("/api/boards/my/")
+
+        self.assertEqual(set(ids), {str(pk) for pk in GameBoard.objects.filter(user=self.user).values_list('pk', flat=True)})
+
+    def test_page_size_is_capped(self):
+        response = self.client.get("/api/boards/?page_size=100")
+
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_fields_projection_skips_points(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/boards/?fields=id,name")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data['results'][0]), {'id', 'name'})
+        self.assertNotIn('"points"', queries.captured_queries[-1]['sql'])
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get("/api/boards/?fields=id,owner")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"], "Unknown fields: owner")
+
+    def test_board_list_page_is_paginated(self):
+        response = self.client.get("/boards/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.context['game_boards']), 2)
+        self.assertIsNotNone(response.context['next_page_url'])
+        self.assertIsNone(response.context['previous_page_url'])
@@ -0,0 +1,295 @@
+from unittest import mock
+
+from django.db.models import F
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from boards import validation_cache, verification
+from boards.models import GameBoard, Solution
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+path = BoardHelper.path
+
+
+class SolutionAPIViewTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.board = GameBoard.objects.create(
+            name="Test Board",
+            user=self.user,
+            columns=3,
+            rows=3,
+            points=[
+                point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+                point(0, 2, '#0000ff'), point(2, 2, '#0000ff'),
+            ]
+        )
+        self.url = f"/api/boards/{self.board.id}/solutions"
+
+    def test_create_solution_success(self):
+        self.client.force_login(self.user)
+        data = {
+            "name": "Solution",
+            "paths": [
+                path('#ff0000', [(0, 0), (1, 0), (2, 0)]),
+                path('#0000ff', [(0, 2), (1, 2), (2, 2)]),
+            ]
+        }
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Solution.objects.filter(game_board=self.board).count(), 1)
+
+    def test_create_solution_crossing_paths(self):
+        self.client.force_login(self.user)
+        data = {
+            "name": "Solution",
+            "paths": [
+                path('#ff0000', [(0, 0), (1, 0), (2, 0)]),
+                path('#0000ff', [(0, 2), (0, 1), (1, 1), (1, 0)]),
+            ]
+        }
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['non_field_errors'],
+            ["Paths for colors #ff0000 and #0000ff cross each other"]
+        )
+        self.assertFalse(Solution.objects.exists())
+
+    def test_create_solution_without_paths(self):
+        self.client.force_login(self.user)
+        response = self.client.post(self.url, {"name": "Solution", "paths": []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['non_field_errors'],
+            ["Solution doesn't connect colors #0000ff, #ff0000"]
+        )
+        self.assertFalse(Solution.objects.exists())
+        self.assertEqual(self.client.get(f"/api/boards/{self.board.id}/leaderboard").data, [])
+
+    def test_create_solution_board_not_found(self):
+        self.client.force_login(self.user)
+        response = self.client.post("/api/boards/00000000-0000-0000-0000-000000000000/solutions", {}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data["error"], "Game board not found")
+
+
+@override_settings(BOARDS_VERIFICATION_WORKERS=0)
+class AsyncSolutionAPIViewTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.board = GameBoard.objects.create(
+            name="Test Board",
+            user=self.user,
+            columns=3,
+            rows=3,
+            points=[
+                point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+                point(0, 2, '#0000ff'), point(2, 2, '#0000ff'),
+            ]
+        )
+        self.url = f"/api/boards/{self.board.id}/solutions?async=true"
+        self.client.force_login(self.user)
+
+    def submit(self, paths):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, {"name": "Solution", "paths": paths}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['status'], 'pending')
+        self.assertEqual(response['Location'], response.data['job'])
+        return response
+
+    def test_create_solution_is_verified_in_background(self):
+        with mock.patch('notifications.signals.add_event') as add_event:
+            response = self.submit([
+                path('#ff0000', [(0, 0), (1, 0), (2, 0)]),
+                path('#0000ff', [(0, 2), (1, 2), (2, 2)]),
+            ])
+
+        (new_event, new_data), (event, data) = [call.args for call in add_event.call_args_list]
+        self.assertEqual(new_event, "newPath")
+        self.assertEqual(new_data["path_id"], str(response.data['id']))
+        self.assertEqual(new_data["board_name"], "Test Board")
+        self.assertEqual(event, "pathVerified")
+        self.assertEqual(data["path_id"], str(response.data['id']))
+        self.assertEqual(data["status"], 'verified')
+
+        job = self.client.get(response.data['job'])
+        self.assertEqual(job.status_code, status.HTTP_200_OK)
+        self.assertEqual(job.data['status'], 'verified')
+        self.assertEqual(job.data['rejection_reason'], '')
+
+    def test_incomplete_solution_is_rejected_in_background(self):
+        with mock.patch('notifications.signals.add_event') as add_event:
+            response = self.submit([path('#ff0000', [(0, 0), (1, 0), (2, 0)])])
+
+        self.assertEqual([call.args[0] for call in add_event.call_args_list], ["pathVerified"])
+
+        job = self.client.get(response.data['job'])
+        self.assertEqual(job.data['status'], 'rejected')
+        self.assertEqual(job.data['rejection_reason'], "Solution doesn't connect colors #0000ff")
+
+    def test_create_solution_is_rejected_in_background(self):
+        response = self.submit([
+            path('#ff0000', [(0, 0), (1, 0), (2, 0)]),
+            path('#0000ff', [(0, 2), (0, 1), (1, 1), (1, 0)]),
+        ])
+
+        job = self.client.get(response.data['job'])
+        self.assertEqual(job.data['status'], 'rejected')
+        self.assertEqual(job.data['rejection_reason'], "Paths for colors #ff0000 and #0000ff cross each other")
+
+    def test_malformed_solution_is_rejected_in_request(self):
+        response = self.client.post(self.url, {"name": "Solution", "paths": [{"color": {}}]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Solution.objects.exists())
+
+    def test_edit_solution_resets_status(self):
+        response = self.submit([path('#ff0000', [(0, 0), (1, 1)])])
+        solution_id = response.data['id']
+        self.assertEqual(Solution.objects.get(pk=solution_id).status, 'rejected')
+
+        with mock.patch('notifications.signals.add_event') as add_event, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(
+                f"/api/boards/{self.board.id}/solutions/{solution_id}?async=true",
+                {"name": "Solution", "paths": [
+                    path('#ff0000', [(0, 0), (1, 0), (2, 0)]),
+                    path('#0000ff', [(0, 2), (1, 2), (2, 2)]),
+                ]},
+                format='json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(Solution.objects.get(pk=solution_id).status, 'verified')
+        # Only a solution verified as it was first submitted is announced as a new path
+        self.assertEqual([call.args[0] for call in add_event.call_args_list], ["pathVerified"])
+
+    def test_status_of_other_users_solution_not_found(self):
+        response = self.submit([path('#ff0000', [(0, 0), (1, 0), (2, 0)])])
+        other = User.objects.create_user(username="other", password="testpassword")
+        self.client.force_login(other)
+
+        job = self.client.get(response.data['job'])
+        self.assertEqual(job.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(job.data["error"], "Solution not found")
+
+    @override_settings(BOARDS_VERIFICATION_WORKERS=2)
+    def test_verification_is_queued_on_worker_pool(self):
+        executor = mock.Mock()
+        with mock.patch.object(verification, 'get_executor', return_value=executor):
+            self.submit([
+                path('#ff0000', [(0, 0), (1, 0), (2, 0)]),
+                path('#0000ff', [(0, 2), (1, 2), (2, 2)]),
+            ])
+
+        solution = Solution.objects.get()
+        executor.submit.assert_called_once_with(verification._run, solution.pk)
+        self.assertEqual(solution.status, 'pending')
+        self.assertEqual(verification.verify_solution(solution.pk), 'verified')
+        self.assertIsNone(verification.verify_solution(solution.pk))
+
+
+class PatchSolutionAPIViewTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.board = GameBoard.objects.create(
+            name="Test Board",
+            user=self.user,
+            columns=3,
+            rows=3,
+            points=[
+                point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+                point(0, 2, '#0000ff'), point(2, 2, '#0000ff'),
+            ]
+        )
+        self.solution = Solution.objects.create(
+            name="Solution",
+            user=self.user,
+            game_board=self.board,
+            paths=[path('#ff0000', [(0, 0), (1, 0), (2, 0)])]
+        )
+        self.url = f"/api/boards/{self.board.id}/solutions/{self.solution.id}"
+        self.client.force_login(self.user)
+
+    def patch(self, paths):
+        return self.client.patch(self.url, {"paths": paths}, format='json')
+
+    def test_patch_appends_new_color(self):
+        response = self.patch([path('#0000ff', [(0, 2), (1, 2), (2, 2)])])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['length'], 6)
+        self.solution.refresh_from_db()
+        self.assertEqual([p['color']['hex_value'] for p in self.solution.paths], ['#ff0000', '#0000ff'])
+        self.assertEqual(self.solution.revision, 2)
+
+    def test_patch_replaces_only_given_color(self):
+        self.patch([path('#0000ff', [(0, 2), (1, 2), (2, 2)])])
+        response = self.patch([path('#0000ff', [(0, 2), (0, 1), (1, 1), (2, 1), (2, 2)])])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.solution.refresh_from_db()
+        self.assertEqual(self.solution.paths, [
+            path('#ff0000', [(0, 0), (1, 0), (2, 0)]),
+            path('#0000ff', [(0, 2), (0, 1), (1, 1), (2, 1), (2, 2)]),
+        ])
+        self.assertEqual(self.solution.length, 8)
+        self.assertEqual(self.solution.revision, 3)
+
+    def test_patch_crossing_paths(self):
+        response = self.patch([path('#0000ff', [(0, 2), (0, 1), (1, 1), (1, 0)])])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['non_field_errors'],
+            ["Paths for colors #ff0000 and #0000ff cross each other"]
+        )
+        self.solution.refresh_from_db()
+        self.assertEqual(len(self.solution.paths), 1)
+        self.assertEqual(self.solution.revision, 1)
+
+    def test_patch_reuses_grid_of_previous_edit(self):
+        self.patch([path('#0000ff', [(0, 2), (1, 2), (2, 2)])])
+        self.patch([path('#0000ff', [(0, 2), (0, 1), (1, 1), (2, 1), (2, 2)])])
+
+        with mock.patch('boards.validation_cache.validate_solution') as validate_solution:
+            response = self.patch([path('#0000ff', [(0, 2), (1, 2), (2, 2)])])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        validate_solution.assert_not_called()
+
+    def test_patch_after_board_edit_validates_whole_solution(self):
+        self.patch([path('#0000ff', [(0, 2), (1, 2), (2, 2)])])
+        GameBoard.objects.filter(pk=self.board.pk).update(version=F('version') + 1)
+
+        with mock.patch('boards.validation_cache.validate_solution',
+                        wraps=validation_cache.validate_solution) as validate_solution:
+            response = self.patch([path('#0000ff', [(0, 2), (0, 1), (1, 1), (2, 1), (2, 2)])])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        validate_solution.assert_called_once()
+
+    def test_patch_rejected_solution_is_verified_again(self):
+        Solution.objects.filter(pk=self.solution.pk).update(status='rejected', rejection_reason="Invalid")
+
+        response = self.patch([path('#0000ff', [(0, 2), (1, 2), (2, 2)])])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'verified')
+        self.assertEqual(Solution.objects.get(pk=self.solution.pk).rejection_reason, '')
+
+    def test_patch_name_only(self):
+        response = self.client.patch(self.url, {"name": "Renamed"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.solution.refresh_from_db()
+        self.assertEqual(self.solution.name, "Renamed")
+        self.assertEqual(self.solution.revision, 1)
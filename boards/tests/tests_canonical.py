@@ -0,0 +1,116 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from boards import difficulty
+from boards.canonical import SYMMETRIES, canonical_hash
+from boards.models import GameBoard
+from boards.solver import SolverResult
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+
+POINTS = [
+    point(0, 0, '#ff0000'), point(3, 1, '#ff0000'),
+    point(1, 0, '#0000ff'), point(0, 2, '#0000ff'),
+]
+
+
+class CanonicalHashTests(SimpleTestCase):
+    def test_symmetric_copies_share_hash(self):
+        expected = canonical_hash(4, 3, POINTS)
+        for transform, swaps in SYMMETRIES:
+            columns, rows = (3, 4) if swaps else (4, 3)
+            moved = [
+                point(*transform(p['x'], p['y'], 4, 3), p['color']['hex_value'])
+                for p in POINTS
+            ]
+            self.assertEqual(canonical_hash(columns, rows, moved), expected)
+
+    def test_recolored_copy_shares_hash(self):
+        recolored = [
+            point(p['x'], p['y'], {'#ff0000': '#00ff00', '#0000ff': '#ff0000'}[p['color']['hex_value']])
+            for p in POINTS
+        ]
+        self.assertEqual(canonical_hash(4, 3, recolored), canonical_hash(4, 3, POINTS))
+
+    def test_different_boards_differ(self):
+        moved = POINTS[:-1] + [point(1, 2, '#0000ff')]
+        self.assertNotEqual(canonical_hash(4, 3, moved), canonical_hash(4, 3, POINTS))
+        self.assertNotEqual(canonical_hash(5, 3, POINTS), canonical_hash(4, 3, POINTS))
+
+    def test_swapped_pairs_differ(self):
+        swapped = [
+            point(0, 0, '#ff0000'), point(3, 1, '#0000ff'),
+            point(1, 0, '#0000ff'), point(0, 2, '#ff0000'),
+        ]
+        self.assertNotEqual(canonical_hash(4, 3, swapped), canonical_hash(4, 3, POINTS))
+
+
+@override_settings(BOARDS_VERIFICATION_WORKERS=0, BOARDS_SOLVER_WORKERS=0)
+class DuplicateBoardTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_login(self.user)
+        self.original = GameBoard.objects.create(
+            name="Original", user=self.user, columns=4, rows=3, points=POINTS,
+            solvability='solvable', uniqueness='unique',
+        )
+        GameBoard.objects.filter(pk=self.original.pk).update(difficulty=7.5)
+        # Rotated by 90 degrees and recolored
+        self.rotated = [point(2 - p['y'], p['x'], '#00ff00' if p['color']['hex_value'] == '#ff0000' else '#ffff00')
+                        for p in POINTS]
+
+    def test_save_stores_canonical_hash(self):
+        self.assertEqual(self.original.canonical_hash, canonical_hash(4, 3, POINTS))
+
+    def test_create_reuses_results_of_duplicate(self):
+        data = {"name": "Copy", "columns": 3, "rows": 4, "points": self.rotated}
+        with mock.patch('boards.models.solver.solve') as solve:
+            response = self.client.post("/api/boards/", data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        solve.assert_not_called()
+        self.assertEqual(response.data['canonical_hash'], self.original.canonical_hash)
+        self.assertEqual(response.data['uniqueness'], 'unique')
+        self.assertEqual(response.data['difficulty'], 7.5)
+
+    def test_update_to_new_layout_does_not_keep_old_results(self):
+        moved = POINTS[:-1] + [point(1, 2, '#0000ff')]
+        data = {"name": "Original", "columns": 4, "rows": 3, "points": moved}
+        with mock.patch('boards.models.solver.solve', return_value=SolverResult('solvable')) as solve:
+            response = self.client.put(f"/api/boards/{self.original.id}", data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        solve.assert_called_once()
+        self.assertEqual(response.data['uniqueness'], 'unknown')
+
+    def test_update_to_known_layout_copies_results(self):
+        other = GameBoard.objects.create(name="Other", user=self.user, columns=2, rows=2, points=[])
+        data = {"name": "Other", "columns": 3, "rows": 4, "points": self.rotated}
+        with mock.patch('boards.models.solver.solve') as solve:
+            response = self.client.put(f"/api/boards/{other.id}", data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        solve.assert_not_called()
+        self.assertEqual(response.data['uniqueness'], 'unique')
+
+    def test_difficulty_is_copied_from_duplicate(self):
+        copy = GameBoard.objects.create(name="Copy", user=self.user, columns=3, rows=4, points=self.rotated)
+        with mock.patch('boards.difficulty.solver.estimate_difficulty') as estimate:
+            self.assertEqual(difficulty.refresh_difficulty(copy.pk), 7.5)
+        estimate.assert_not_called()
+
+    def test_command_fills_missing_hashes(self):
+        GameBoard.objects.create(name="Copy", user=self.user, columns=3, rows=4, points=self.rotated)
+        GameBoard.objects.update(canonical_hash='')
+        out = StringIO()
+        call_command('canonicalize_boards', stdout=out)
+
+        self.assertEqual(GameBoard.objects.filter(canonical_hash=self.original.canonical_hash).count(), 2)
+        self.assertIn("Filled 2 canonical hashes, found 1 duplicates of 1 boards.", out.getvalue())
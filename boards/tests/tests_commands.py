@@ -0,0 +1,220 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command, CommandError
+from django.test import TestCase, override_settings
+from boards.fields import EncodedValue
+from boards.models import GameBoard, Solution
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+
+
+class CheckUniquenessCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.unique_board = GameBoard.objects.create(
+            name="Unique", user=self.user, columns=4, rows=1,
+            points=[point(0, 0, '#ff0000'), point(3, 0, '#ff0000')]
+        )
+        self.open_board = GameBoard.objects.create(
+            name="Open", user=self.user, columns=3, rows=3,
+            points=[point(0, 0, '#ff0000'), point(2, 2, '#ff0000')]
+        )
+
+    def test_checks_given_boards(self):
+        out = StringIO()
+        call_command('check_uniqueness', str(self.unique_board.id), '--workers', '1', stdout=out)
+
+        self.unique_board.refresh_from_db()
+        self.open_board.refresh_from_db()
+        self.assertEqual(self.unique_board.uniqueness, 'unique')
+        self.assertEqual(self.open_board.uniqueness, 'unknown')
+        self.assertIn("Checked 1 boards.", out.getvalue())
+
+    def test_checks_all_boards(self):
+        call_command('check_uniqueness', '--all', '--workers', '2', stdout=StringIO())
+
+        self.unique_board.refresh_from_db()
+        self.open_board.refresh_from_db()
+        self.assertEqual(self.unique_board.uniqueness, 'unique')
+        self.assertEqual(self.open_board.uniqueness, 'multiple')
+
+    def test_requires_board_ids(self):
+        with self.assertRaises(CommandError):
+            call_command('check_uniqueness', stdout=StringIO())
+
+    @mock.patch('boards.management.commands.check_uniqueness.ProcessPoolExecutor', ThreadPoolExecutor)
+    def test_failed_board_is_skipped(self):
+        def check(columns, rows, points, deadline):
+            if rows == 1:
+                raise RuntimeError("solver crashed")
+            return 'multiple'
+
+        out, err = StringIO(), StringIO()
+        with mock.patch('boards.solver.check_uniqueness', side_effect=check):
+            call_command('check_uniqueness', '--all', '--batch-size', '1', stdout=out, stderr=err)
+
+        self.unique_board.refresh_from_db()
+        self.open_board.refresh_from_db()
+        self.assertEqual(self.unique_board.uniqueness, 'unknown')
+        self.assertEqual(self.open_board.uniqueness, 'multiple')
+        self.assertIn(f"{self.unique_board.pk}: failed (solver crashed)", err.getvalue())
+        self.assertIn("Checked 1 boards. 1 failed.", out.getvalue())
+
+
+class GenerateBoardsCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+
+    def test_generates_boards(self):
+        out = StringIO()
+        call_command(
+            'generate_boards', '12', '--user', 'testuser', '--size', '6x5', '--colors', '2-3',
+            '--batch-size', '5', '--workers', '2', '--seed', '1', stdout=out
+        )
+
+        boards = GameBoard.objects.filter(user=self.user)
+        self.assertEqual(boards.count(), 12)
+        for board in boards:
+            self.assertEqual((board.columns, board.rows), (6, 5))
+            self.assertIn(len(board.points), (4, 6))
+            self.assertEqual(board.solvability, 'solvable')
+            self.assertTrue(board.thumbnail.name)
+        self.assertIn("Created 12 boards", out.getvalue())
+
+    def test_unknown_user(self):
+        with self.assertRaises(CommandError):
+            call_command('generate_boards', '1', '--user', 'nobody', stdout=StringIO())
+
+    def test_invalid_size(self):
+        with self.assertRaises(CommandError):
+            call_command('generate_boards', '1', '--user', 'testuser', '--size', '5by5', stdout=StringIO())
+
+
+class ConvertBoardStorageCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        with override_settings(BOARDS_COMPACT_STORAGE=False):
+            self.board = GameBoard.objects.create(
+                name="Board", user=self.user, columns=3, rows=1,
+                points=[point(0, 0, '#ff0000'), point(2, 0, '#ff0000')]
+            )
+            self.solution = Solution.objects.create(
+                name="Solution", game_board=self.board, user=self.user,
+                paths=[BoardHelper.path('#ff0000', [(0, 0), (1, 0), (2, 0)])]
+            )
+
+    def test_converts_plain_rows(self):
+        out = StringIO()
+        call_command('convert_board_storage', stdout=out)
+
+        board = GameBoard.objects.get(pk=self.board.pk)
+        solution = Solution.objects.get(pk=self.solution.pk)
+        self.assertIsInstance(board.__dict__['points'], EncodedValue)
+        self.assertIsInstance(solution.__dict__['paths'], EncodedValue)
+        self.assertEqual(board.points, self.board.points)
+        self.assertEqual(solution.paths, self.solution.paths)
+        self.assertIn("Game Boards: converted 1 rows.", out.getvalue())
+
+    def test_converts_back_to_plain_json(self):
+        call_command('convert_board_storage', stdout=StringIO())
+        with override_settings(BOARDS_COMPACT_STORAGE=False):
+            call_command('convert_board_storage', stdout=StringIO())
+
+        board = GameBoard.objects.get(pk=self.board.pk)
+        self.assertIsInstance(board.__dict__['points'], list)
+        self.assertEqual(board.points, self.board.points)
+
+
+class RenderThumbnailsCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.board = GameBoard.objects.create(
+            name="Board", user=self.user, columns=3, rows=1,
+            points=[point(0, 0, '#ff0000'), point(2, 0, '#ff0000')]
+        )
+
+    def test_renders_missing_thumbnails(self):
+        GameBoard.objects.filter(pk=self.board.pk).update(thumbnail='')
+        out = StringIO()
+        call_command('render_thumbnails', stdout=out)
+
+        self.assertEqual(GameBoard.objects.get(pk=self.board.pk).thumbnail.name, self.board.thumbnail.name)
+        self.assertIn("Rendered 1 thumbnails.", out.getvalue())
+
+    def test_skips_current_thumbnails(self):
+        out = StringIO()
+        call_command('render_thumbnails', stdout=out)
+
+        self.assertIn("Rendered 0 thumbnails.", out.getvalue())
+
+
+class EstimateDifficultyCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.corridor = GameBoard.objects.create(
+            name="Corridor", user=self.user, columns=4, rows=1,
+            points=[point(0, 0, '#ff0000'), point(3, 0, '#ff0000')]
+        )
+        self.open_board = GameBoard.objects.create(
+            name="Open", user=self.user, columns=4, rows=4,
+            points=[point(0, 0, '#ff0000'), point(3, 3, '#ff0000')]
+        )
+
+    def test_estimates_missing_boards(self):
+        GameBoard.objects.filter(pk=self.corridor.pk).update(difficulty=99)
+        out = StringIO()
+        call_command('estimate_difficulty', '--missing', '--workers', '2', stdout=out)
+
+        self.corridor.refresh_from_db()
+        self.open_board.refresh_from_db()
+        self.assertEqual(self.corridor.difficulty, 99)
+        self.assertGreater(self.open_board.difficulty, 0)
+        self.assertIn("Estimated 1 boards.", out.getvalue())
+
+    def test_estimates_all_boards(self):
+        call_command('estimate_difficulty', '--all', '--workers', '1', stdout=StringIO())
+
+        self.corridor.refresh_from_db()
+        self.assertEqual(self.corridor.difficulty, 0.0)
+
+    def test_requires_selection(self):
+        with self.assertRaises(CommandError):
+            call_command('estimate_difficulty', stdout=StringIO())
+
+    @mock.patch('boards.management.commands.estimate_difficulty.ProcessPoolExecutor', ThreadPoolExecutor)
+    def test_failed_board_is_skipped(self):
+        def estimate(columns, rows, points, deadline):
+            if rows == 1:
+                raise RuntimeError("solver crashed")
+            return 2.5
+
+        out, err = StringIO(), StringIO()
+        with mock.patch('boards.solver.estimate_difficulty', side_effect=estimate):
+            call_command('estimate_difficulty', '--all', '--batch-size', '1', stdout=out, stderr=err)
+
+        self.corridor.refresh_from_db()
+        self.open_board.refresh_from_db()
+        self.assertIsNone(self.corridor.difficulty)
+        self.assertEqual(self.open_board.difficulty, 2.5)
+        self.assertIn(f"{self.corridor.pk}: failed (solver crashed)", err.getvalue())
+        self.assertIn("Estimated 1 boards. 1 failed.", out.getvalue())
+
+    @mock.patch('boards.management.commands.estimate_difficulty.ProcessPoolExecutor', ThreadPoolExecutor)
+    def test_board_edited_while_estimating_is_skipped(self):
+        def estimate(columns, rows, points, deadline):
+            board = GameBoard.objects.get(pk=self.corridor.pk)
+            board.points = [point(0, 0, '#ff0000'), point(2, 0, '#ff0000')]
+            board.save()
+            return 2.5
+
+        out = StringIO()
+        with mock.patch('boards.solver.estimate_difficulty', side_effect=estimate):
+            call_command('estimate_difficulty', str(self.corridor.pk), stdout=out)
+
+        self.corridor.refresh_from_db()
+        self.assertIsNone(self.corridor.difficulty)
+        self.assertIn("Estimated 0 boards.", out.getvalue())
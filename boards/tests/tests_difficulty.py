@@ -0,0 +1,138 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db.models import F
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from boards import difficulty, verification
+from boards.models import GameBoard
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+
+CORRIDOR = [point(0, 0, '#ff0000'), point(3, 0, '#ff0000')]
+
+
+@override_settings(BOARDS_VERIFICATION_WORKERS=0, BOARDS_SOLVER_WORKERS=0)
+class DifficultyRefreshTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_login(self.user)
+
+    def test_created_board_is_estimated(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            board = GameBoard.objects.create(name="Corridor", user=self.user, columns=4, rows=1, points=CORRIDOR)
+
+        board.refresh_from_db()
+        self.assertEqual(board.difficulty, 0.0)
+
+    def test_edited_layout_is_estimated_again(self):
+        board = GameBoard.objects.create(name="Corridor", user=self.user, columns=4, rows=1, points=CORRIDOR)
+        data = {"name": "Open", "columns": 4, "rows": 4, "points": [point(0, 0, '#ff0000'), point(3, 3, '#ff0000')]}
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(f"/api/boards/{board.id}", data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        board.refresh_from_db()
+        self.assertGreater(board.difficulty, 0)
+
+    def test_saving_other_fields_keeps_estimate(self):
+        board = GameBoard.objects.create(name="Corridor", user=self.user, columns=4, rows=1, points=CORRIDOR)
+        with mock.patch.object(difficulty, 'submit') as submit:
+            board.name = "Renamed"
+            board.save(update_fields=['name'])
+            board.name = "Renamed again"
+            board.save()
+            self.client.put(f"/api/boards/{board.id}", {
+                "name": "Renamed by request", "columns": 4, "rows": 1, "points": CORRIDOR
+            }, format='json')
+        submit.assert_not_called()
+
+    @override_settings(BOARDS_SOLVER_WORKERS=1)
+    def test_estimate_searches_in_solver_process(self):
+        board = GameBoard.objects.create(name="Corridor", user=self.user, columns=4, rows=1, points=CORRIDOR)
+
+        with mock.patch.object(verification, 'get_solver_executor',
+                               wraps=verification.get_solver_executor) as get_solver_executor:
+            self.assertEqual(difficulty.refresh_difficulty(board.pk), 0.0)
+
+        get_solver_executor.assert_called_once()
+        board.refresh_from_db()
+        self.assertEqual(board.difficulty, 0.0)
+
+    def test_estimate_of_replaced_layout_is_dropped(self):
+        board = GameBoard.objects.create(name="Corridor", user=self.user, columns=4, rows=1, points=CORRIDOR)
+
+        def edit_meanwhile(*args):
+            GameBoard.objects.filter(pk=board.pk).update(layout_version=F('layout_version') + 1)
+            return 1.5
+
+        with mock.patch('boards.difficulty.solver.estimate_difficulty', side_effect=edit_meanwhile):
+            self.assertEqual(difficulty.refresh_difficulty(board.pk), 1.5)
+
+        board.refresh_from_db()
+        self.assertIsNone(board.difficulty)
+
+
+class DifficultyListingTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.boards = {}
+        for name, score in (("Easy", 0.0), ("Hard", 40.0), ("Medium", 12.5), ("Unknown", None)):
+            board = GameBoard.objects.create(name=name, user=self.user, columns=4, rows=1, points=CORRIDOR)
+            GameBoard.objects.filter(pk=board.pk).update(difficulty=score)
+            self.boards[name] = str(board.pk)
+        self.client.force_login(self.user)
+
+    def names(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [board['name'] for board in response.data['results']]
+
+    def test_order_by_difficulty(self):
+        self.assertEqual(self.names(self.client.get("/api/boards/?ordering=difficulty")), ["Easy", "Medium", "Hard"])
+        self.assertEqual(self.names(self.client.get("/api/boards/?ordering=-difficulty")), ["Hard", "Medium", "Easy"])
+
+    def test_pages_keep_difficulty_order(self):
+        response = self.client.get("/api/boards/?ordering=difficulty&page_size=2")
+        self.assertEqual(self.names(response), ["Easy", "Medium"])
+        self.assertEqual(self.names(self.client.get(response.data['next'])), ["Hard"])
+
+    def test_pages_do_not_skip_boards_with_equal_difficulty(self):
+        for index in range(5):
+            board = GameBoard.objects.create(name=f"Tie {index}", user=self.user, columns=4, rows=1, points=CORRIDOR)
+            GameBoard.objects.filter(pk=board.pk).update(difficulty=12.5)
+
+        for ordering in ("difficulty", "-difficulty"):
+            names = []
+            url = f"/api/boards/?ordering={ordering}&page_size=2"
+            while url:
+                response = self.client.get(url)
+                names += self.names(response)
+                url = response.data['next']
+            self.assertEqual(len(names), 8)
+            self.assertEqual(len(set(names)), 8)
+
+            previous = self.client.get(self.client.get(response.data['previous']).data['next'])
+            self.assertEqual(self.names(previous), names[-2:])
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/api/boards/?ordering=difficulty&cursor=cD0xMi41fGJhZA==")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_filter_by_difficulty(self):
+        response = self.client.get("/api/boards/?ordering=difficulty&min_difficulty=10&max_difficulty=20")
+        self.assertEqual(self.names(response), ["Medium"])
+
+    def test_invalid_difficulty_bound(self):
+        response = self.client.get("/api/boards/?min_difficulty=hard")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], "min_difficulty must be a number.")
+
+    def test_board_page_orders_by_difficulty(self):
+        response = self.client.get("/boards/?ordering=-difficulty")
+
+        self.assertEqual([board.name for board in response.context['game_boards']], ["Hard", "Medium", "Easy"])
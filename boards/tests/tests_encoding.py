@@ -0,0 +1,85 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from boards import encoding
+from boards.fields import EncodedValue
+from boards.models import GameBoard, Solution
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+path = BoardHelper.path
+
+
+class EncodingTests(SimpleTestCase):
+    def test_points_round_trip(self):
+        points = [point(0, 0, '#ff0000'), point(999, 5, '#0000ff'), point(3, 999, '#ff0000')]
+        payload = encoding.encode_points(points)
+
+        self.assertEqual(payload['format'], encoding.POINTS_FORMAT)
+        self.assertEqual(payload['palette'], ['#ff0000', '#0000ff'])
+        self.assertEqual(encoding.decode_points(payload), points)
+
+    def test_points_with_unexpected_shape_are_not_encoded(self):
+        self.assertIsNone(encoding.encode_points([{'x': 1, 'y': 2}]))
+        self.assertIsNone(encoding.encode_points([point(-1, 0, '#ff0000')]))
+        self.assertIsNone(encoding.encode_points([point(1.5, 0, '#ff0000')]))
+        self.assertIsNone(encoding.encode_points({'x': 1}))
+
+    def test_paths_round_trip(self):
+        paths = [
+            path('#ff0000', [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2)]),
+            path('#0000ff', [(5, 5), (5, 4)]),
+        ]
+        payload = encoding.encode_paths(paths)
+
+        self.assertEqual(payload['paths'][0]['moves'], '2R2D1L')
+        self.assertEqual(payload['paths'][1]['moves'], '1U')
+        self.assertEqual(encoding.decode_paths(payload), paths)
+
+    def test_empty_path_round_trip(self):
+        paths = [path('#ff0000', [(0, 0)])]
+        paths[0]['path'] = []
+        self.assertEqual(encoding.decode_paths(encoding.encode_paths(paths)), paths)
+
+    def test_discontinuous_paths_are_not_encoded(self):
+        self.assertIsNone(encoding.encode_paths([path('#ff0000', [(0, 0), (2, 0)])]))
+
+
+class CompactFieldTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.points = [point(0, 0, '#ff0000'), point(2, 0, '#ff0000')]
+        self.paths = [path('#ff0000', [(0, 0), (1, 0), (2, 0)])]
+
+    def raw(self, table, column, pk):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT {column} FROM {table} WHERE id = %s", [pk.hex])
+            return cursor.fetchone()[0]
+
+    def test_values_are_stored_compact_and_decoded_lazily(self):
+        board = GameBoard.objects.create(name="Board", user=self.user, columns=3, rows=1, points=self.points)
+        solution = Solution.objects.create(name="Solution", game_board=board, user=self.user, paths=self.paths)
+
+        self.assertIn(encoding.POINTS_FORMAT, self.raw('boards_gameboard', 'points', board.pk))
+        self.assertIn(encoding.PATHS_FORMAT, self.raw('boards_solution', 'paths', solution.pk))
+
+        board = GameBoard.objects.get(pk=board.pk)
+        self.assertIsInstance(board.__dict__['points'], EncodedValue)
+        self.assertEqual(board.points, self.points)
+        self.assertEqual(Solution.objects.get(pk=solution.pk).paths, self.paths)
+
+    def test_saving_without_touching_value_keeps_payload(self):
+        board = GameBoard.objects.create(name="Board", user=self.user, columns=3, rows=1, points=self.points)
+        board = GameBoard.objects.get(pk=board.pk)
+        board.name = "Renamed"
+        board.save()
+
+        self.assertIsInstance(board.__dict__['points'], EncodedValue)
+        self.assertEqual(GameBoard.objects.get(pk=board.pk).points, self.points)
+
+    @override_settings(BOARDS_COMPACT_STORAGE=False)
+    def test_plain_json_is_still_readable(self):
+        board = GameBoard.objects.create(name="Board", user=self.user, columns=3, rows=1, points=self.points)
+
+        self.assertNotIn(encoding.POINTS_FORMAT, self.raw('boards_gameboard', 'points', board.pk))
+        self.assertEqual(GameBoard.objects.get(pk=board.pk).points, self.points)
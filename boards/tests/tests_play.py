@@ -0,0 +1,289 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db.models import F
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from boards import play, solver
+from boards.models import GameBoard, PlaySession, Solution
+from boards.play import PlayState
+from boards.validation import validate_solution
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+path = BoardHelper.path
+
+POINTS = [
+    point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+    point(0, 2, '#0000ff'), point(2, 2, '#0000ff'),
+]
+
+
+class PlayStateTests(SimpleTestCase):
+    def setUp(self):
+        self.state = PlayState(3, 3, POINTS)
+
+    def test_path_must_start_on_its_board_point(self):
+        with self.assertRaisesMessage(ValueError, "Path for color #ff0000 must start on a board point of its color."):
+            self.state.extend('#ff0000', 1, 0)
+
+    def test_path_must_be_continuous(self):
+        self.state.extend('#ff0000', 0, 0)
+        with self.assertRaisesMessage(ValueError, "Path must be continuous, with each point adjacent to the next."):
+            self.state.extend('#ff0000', 1, 1)
+
+    def test_path_cannot_enter_other_board_point(self):
+        self.state.extend('#ff0000', 0, 0)
+        self.state.extend('#ff0000', 0, 1)
+        with self.assertRaisesMessage(ValueError, "Cell (0, 2) is a board point of color #0000ff."):
+            self.state.extend('#ff0000', 0, 2)
+
+    def test_path_cannot_cross_other_path(self):
+        self.state.extend('#ff0000', 0, 0)
+        self.state.extend('#ff0000', 0, 1)
+        self.state.extend('#0000ff', 0, 2)
+        with self.assertRaisesMessage(ValueError, "Cell (0, 1) is already taken by the path for color #ff0000."):
+            self.state.extend('#0000ff', 0, 1)
+
+    def test_connected_path_cannot_be_extended(self):
+        for x in range(3):
+            self.state.extend('#ff0000', x, 0)
+        with self.assertRaisesMessage(ValueError, "Path for color #ff0000 is already connected."):
+            self.state.extend('#ff0000', 2, 1)
+        self.assertEqual(self.state.connected, 1)
+
+    def test_unknown_color(self):
+        with self.assertRaisesMessage(ValueError, "Color #00ff00 is not on the board."):
+            self.state.extend('#00ff00', 0, 0)
+
+    def test_undo_frees_cell_and_connection(self):
+        for x in range(3):
+            self.state.extend('#ff0000', x, 0)
+        self.state.undo('#ff0000')
+
+        self.assertEqual(self.state.connected, 0)
+        self.assertEqual(self.state.grid.owner(2, 0), 0)
+        self.state.extend('#ff0000', 2, 0)
+        self.assertEqual(self.state.connected, 1)
+
+    def test_replay_rebuilds_state(self):
+        log = ''.join([
+            self.state.extend('#ff0000', 0, 0),
+            self.state.extend('#ff0000', 0, 1),
+            self.state.undo('#ff0000'),
+            self.state.extend('#ff0000', 1, 0),
+        ])
+
+        replayed = PlayState(3, 3, POINTS)
+        replayed.replay(log)
+        self.assertEqual(replayed.to_paths(), self.state.to_paths())
+        self.assertEqual(replayed.move_count, 4)
+        self.assertEqual(list(replayed.grid.cells), list(self.state.grid.cells))
+
+
+class PlaySessionAPIViewTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.board = GameBoard.objects.create(name="Test Board", user=self.user, columns=3, rows=3, points=POINTS)
+        self.client.force_login(self.user)
+        play.state_cache.clear()
+
+    def start(self):
+        return self.client.post(f"/api/boards/{self.board.id}/play")
+
+    def move(self, session_id, color, x=None, y=None, undo=False):
+        data = {"color": color, "undo": undo}
+        if x is not None:
+            data.update(x=x, y=y)
+        return self.client.post(f"/api/boards/{self.board.id}/play/{session_id}/moves", data, format='json')
+
+    def play_all(self, session_id):
+        for color, row in (('#ff0000', 0), ('#0000ff', 2)):
+            for x in range(3):
+                response = self.move(session_id, color, x, row)
+        return response
+
+    def test_start_resumes_existing_session(self):
+        response = self.start()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        session_id = response.data['id']
+        self.move(session_id, '#ff0000', 0, 0)
+
+        response = self.start()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], session_id)
+        self.assertEqual(response.data['move_count'], 1)
+        self.assertEqual(response.data['paths'], [path('#ff0000', [(0, 0)])])
+
+    def test_completed_session_stores_verified_solution(self):
+        session_id = self.start().data['id']
+        response = self.play_all(session_id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['complete'])
+        solution = Solution.objects.get(pk=response.data['solution'])
+        self.assertEqual(solution.status, 'verified')
+        self.assertEqual(solution.user, self.user)
+        self.assertEqual(solution.length, 6)
+        validate_solution(3, 3, POINTS, solution.paths)
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.solution_count, 1)
+
+        response = self.move(session_id, '#ff0000', 1, 1)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_invalid_move_is_not_logged(self):
+        session_id = self.start().data['id']
+        self.move(session_id, '#ff0000', 0, 0)
+
+        response = self.move(session_id, '#ff0000', 2, 2)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], "Path must be continuous, with each point adjacent to the next.")
+        session = PlaySession.objects.get(pk=session_id)
+        self.assertEqual(session.move_count, 1)
+        self.assertEqual(len(session.moves), 8)
+
+    def test_moves_are_replayed_when_state_is_not_cached(self):
+        session_id = self.start().data['id']
+        self.move(session_id, '#ff0000', 0, 0)
+        self.move(session_id, '#ff0000', 1, 0)
+        self.move(session_id, '#ff0000', undo=True)
+        play.state_cache.clear()
+
+        response = self.client.get(f"/api/boards/{self.board.id}/play/{session_id}")
+        self.assertEqual(response.data['move_count'], 3)
+        self.assertEqual(response.data['paths'], [path('#ff0000', [(0, 0)])])
+
+        play.state_cache.clear()
+        response = self.move(session_id, '#ff0000', 0, 1)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['move_count'], 4)
+
+    def test_move_without_cell(self):
+        session_id = self.start().data['id']
+        response = self.move(session_id, '#ff0000')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_edited_board_restarts_session(self):
+        session_id = self.start().data['id']
+        self.move(session_id, '#ff0000', 0, 0)
+        self.board.columns = 4
+        self.board.save()
+
+        response = self.move(session_id, '#ff0000', 1, 0)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        response = self.start()
+        self.assertEqual(response.data['id'], session_id)
+        self.assertEqual(response.data['move_count'], 0)
+        self.assertEqual(response.data['paths'], [])
+
+    def test_metadata_update_keeps_session(self):
+        session_id = self.start().data['id']
+        self.move(session_id, '#ff0000', 0, 0)
+        with mock.patch.object(solver, 'check_uniqueness', return_value=solver.UNIQUE), \
+                self.settings(BOARDS_VERIFICATION_WORKERS=0, BOARDS_SOLVER_WORKERS=0), \
+                self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"/api/boards/{self.board.id}/uniqueness")
+        self.board.refresh_from_db()
+        self.board.name = "Renamed"
+        self.board.save()
+        GameBoard.objects.filter(pk=self.board.pk).update(version=F('version') + 1)
+
+        response = self.move(session_id, '#ff0000', 1, 0)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.start().data['move_count'], 2)
+
+    def test_session_of_other_user_not_found(self):
+        session_id = self.start().data['id']
+        other = User.objects.create_user(username="other", password="testpassword")
+        self.client.force_login(other)
+
+        response = self.move(session_id, '#ff0000', 0, 0)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get(f"/api/boards/{self.board.id}/play/{session_id}").status_code,
+                         status.HTTP_404_NOT_FOUND)
+
+    def test_delete_keeps_solution(self):
+        session_id = self.start().data['id']
+        solution_id = self.play_all(session_id).data['solution']
+
+        response = self.client.delete(f"/api/boards/{self.board.id}/play/{session_id}")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertTrue(Solution.objects.filter(pk=solution_id).exists())
+        self.assertEqual(self.start().status_code, status.HTTP_201_CREATED)
+
+
+class HintAPIViewTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.board = GameBoard.objects.create(
+            name="Stripes", user=self.user, columns=3, rows=2,
+            points=[
+                point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+                point(0, 1, '#0000ff'), point(2, 1, '#0000ff'),
+            ]
+        )
+        self.client.force_login(self.user)
+        play.state_cache.clear()
+        play.hint_cache.clear()
+        self.session_id = self.client.post(f"/api/boards/{self.board.id}/play").data['id']
+        self.hint_url = f"/api/boards/{self.board.id}/play/{self.session_id}/hint"
+
+    def move(self, color, x=None, y=None, undo=False):
+        data = {"color": color, "undo": undo}
+        if x is not None:
+            data.update(x=x, y=y)
+        return self.client.post(f"/api/boards/{self.board.id}/play/{self.session_id}/moves", data, format='json')
+
+    def test_hint_for_paths(self):
+        response = self.client.post(
+            f"/api/boards/{self.board.id}/hint", {"paths": [path('#ff0000', [(0, 0), (1, 0)])]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+            'status': 'forced', 'color': '#ff0000', 'x': 2, 'y': 0, 'reason': '',
+        })
+
+    def test_hint_for_invalid_paths(self):
+        response = self.client.post(
+            f"/api/boards/{self.board.id}/hint", {"paths": [path('#ff0000', [(0, 0), (2, 0)])]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], "Path must be continuous, with each point adjacent to the next.")
+
+    def test_following_hints_does_not_run_solver_again(self):
+        with mock.patch('boards.play.solver.hint', wraps=solver.hint) as run:
+            response = self.client.get(self.hint_url)
+            self.assertEqual((response.data['color'], response.data['x'], response.data['y']), ('#ff0000', 0, 0))
+
+            self.move('#ff0000', 0, 0)
+            self.move('#ff0000', 1, 0)
+            self.move('#0000ff', 0, 1)
+            response = self.client.get(self.hint_url)
+
+        self.assertEqual(response.data['status'], 'forced')
+        self.assertEqual((response.data['color'], response.data['x'], response.data['y']), ('#ff0000', 2, 0))
+        run.assert_called_once()
+
+    def test_leaving_plan_runs_solver_again(self):
+        with mock.patch('boards.play.solver.hint', wraps=solver.hint) as run:
+            self.client.get(self.hint_url)
+            self.move('#ff0000', 0, 0)
+            self.move('#ff0000', undo=True)
+            response = self.client.get(self.hint_url)
+
+        self.assertEqual((response.data['color'], response.data['x'], response.data['y']), ('#ff0000', 0, 0))
+        self.assertEqual(run.call_count, 2)
+
+    def test_hint_of_completed_session(self):
+        for color, row in (('#ff0000', 0), ('#0000ff', 1)):
+            for x in range(3):
+                self.move(color, x, row)
+
+        response = self.client.get(self.hint_url)
+        self.assertEqual(response.data['status'], 'solved')
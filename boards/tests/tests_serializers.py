@@ -0,0 +1,84 @@
+from django.test import SimpleTestCase
+from rest_framework import serializers
+from boards.serializers import FastListSerializer, PathSerializer, PointWithColorSerializer
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+path = BoardHelper.path
+
+
+class FastListSerializerTests(SimpleTestCase):
+    def run_both(self, child_class, data):
+        """Validate ``data`` with the fast list serializer and with DRF's default one."""
+        results = []
+        for serializer in (child_class(many=True, data=data),
+                           serializers.ListSerializer(child=child_class(), data=data)):
+            valid = serializer.is_valid()
+            results.append((valid, serializer.validated_data if valid else serializer.errors))
+        return results
+
+    def test_many_uses_fast_list_serializer(self):
+        self.assertIsInstance(PointWithColorSerializer(many=True), FastListSerializer)
+        self.assertIsInstance(PathSerializer(many=True), FastListSerializer)
+
+    def test_points_match_default_validation(self):
+        inputs = [
+            [point(0, 0, '#ff0000'), point(999, 999, '#00ff00')],
+            [point('5', 1, '#ff0000'), {'x': 1, 'y': 2, 'color': {'hex_value': '#ff0000'}, 'extra': 1}],
+            [point(-1, 0, '#ff0000'), point(1000, 0, '#ff0000'), point(1.5, 0, '#ff0000')],
+            [point(0, 0, 'ff0000'), point(0, 0, '#ff000 '), point(0, 0, None), point(True, 0, '#ff0000')],
+            [point(0, 0, '#ff00\ud800'), point(0, 0, '#\udfff000')],
+            [{'x': 1}, 'point', None, {'x': 1, 'y': 1, 'color': '#ff0000'}],
+            {'x': 1},
+            [],
+        ]
+        for data in inputs:
+            with self.subTest(data=data):
+                fast, default = self.run_both(PointWithColorSerializer, data)
+                self.assertEqual(fast, default)
+
+    def test_paths_match_default_validation(self):
+        valid = path('#ff0000', [(0, 0), (1, 0), (1, 1)])
+        coerced = path('#ff0000', [(0, 0), (1, 0)])
+        coerced['path'][1]['x'] = '1'
+        broken = path('#ff0000', [(0, 0), (1, 0)])
+        broken['path'][1] = {'x': -1}
+        inputs = [
+            [valid],
+            [valid, coerced],
+            [valid, broken, {'start': {'x': 0, 'y': 0}}],
+            ['path'],
+            'paths',
+        ]
+        for data in inputs:
+            with self.subTest(data=data):
+                fast, default = self.run_both(PathSerializer, data)
+                self.assertEqual(fast, default)
+
+    def test_validated_data_does_not_alias_input(self):
+        points = [point(0, 0, '#ff0000')]
+        paths = [path('#ff0000', [(0, 0), (1, 0)])]
+        point_serializer = PointWithColorSerializer(many=True, data=points)
+        path_serializer = PathSerializer(many=True, data=paths)
+        self.assertTrue(point_serializer.is_valid())
+        self.assertTrue(path_serializer.is_valid())
+
+        points[0]['color']['hex_value'] = '#00ff00'
+        paths[0]['path'][0]['x'] = 5
+        paths[0]['start']['x'] = 5
+
+        self.assertEqual(point_serializer.validated_data, [point(0, 0, '#ff0000')])
+        self.assertEqual(path_serializer.validated_data, [path('#ff0000', [(0, 0), (1, 0)])])
+
+    def test_representation_matches_default(self):
+        points = [point(0, 0, '#ff0000'), {'x': 1, 'y': 2, 'color': {'hex_value': '#ff0000'}, 'extra': 1}]
+        paths = [path('#ff0000', [(0, 0), (1, 0), (1, 1)])]
+
+        self.assertEqual(
+            PointWithColorSerializer(points, many=True).data,
+            serializers.ListSerializer(points, child=PointWithColorSerializer()).data
+        )
+        self.assertEqual(
+            PathSerializer(paths, many=True).data,
+            serializers.ListSerializer(paths, child=PathSerializer()).data
+        )
@@ -0,0 +1,214 @@
+import os
+import subprocess
+import sys
+
+from django.test import SimpleTestCase
+from boards.solver import BoardSolver, check_uniqueness, solve, SOLVABLE, UNSOLVABLE, UNKNOWN, UNIQUE, MULTIPLE
+from boards.solver import hint, estimate_difficulty, DEAD_END, FORCED, SOLVED, SUGGESTED
+from boards.generator import generate_board, generate_points, EASY, MEDIUM, HARD
+from boards.validation import validate_solution
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+path = BoardHelper.path
+
+
+class SolverTests(SimpleTestCase):
+    def test_solvable_board_returns_valid_witness(self):
+        points = [
+            point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+            point(0, 2, '#0000ff'), point(2, 2, '#0000ff'),
+        ]
+        result = solve(3, 3, points)
+
+        self.assertEqual(result.status, SOLVABLE)
+        self.assertEqual(len(result.paths), 2)
+        validate_solution(3, 3, points, result.paths)
+
+    def test_search_finds_solution_when_greedy_routing_fails(self):
+        # The shortest red path blocks blue, so red has to take the long way round
+        points = [
+            point(0, 1, '#ff0000'), point(2, 1, '#ff0000'),
+            point(1, 0, '#0000ff'), point(1, 2, '#0000ff'),
+        ]
+        result = solve(4, 3, points)
+
+        self.assertEqual(result.status, SOLVABLE)
+        validate_solution(4, 3, points, result.paths)
+
+    def test_crossing_pairs_are_unsolvable(self):
+        points = [
+            point(0, 0, '#ff0000'), point(2, 2, '#ff0000'),
+            point(2, 0, '#0000ff'), point(0, 2, '#0000ff'),
+        ]
+        result = solve(3, 3, points)
+
+        self.assertEqual(result.status, UNSOLVABLE)
+        self.assertIsNone(result.paths)
+
+    def test_enclosed_pair_is_unsolvable(self):
+        points = [
+            point(0, 0, '#ff0000'), point(4, 0, '#ff0000'),
+            point(1, 0, '#0000ff'), point(1, 2, '#0000ff'),
+        ]
+        self.assertEqual(solve(5, 3, points).status, UNSOLVABLE)
+
+    def test_invalid_color_count_is_unsolvable(self):
+        points = [point(0, 0, '#ff0000')]
+        self.assertEqual(solve(3, 3, points).status, UNSOLVABLE)
+
+    def test_empty_board_is_solvable(self):
+        result = solve(3, 3, [])
+        self.assertEqual(result.status, SOLVABLE)
+        self.assertEqual(result.paths, [])
+
+    def test_deadline_exceeded_is_unknown(self):
+        points = [point(0, 0, '#ff0000'), point(999, 999, '#ff0000')]
+        self.assertEqual(solve(1000, 1000, points, deadline=0.01).status, UNKNOWN)
+
+
+class UniquenessTests(SimpleTestCase):
+    def test_single_corridor_is_unique(self):
+        points = [point(0, 0, '#ff0000'), point(3, 0, '#ff0000')]
+        self.assertEqual(check_uniqueness(4, 1, points), UNIQUE)
+
+    def test_open_board_has_multiple_solutions(self):
+        points = [point(0, 0, '#ff0000'), point(2, 2, '#ff0000')]
+        self.assertEqual(check_uniqueness(3, 3, points), MULTIPLE)
+
+    def test_detours_are_not_counted_as_solutions(self):
+        points = [
+            point(2, 1, '#ff0000'), point(1, 2, '#ff0000'),
+            point(2, 0, '#0000ff'), point(3, 2, '#0000ff'),
+            point(3, 3, '#00ff00'), point(1, 1, '#00ff00'),
+        ]
+        self.assertEqual(solve(4, 4, points).status, SOLVABLE)
+        self.assertEqual(check_uniqueness(4, 4, points), UNIQUE)
+
+    def test_board_that_cannot_be_filled(self):
+        points = [point(0, 0, '#ff0000'), point(1, 1, '#ff0000')]
+        self.assertEqual(solve(2, 2, points).status, SOLVABLE)
+        self.assertEqual(check_uniqueness(2, 2, points), UNSOLVABLE)
+
+    def test_filled_board_is_unique(self):
+        points = [
+            point(0, 0, '#ff0000'), point(1, 0, '#ff0000'),
+            point(0, 1, '#0000ff'), point(1, 1, '#0000ff'),
+        ]
+        self.assertEqual(check_uniqueness(2, 2, points), UNIQUE)
+
+    def test_unsolvable_board(self):
+        points = [
+            point(0, 0, '#ff0000'), point(2, 2, '#ff0000'),
+            point(2, 0, '#0000ff'), point(0, 2, '#0000ff'),
+        ]
+        self.assertEqual(check_uniqueness(3, 3, points), UNSOLVABLE)
+
+    def test_counter_stops_at_limit(self):
+        points = [point(0, 0, '#ff0000'), point(3, 0, '#ff0000')]
+        count, exact = BoardSolver(4, 4, points).count_solutions(limit=5)
+        self.assertEqual(count, 5)
+        self.assertTrue(exact)
+
+    def test_deadline_exceeded_is_unknown(self):
+        points = [point(0, 0, '#ff0000'), point(999, 999, '#ff0000')]
+        self.assertEqual(check_uniqueness(1000, 1000, points, deadline=0.01), UNKNOWN)
+
+
+
+class HintTests(SimpleTestCase):
+    STRIPES = [
+        point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+        point(0, 1, '#0000ff'), point(2, 1, '#0000ff'),
+    ]
+    CORNERS = [
+        point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+        point(0, 2, '#0000ff'), point(2, 2, '#0000ff'),
+    ]
+
+    def test_forced_moves_are_planned_in_order(self):
+        result = hint(3, 2, self.STRIPES, [])
+
+        self.assertEqual(result.status, FORCED)
+        self.assertEqual((result.color, result.x, result.y), ('#ff0000', 0, 0))
+        self.assertEqual(result.moves, [
+            ('#ff0000', 0, 0), ('#ff0000', 1, 0), ('#0000ff', 0, 1), ('#0000ff', 1, 1),
+            ('#ff0000', 2, 0), ('#0000ff', 2, 1),
+        ])
+
+    def test_search_continues_drawn_paths(self):
+        points = [
+            point(0, 0, '#ff0000'), point(3, 0, '#ff0000'),
+            point(0, 3, '#0000ff'), point(3, 3, '#0000ff'),
+        ]
+        result = hint(4, 4, points, [path('#0000ff', [(3, 3), (2, 3)])])
+
+        self.assertEqual(result.status, SUGGESTED)
+        self.assertEqual(result.moves[0], ('#ff0000', 0, 0))
+        self.assertEqual(result.moves[-1], ('#0000ff', 0, 3))
+        self.assertNotIn(('#0000ff', 3, 3), result.moves)
+
+    def test_cut_off_path_is_dead_end(self):
+        result = hint(3, 3, self.CORNERS, [path('#ff0000', [(0, 0), (0, 1), (1, 1), (1, 2)])])
+
+        self.assertEqual(result.status, DEAD_END)
+        self.assertEqual(result.reason, "Path for color #ff0000 is cut off.")
+        self.assertIsNone(result.color)
+
+    def test_connected_paths_are_solved(self):
+        paths = [path('#ff0000', [(0, 0), (1, 0), (2, 0)]), path('#0000ff', [(0, 1), (1, 1), (2, 1)])]
+        self.assertEqual(hint(3, 2, self.STRIPES, paths).status, SOLVED)
+
+    def test_invalid_partial_paths(self):
+        with self.assertRaisesMessage(ValueError, "Path for color #ff0000 must start on a board point of its color."):
+            hint(3, 3, self.CORNERS, [path('#ff0000', [(1, 0), (1, 1)])])
+        with self.assertRaisesMessage(ValueError, "Cell (0, 1) is already taken by the path for color #ff0000."):
+            hint(3, 3, self.CORNERS, [
+                path('#ff0000', [(0, 0), (0, 1)]), path('#0000ff', [(0, 2), (0, 1)]),
+            ])
+
+
+
+class DifficultyTests(SimpleTestCase):
+    def test_board_solved_by_propagation_scores_zero(self):
+        points = [point(0, 0, '#ff0000'), point(3, 0, '#ff0000')]
+        self.assertEqual(estimate_difficulty(4, 1, points), 0.0)
+
+    def test_guessing_raises_difficulty(self):
+        corridor = [point(0, 0, '#ff0000'), point(3, 0, '#ff0000')]
+        open_board = [point(0, 0, '#ff0000'), point(3, 3, '#ff0000')]
+        self.assertGreater(estimate_difficulty(4, 4, open_board), estimate_difficulty(4, 1, corridor))
+
+    def test_unsolvable_board_has_no_difficulty(self):
+        points = [
+            point(0, 0, '#ff0000'), point(2, 2, '#ff0000'),
+            point(2, 0, '#0000ff'), point(0, 2, '#0000ff'),
+        ]
+        self.assertIsNone(estimate_difficulty(3, 3, points))
+
+
+class GeneratorTests(SimpleTestCase):
+    def test_generated_board_is_solved_by_its_walks(self):
+        for difficulty in (EASY, MEDIUM, HARD):
+            points, paths = generate_board(8, 8, 4, difficulty, seed=42)
+
+            self.assertEqual(len(points), 8)
+            validate_solution(8, 8, points, paths)
+
+    def test_generation_is_reproducible(self):
+        self.assertEqual(generate_points(6, 6, 3, seed=7), generate_points(6, 6, 3, seed=7))
+
+    def test_generation_does_not_depend_on_hash_seed(self):
+        code = "from boards.generator import generate_points; print(generate_points(6, 6, 5, seed=7))"
+        outputs = {
+            subprocess.run(
+                [sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                env={**os.environ, 'PYTHONHASHSEED': hash_seed},
+            ).stdout
+            for hash_seed in ('1', '2', '3')
+        }
+
+        self.assertEqual(len(outputs), 1)
+
+    def test_too_many_colors_do_not_fit(self):
+        self.assertIsNone(generate_points(2, 1, 2, seed=1))
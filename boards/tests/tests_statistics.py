@@ -0,0 +1,158 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from boards.models import GameBoard, Solution
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+path = BoardHelper.path
+
+
+class BoardStatisticsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.other_user = User.objects.create_user(username="otheruser", password="otherpassword")
+        self.board = GameBoard.objects.create(
+            name="Board", user=self.user, columns=3, rows=2,
+            points=[point(0, 0, '#ff0000'), point(2, 0, '#ff0000')]
+        )
+        self.short = [path('#ff0000', [(0, 0), (1, 0), (2, 0)])]
+        self.long = [path('#ff0000', [(0, 0), (0, 1), (1, 1), (2, 1), (2, 0)])]
+
+    def solve(self, user, paths, **kwargs):
+        return Solution.objects.create(name="Solution", game_board=self.board, user=user, paths=paths, **kwargs)
+
+    def assertStatistics(self, solution_count, solver_count, best_solution_length):
+        board = GameBoard.objects.get(pk=self.board.pk)
+        self.assertEqual(
+            (board.solution_count, board.solver_count, board.best_solution_length),
+            (solution_count, solver_count, best_solution_length)
+        )
+
+    def test_created_solutions_are_counted(self):
+        self.solve(self.user, self.long)
+        self.assertStatistics(1, 1, 5)
+
+        self.solve(self.user, self.short)
+        self.assertStatistics(2, 1, 3)
+
+        self.solve(self.other_user, self.long)
+        self.assertStatistics(3, 2, 3)
+
+    def test_deleting_best_solution_finds_next_best(self):
+        best = self.solve(self.user, self.short)
+        self.solve(self.other_user, self.long)
+
+        Solution.objects.get(pk=best.pk).delete()
+        self.assertStatistics(1, 1, 5)
+
+        Solution.objects.all().delete()
+        self.assertStatistics(0, 0, None)
+
+    def test_deleting_board_does_not_update_it_per_solution(self):
+        for _ in range(20):
+            self.solve(self.other_user, self.long)
+
+        # Loading the board and collecting its solutions and sessions does not depend on their number
+        with self.assertNumQueries(6):
+            GameBoard.objects.get(pk=self.board.pk).delete()
+
+        self.assertFalse(Solution.objects.exists())
+
+    def test_deleting_user_reconciles_boards_they_solved(self):
+        own_board = GameBoard.objects.create(
+            name="Own board", user=self.other_user, columns=3, rows=2,
+            points=[point(0, 0, '#ff0000'), point(2, 0, '#ff0000')]
+        )
+        Solution.objects.create(name="Solution", game_board=own_board, user=self.user, paths=self.short)
+        self.solve(self.user, self.long)
+        self.solve(self.other_user, self.short)
+        self.solve(self.other_user, self.short)
+
+        self.other_user.delete()
+
+        self.assertFalse(GameBoard.objects.filter(pk=own_board.pk).exists())
+        self.assertStatistics(1, 1, 5)
+
+    def test_edited_solution_updates_best_length(self):
+        solution = self.solve(self.user, self.short)
+        self.solve(self.other_user, self.long)
+
+        solution = Solution.objects.get(pk=solution.pk)
+        solution.paths = [path('#ff0000', [(0, 0), (0, 1), (1, 1), (2, 1), (2, 0), (1, 0)])]
+        solution.save()
+        self.assertStatistics(2, 2, 5)
+
+    def test_only_verified_solutions_are_counted(self):
+        solution = self.solve(self.user, self.short, status='pending')
+        self.assertStatistics(0, 0, None)
+
+        solution = Solution.objects.get(pk=solution.pk)
+        solution.status = 'verified'
+        solution.save(update_fields=['status'])
+        self.assertStatistics(1, 1, 3)
+
+        solution.status = 'rejected'
+        solution.save(update_fields=['status'])
+        self.assertStatistics(0, 0, None)
+
+    def test_reconcile_command_repairs_drift(self):
+        self.solve(self.user, self.short)
+        self.solve(self.other_user, self.long)
+        Solution.objects.update(length=None)
+        GameBoard.objects.update(solution_count=7, solver_count=0, best_solution_length=1)
+
+        out = StringIO()
+        call_command('reconcile_board_statistics', stdout=out)
+
+        self.assertStatistics(2, 2, 3)
+        self.assertIn("Filled 2 solution lengths, reconciled 1 boards.", out.getvalue())
+
+
+@override_settings(BOARDS_LEADERBOARD_SIZE=2)
+class LeaderboardTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.board = GameBoard.objects.create(
+            name="Board", user=self.user, columns=3, rows=2,
+            points=[point(0, 0, '#ff0000'), point(2, 0, '#ff0000')]
+        )
+        self.url = f"/api/boards/{self.board.id}/leaderboard"
+        self.client.force_login(self.user)
+
+    def solve(self, username, cells, **kwargs):
+        user = User.objects.create_user(username=username, password="testpassword")
+        return Solution.objects.create(
+            name=username, game_board=self.board, user=user, paths=[path('#ff0000', cells)], **kwargs
+        )
+
+    def test_shortest_solutions_first(self):
+        self.solve("long", [(0, 0), (0, 1), (1, 1), (2, 1), (2, 0)])
+        short = self.solve("short", [(0, 0), (1, 0), (2, 0)])
+        self.solve("pending", [(0, 0), (1, 0), (2, 0)], status='pending')
+        self.solve("longest", [(0, 0), (0, 1), (1, 1), (1, 0), (1, 1), (2, 1), (2, 0)])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry['user']['username'] for entry in response.data], ["short", "long"])
+        self.assertEqual(response.data[0], {
+            'rank': 1, 'id': str(short.id), 'name': "short", 'user': {'username': "short"}, 'length': 3
+        })
+
+    def test_limit_is_capped(self):
+        for index in range(3):
+            self.solve(f"user{index}", [(0, 0), (1, 0), (2, 0)])
+
+        self.assertEqual(len(self.client.get(f"{self.url}?limit=1").data), 1)
+        self.assertEqual(len(self.client.get(f"{self.url}?limit=50").data), 2)
+
+    def test_board_not_found(self):
+        response = self.client.get("/api/boards/00000000-0000-0000-0000-000000000000/leaderboard")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data["error"], "Game board not found")
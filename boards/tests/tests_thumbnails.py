@@ -0,0 +1,82 @@
+from io import BytesIO
+
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+from django.test import TestCase
+from PIL import Image
+
+from boards.models import GameBoard
+from boards.thumbnails import render_thumbnail, thumbnail_name
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+
+
+class ThumbnailTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.points = [point(0, 0, '#ff0000'), point(2, 0, '#ff0000')]
+
+    def create_board(self, **kwargs):
+        return GameBoard.objects.create(
+            **{'name': "Board", 'user': self.user, 'columns': 3, 'rows': 2, 'points': self.points, **kwargs}
+        )
+
+    def test_render_thumbnail_keeps_aspect_ratio(self):
+        with self.settings(BOARDS_THUMBNAIL_SIZE=90):
+            image = Image.open(BytesIO(render_thumbnail(3, 2, self.points)))
+
+        self.assertEqual(image.size, (90, 60))
+        self.assertEqual(image.getpixel((15, 15)), (255, 0, 0))
+
+    def test_render_thumbnail_keeps_points_on_large_boards(self):
+        points = [point(999, 999, '#00ff00'), point(0, 0, '#00ff00')]
+        with self.settings(BOARDS_THUMBNAIL_SIZE=100):
+            image = Image.open(BytesIO(render_thumbnail(1000, 1000, points)))
+
+        self.assertEqual(image.getpixel((99, 99)), (0, 255, 0))
+
+    def test_thumbnail_is_rendered_on_save(self):
+        board = self.create_board()
+
+        self.assertEqual(board.thumbnail.name, thumbnail_name(3, 2, self.points))
+        self.assertTrue(default_storage.exists(board.thumbnail.name))
+
+    def test_identical_boards_share_thumbnail(self):
+        self.assertEqual(self.create_board().thumbnail.name, self.create_board(name="Copy").thumbnail.name)
+
+    def test_thumbnail_follows_point_changes_only(self):
+        board = self.create_board()
+        first = board.thumbnail.name
+
+        board.name = "Renamed"
+        board.uniqueness = 'unique'
+        board.save(update_fields=['name', 'uniqueness'])
+        self.assertEqual(GameBoard.objects.get(pk=board.pk).thumbnail.name, first)
+
+        board.points = [point(0, 1, '#ff0000'), point(2, 1, '#ff0000')]
+        board.save(update_fields=['points'])
+        self.assertNotEqual(GameBoard.objects.get(pk=board.pk).thumbnail.name, first)
+
+    def test_new_thumbnail_settings_are_no_layout_change(self):
+        board = self.create_board()
+        first = board.thumbnail.name
+
+        with self.settings(BOARDS_THUMBNAIL_SIZE=90):
+            board.name = "Renamed"
+            board.save()
+
+        board.refresh_from_db()
+        self.assertNotEqual(board.thumbnail.name, first)
+        self.assertEqual(board.layout_version, 1)
+
+        board.points = [point(0, 1, '#ff0000'), point(2, 1, '#ff0000')]
+        board.save()
+        board.refresh_from_db()
+        self.assertEqual(board.layout_version, 2)
+
+    def test_list_page_shows_thumbnails(self):
+        board = self.create_board()
+        response = self.client.get("/boards/")
+
+        self.assertContains(response, board.thumbnail.url)
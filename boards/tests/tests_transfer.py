@@ -0,0 +1,158 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+from rest_framework.test import APITestCase
+
+from boards.models import GameBoard, Solution
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+path = BoardHelper.path
+
+POINTS = [
+    point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+    point(0, 2, '#0000ff'), point(2, 2, '#0000ff'),
+]
+PATHS = [path('#ff0000', [(0, 0), (1, 0), (2, 0)]), path('#0000ff', [(0, 2), (1, 2), (2, 2)])]
+
+
+class TransferCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.board = GameBoard.objects.create(
+            name="Board", user=self.user, columns=3, rows=3, points=POINTS, solvability='solvable'
+        )
+        self.solution = Solution.objects.create(name="Solution", user=self.user, game_board=self.board, paths=PATHS)
+
+    def export(self, *args):
+        out = StringIO()
+        call_command('export_boards', *args, stdout=out)
+        return out.getvalue()
+
+    def import_lines(self, lines, *args):
+        with tempfile.NamedTemporaryFile('w', suffix='.ndjson', delete=False) as file:
+            file.write(lines)
+        self.addCleanup(os.remove, file.name)
+        out = StringIO()
+        call_command('import_boards', file.name, *args, stdout=out)
+        return out.getvalue()
+
+    def test_export_writes_one_record_per_line(self):
+        records = [json.loads(line) for line in self.export().splitlines()]
+
+        self.assertEqual([record['type'] for record in records], ['board', 'solution'])
+        self.assertEqual(records[0]['points'], POINTS)
+        self.assertEqual(records[0]['user'], 'testuser')
+        self.assertEqual(records[1]['board'], str(self.board.id))
+        self.assertEqual(records[1]['paths'], PATHS)
+
+    def test_round_trip(self):
+        for compact in ([], ['--compact']):
+            with self.subTest(compact=compact):
+                lines = self.export(*compact)
+                Solution.objects.all().delete()
+                GameBoard.objects.all().delete()
+
+                out = self.import_lines(lines, '--batch-size', '1')
+
+                self.assertIn("Imported 1 boards and 1 solutions", out)
+                board = GameBoard.objects.get(pk=self.board.pk)
+                self.assertEqual(board.points, POINTS)
+                self.assertEqual(board.solvability, 'solvable')
+                self.assertEqual(board.canonical_hash, self.board.canonical_hash)
+                self.assertTrue(board.thumbnail.name)
+                self.assertEqual(board.solution_count, 1)
+                self.assertEqual(board.best_solution_length, 6)
+                self.assertEqual(Solution.objects.get(pk=self.solution.pk).paths, PATHS)
+
+    def test_import_skips_stored_records(self):
+        out = self.import_lines(self.export())
+
+        self.assertIn("Imported 0 boards and 0 solutions, skipped 1 boards and 1 solutions", out)
+
+    def test_import_rejects_invalid_solution(self):
+        lines = self.export().splitlines()
+        record = json.loads(lines[1])
+        record['paths'] = [path('#ff0000', [(0, 0), (1, 1)])]
+        Solution.objects.all().delete()
+
+        with self.assertRaisesMessage(CommandError, "Line 2: Path must be continuous"):
+            self.import_lines(lines[0] + '\n' + json.dumps(record) + '\n')
+        self.assertFalse(Solution.objects.exists())
+
+    def test_import_rejects_unknown_choices(self):
+        lines = self.export().splitlines()
+        GameBoard.objects.all().delete()
+        for field, value in (('solvability', 'maybe'), ('uniqueness', 'twice'), ('difficulty', 'hard')):
+            with self.subTest(field=field):
+                record = json.loads(lines[0])
+                record[field] = value
+
+                with self.assertRaisesMessage(CommandError, f"Line 1: Invalid {field} '{value}'."):
+                    self.import_lines(json.dumps(record) + '\n')
+
+        for field, value in (('columns', -3), ('rows', 100000), ('columns', '3'), ('name', 'x' * 256), ('name', '')):
+            with self.subTest(field=field, value=value):
+                record = json.loads(lines[0])
+                record[field] = value
+
+                with self.assertRaisesMessage(CommandError, f"Line 1: Invalid {field} {value!r}"):
+                    self.import_lines(json.dumps(record) + '\n')
+        self.assertFalse(GameBoard.objects.exists())
+
+        record = json.loads(lines[1])
+        record['status'] = 'approved'
+        with self.assertRaisesMessage(CommandError, "Line 2: Invalid status 'approved'."):
+            self.import_lines(lines[0] + '\n' + json.dumps(record) + '\n')
+
+    def test_import_verifies_pending_solutions(self):
+        lines = self.export().splitlines()
+        board = json.loads(lines[0])
+        board['uniqueness'] = 'checking'
+        valid = json.loads(lines[1])
+        valid['status'] = 'pending'
+        invalid = dict(valid, id='00000000-0000-0000-0000-000000000001',
+                       paths=[path('#ff0000', [(0, 0), (1, 1)])])
+        Solution.objects.all().delete()
+        GameBoard.objects.all().delete()
+
+        self.import_lines('\n'.join(json.dumps(record) for record in (board, valid, invalid)) + '\n')
+
+        self.assertEqual(GameBoard.objects.get().uniqueness, 'unknown')
+        self.assertEqual(Solution.objects.get(pk=self.solution.pk).status, 'verified')
+        rejected = Solution.objects.get(pk=invalid['id'])
+        self.assertEqual(rejected.status, 'rejected')
+        self.assertTrue(rejected.rejection_reason.startswith("Path must be continuous"))
+
+    def test_import_assigns_missing_users(self):
+        lines = self.export('--no-solutions')
+        GameBoard.objects.all().delete()
+        lines = lines.replace('"user":"testuser"', '"user":"elsewhere"')
+
+        with self.assertRaisesMessage(CommandError, "User 'elsewhere' does not exist"):
+            self.import_lines(lines)
+        self.import_lines(lines, '--user', 'testuser')
+        self.assertEqual(GameBoard.objects.get().user, self.user)
+
+
+class ExportAPIViewTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        other = User.objects.create_user(username="other", password="testpassword")
+        self.board = GameBoard.objects.create(name="Board", user=self.user, columns=3, rows=3, points=POINTS)
+        GameBoard.objects.create(name="Other", user=other, columns=3, rows=3, points=POINTS)
+        Solution.objects.create(name="Solution", user=self.user, game_board=self.board, paths=PATHS)
+        self.client.force_login(self.user)
+
+    def test_streams_own_boards(self):
+        response = self.client.get("/api/boards/export?solutions=true")
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        records = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([(record['type'], record['name']) for record in records],
+                         [('board', 'Board'), ('solution', 'Solution')])
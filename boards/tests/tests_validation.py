@@ -0,0 +1,129 @@
+from django.test import SimpleTestCase
+from boards.validation import OccupancyGrid, validate_board_points, validate_solution
+from common.tests.helpers import BoardHelper
+
+
+point = BoardHelper.point
+path = BoardHelper.path
+
+
+class OccupancyGridTests(SimpleTestCase):
+    def test_claim_and_release(self):
+        grid = OccupancyGrid(3, 2)
+        self.assertEqual(grid.claim(2, 1, 1), 0)
+        self.assertEqual(grid.claim(2, 1, 2), 1)
+        self.assertEqual(grid.owner(2, 1), 1)
+        grid.release(2, 1, 2)
+        self.assertEqual(grid.owner(2, 1), 1)
+        grid.release(2, 1, 1)
+        self.assertEqual(grid.owner(2, 1), 0)
+
+    def test_contains(self):
+        grid = OccupancyGrid(3, 2)
+        self.assertTrue(grid.contains(2, 1))
+        self.assertFalse(grid.contains(3, 1))
+        self.assertFalse(grid.contains(0, 2))
+        self.assertFalse(grid.contains(-1, 0))
+
+
+class ValidateSolutionTests(SimpleTestCase):
+    def setUp(self):
+        self.points = [
+            point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+            point(0, 2, '#0000ff'), point(2, 2, '#0000ff'),
+        ]
+        self.red = path('#ff0000', [(0, 0), (1, 0), (2, 0)])
+        self.blue = path('#0000ff', [(0, 2), (1, 2), (2, 2)])
+
+    def assertInvalid(self, paths, message):
+        with self.assertRaisesMessage(ValueError, message):
+            validate_solution(3, 3, self.points, paths)
+
+    def test_valid_solution(self):
+        grid = validate_solution(3, 3, self.points, [self.red, self.blue])
+        self.assertEqual(grid.owner(1, 0), 1)
+        self.assertEqual(grid.owner(1, 2), 2)
+        self.assertEqual(grid.owner(1, 1), 0)
+
+    def test_duplicate_color(self):
+        self.assertInvalid([self.red, self.red], "Color #ff0000 must have exactly one path.")
+
+    def test_too_short(self):
+        self.assertInvalid([path('#ff0000', [(0, 0)])], "Path must have at least two points.")
+
+    def test_discontinuous(self):
+        self.assertInvalid(
+            [path('#ff0000', [(0, 0), (2, 0)])],
+            "Path must be continuous, with each point adjacent to the next."
+        )
+
+    def test_out_of_bounds(self):
+        self.assertInvalid(
+            [path('#ff0000', [(2, 0), (3, 0)])],
+            "Point (3, 0) is out of bounds for the grid dimensions (3x3)."
+        )
+
+    def test_crossing(self):
+        vertical = path('#0000ff', [(1, 2), (1, 1), (1, 0)])
+        self.assertInvalid([self.red, vertical], "Paths for colors #ff0000 and #0000ff cross each other")
+
+    def test_endpoint_not_on_board(self):
+        self.assertInvalid([path('#ff0000', [(0, 0), (1, 0)])], "Path points don't match board points for color #ff0000")
+
+    def test_endpoint_of_other_color(self):
+        self.assertInvalid(
+            [path('#ff0000', [(0, 0), (0, 1), (0, 2)])],
+            "Path points don't match board points for color #ff0000"
+        )
+
+    def test_path_must_include_endpoints(self):
+        broken = path('#ff0000', [(1, 0), (2, 0)])
+        broken['start'] = {'x': 0, 'y': 0}
+        self.assertInvalid([broken], "Path must include both start and end points")
+
+
+class ValidateBoardPointsTests(SimpleTestCase):
+    def setUp(self):
+        self.points = [
+            point(0, 0, '#ff0000'), point(2, 0, '#ff0000'),
+            point(0, 2, '#0000ff'), point(2, 2, '#0000ff'),
+        ]
+
+    def assertInvalid(self, points, message, columns=3, rows=3):
+        with self.assertRaisesMessage(ValueError, message):
+            validate_board_points(points, columns, rows)
+
+    def test_valid_points(self):
+        validate_board_points(self.points, 3, 3)
+        validate_board_points([], 3, 3)
+
+    def test_not_a_list(self):
+        self.assertInvalid({'x': 0}, "There must be a non empty list of colored points.")
+
+    def test_missing_keys(self):
+        self.assertInvalid([{'x': 0, 'y': 0}], "Each point must have x, y and color.hex_value.")
+
+    def test_non_integer_coordinates(self):
+        self.assertInvalid([point(0.5, 0, '#ff0000')], "Coordinates must be integers.")
+
+    def test_negative_coordinates(self):
+        self.assertInvalid([point(0, -1, '#ff0000')], "Coordinates must be non-negative integers.")
+
+    def test_invalid_hex(self):
+        self.assertInvalid([point(0, 0, 255)], "Hex value must be string.")
+        self.assertInvalid([point(0, 0, 'ff0000')], "Hex value must be a valid hex color code (e.g., #RRGGBB).")
+
+    def test_out_of_bounds(self):
+        self.assertInvalid(
+            self.points, "Point (2, 0) is out of bounds for the grid dimensions (2x3).", columns=2
+        )
+
+    def test_duplicate_cells(self):
+        self.points[3] = point(0, 2, '#0000ff')
+        self.assertInvalid(self.points, "Point (0, 2) is used more than once.")
+
+    def test_wrong_number_of_points_per_color(self):
+        self.assertInvalid(
+            self.points[:3],
+            "#0000ff has invalid number of points. Each color must have exactly 2 points."
+        )
@@ -0,0 +1,76 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from boards import validation_cache
+from boards.models import GameBoard
+from boards.validation_cache import LRUCache, validate_solution_cached
+from common.tests.helpers import BoardHelper
+
+point = BoardHelper.point
+path = BoardHelper.path
+
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'validation'}}
+
+
+class LRUCacheTests(SimpleTestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_zero_size_disables_cache(self):
+        cache = LRUCache(0)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+
+
+class ValidateSolutionCachedTests(SimpleTestCase):
+    def setUp(self):
+        validation_cache.local_cache.clear()
+        self.board = GameBoard(columns=3, rows=1, points=[point(0, 0, '#ff0000'), point(2, 0, '#ff0000')])
+        self.paths = [path('#ff0000', [(0, 0), (1, 0), (2, 0)])]
+
+    def validate(self, paths):
+        with mock.patch.object(validation_cache, 'validate_solution',
+                               wraps=validation_cache.validate_solution) as validate:
+            try:
+                validate_solution_cached(self.board, paths)
+            except ValueError as e:
+                return validate.call_count, str(e)
+        return validate.call_count, None
+
+    def test_repeated_submission_is_validated_once(self):
+        self.assertEqual(self.validate(self.paths), (1, None))
+        self.assertEqual(self.validate(self.paths), (0, None))
+
+    def test_failures_are_cached(self):
+        paths = [path('#ff0000', [(0, 0), (2, 0)])]
+        error = "Path must be continuous, with each point adjacent to the next."
+
+        self.assertEqual(self.validate(paths), (1, error))
+        self.assertEqual(self.validate(paths), (0, error))
+
+    def test_paths_are_hashed_canonically(self):
+        self.validate(self.paths)
+        reordered = [{key: self.paths[0][key] for key in reversed(list(self.paths[0]))}]
+
+        self.assertEqual(self.validate(reordered), (0, None))
+
+    def test_new_board_version_is_validated_again(self):
+        self.validate(self.paths)
+        self.board.version += 1
+
+        self.assertEqual(self.validate(self.paths), (1, None))
+
+    @override_settings(CACHES=LOCMEM, BOARDS_VALIDATION_CACHE='default')
+    def test_shared_cache_is_used_after_local_miss(self):
+        self.validate(self.paths)
+        validation_cache.local_cache.clear()
+
+        self.assertEqual(self.validate(self.paths), (0, None))
@@ -0,0 +1,73 @@
+import hashlib
+import json
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageDraw
+
+from .canonical import stored_content
+from .fields import EncodedValue
+
+THUMBNAIL_DIRECTORY = 'boards/thumbnails'
+
+BACKGROUND = (243, 244, 246)
+GRID_LINE = (209, 213, 219)
+
+# Cells smaller than this many pixels are drawn as squares without grid lines
+MIN_DETAILED_CELL = 6
+
+
+def thumbnail_name(columns: int, rows: int, points) -> str:
+    """
+    Storage name derived from the board content, so identical boards share one file.
+
+    ``points`` may be a list of points or an ``EncodedValue`` loaded from the database.
+    """
+    size = settings.BOARDS_THUMBNAIL_SIZE
+    image_format = settings.BOARDS_THUMBNAIL_FORMAT.lower()
+    canonical = json.dumps([columns, rows, size, stored_content(points)], sort_keys=True, separators=(',', ':'))
+    digest = hashlib.sha256(canonical.encode()).hexdigest()
+    return f"{THUMBNAIL_DIRECTORY}/{digest}.{image_format}"
+
+
+def render_thumbnail(columns: int, rows: int, points) -> bytes:
+    """Draw the board points scaled to fit ``BOARDS_THUMBNAIL_SIZE`` pixels on the longer side."""
+    scale = settings.BOARDS_THUMBNAIL_SIZE / max(columns, rows, 1)
+    width = max(1, round(columns * scale))
+    height = max(1, round(rows * scale))
+
+    image = Image.new('RGB', (width, height), BACKGROUND)
+    draw = ImageDraw.Draw(image)
+    detailed = scale >= MIN_DETAILED_CELL
+    if detailed:
+        for column in range(1, columns):
+            draw.line([(round(column * scale), 0), (round(column * scale), height)], fill=GRID_LINE)
+        for row in range(1, rows):
+            draw.line([(0, round(row * scale)), (width, round(row * scale))], fill=GRID_LINE)
+
+    for point in points:
+        left, top = point['x'] * scale, point['y'] * scale
+        # Every point stays visible, even when cells are smaller than a pixel
+        box = [left, top, max(left, left + scale - 1), max(top, top + scale - 1)]
+        color = point['color']['hex_value']
+        if detailed:
+            inset = scale / 6
+            draw.ellipse([box[0] + inset, box[1] + inset, box[2] - inset, box[3] - inset], fill=color)
+        else:
+            draw.rectangle(box, fill=color)
+
+    output = BytesIO()
+    image.save(output, settings.BOARDS_THUMBNAIL_FORMAT)
+    return output.getvalue()
+
+
+def save_thumbnail(columns: int, rows: int, points) -> str:
+    """Render and store the thumbnail of a board unless a board with the same content did already."""
+    name = thumbnail_name(columns, rows, points)
+    if not default_storage.exists(name):
+        if isinstance(points, EncodedValue):
+            points = points.decode()
+        default_storage.save(name, ContentFile(render_thumbnail(columns, rows, points)))
+    return name
@@ -0,0 +1,230 @@
+import json
+import uuid
+
+from . import canonical, encoding, statistics, thumbnails
+from .fields import EncodedValue
+from .models import GameBoard, Solution
+from .serializers import MAX_BOARD_HEIGHT, MAX_BOARD_WIDTH
+from .solver import CHECKING, SOLVABILITY_CHOICES, UNIQUENESS_CHOICES, UNKNOWN
+from .validation import PENDING, REJECTED, VERIFICATION_CHOICES, VERIFIED, validate_board_points
+from .validation_cache import LRUCache, validate_solution_cached
+
+BOARD = 'board'
+SOLUTION = 'solution'
+
+CONTENT_TYPE = 'application/x-ndjson'
+
+
+def _stored(instance, field: str, encode, compact: bool):
+    value = instance._meta.get_field(field).raw_value(instance)
+    if compact:
+        # The stored payload is written as it is, without decoding it
+        if isinstance(value, EncodedValue):
+            return value.payload
+        return encode(value) or value
+    return value.decode() if isinstance(value, EncodedValue) else value
+
+
+def board_record(board, compact: bool = False) -> dict:
+    return {
+        'type': BOARD,
+        'id': str(board.pk),
+        'name': board.name,
+        'user': board.user.username,
+        'columns': board.columns,
+        'rows': board.rows,
+        'points': _stored(board, 'points', encoding.encode_points, compact),
+        'solvability': board.solvability,
+        'uniqueness': board.uniqueness,
+        'difficulty': board.difficulty,
+    }
+
+
+def solution_record(solution, compact: bool = False) -> dict:
+    return {
+        'type': SOLUTION,
+        'id': str(solution.pk),
+        'board': str(solution.game_board_id),
+        'user': solution.user.username,
+        'name': solution.name,
+        'paths': _stored(solution, 'paths', encoding.encode_paths, compact),
+        'status': solution.status,
+        'rejection_reason': solution.rejection_reason,
+    }
+
+
+def export_records(game_boards, solutions=None, compact: bool = False, chunk_size: int = 500):
+    """
+    Yield the records of boards and then of solutions, reading the rows in chunks.
+
+    Solutions come ordered by board, so an import finds their board already stored.
+    """
+    for board in game_boards.select_related('user').order_by('pk').iterator(chunk_size=chunk_size):
+        yield board_record(board, compact)
+    if solutions is not None:
+        solutions = solutions.select_related('user').order_by('game_board', 'pk')
+        for solution in solutions.iterator(chunk_size=chunk_size):
+            yield solution_record(solution, compact)
+
+
+def to_ndjson(records):
+    for record in records:
+        yield json.dumps(record, separators=(',', ':')) + '\n'
+
+
+def _decoded(value, format: str, decode):
+    return decode(value) if encoding.is_encoded(value, format) else value
+
+
+def _name(record, model) -> str:
+    name = record['name']
+    max_length = model._meta.get_field('name').max_length
+    if type(name) is not str or not name or len(name) > max_length:
+        raise ValueError(f"Invalid name {name!r}, expected 1 to {max_length} characters.")
+    return name
+
+
+def _size(record, field: str, limit: int) -> int:
+    # The same bounds as GameBoardSerializer, so an import cannot store a board the API would refuse
+    value = record[field]
+    if type(value) is not int or not 1 <= value <= limit:
+        raise ValueError(f"Invalid {field} {value!r}, expected an integer from 1 to {limit}.")
+    return value
+
+
+def _choice(record, field: str, choices, default):
+    value = record.get(field, default)
+    if value not in {key for key, _ in choices}:
+        raise ValueError(f"Invalid {field} {value!r}.")
+    return value
+
+
+class Importer:
+    """
+    Store board and solution records in batches of ``bulk_create``.
+
+    Records are validated one by one with the columnar board validation and the cached
+    solution validation, and only a batch of rows is held at a time. Pending solutions
+    are verified on import. Records whose id is
+    already stored are skipped. Call ``flush`` after the last record.
+    """
+
+    def __init__(self, users, batch_size: int = 500):
+        # Callable returning the user id for a username, raising ValueError if there is none
+        self.users = users
+        self.batch_size = batch_size
+        self.boards = []
+        self.solutions = []
+        self.board_cache = LRUCache(batch_size)
+        self.created = {BOARD: 0, SOLUTION: 0}
+        self.skipped = {BOARD: 0, SOLUTION: 0}
+
+    def add(self, record: dict):
+        """Validate a record and queue it; raises ``ValueError`` for an invalid record."""
+        try:
+            kind = record['type']
+            if kind == BOARD:
+                self._add_board(record)
+            elif kind == SOLUTION:
+                self._add_solution(record)
+            else:
+                raise ValueError(f"Unknown record type {kind!r}.")
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed record: missing or invalid {e}.")
+
+    def _add_board(self, record):
+        name = _name(record, GameBoard)
+        columns = _size(record, 'columns', MAX_BOARD_WIDTH)
+        rows = _size(record, 'rows', MAX_BOARD_HEIGHT)
+        points = _decoded(record['points'], encoding.POINTS_FORMAT, encoding.decode_points)
+        validate_board_points(points, columns, rows)
+        uniqueness = _choice(record, 'uniqueness', UNIQUENESS_CHOICES, UNKNOWN)
+        if uniqueness == CHECKING:
+            # The check ran for the exported board, none is queued for the imported one
+            uniqueness = UNKNOWN
+        difficulty = record.get('difficulty')
+        if difficulty is not None and (isinstance(difficulty, bool) or not isinstance(difficulty, (int, float))):
+            raise ValueError(f"Invalid difficulty {difficulty!r}.")
+        self.boards.append(GameBoard(
+            id=uuid.UUID(record['id']),
+            name=name,
+            user_id=self.users(record['user']),
+            columns=columns,
+            rows=rows,
+            points=points,
+            solvability=_choice(record, 'solvability', SOLVABILITY_CHOICES, UNKNOWN),
+            uniqueness=uniqueness,
+            difficulty=difficulty,
+            # bulk_create skips GameBoard.save, so the preview and hashes are made here
+            thumbnail=thumbnails.save_thumbnail(columns, rows, points),
+            canonical_hash=canonical.canonical_hash(columns, rows, points),
+            layout_hash=canonical.layout_hash(columns, rows, points),
+        ))
+        if len(self.boards) >= self.batch_size:
+            self._flush_boards()
+
+    def _board(self, board_id):
+        board = self.board_cache.get(board_id)
+        if board is None:
+            board = GameBoard.objects.only('pk', 'version', 'columns', 'rows', 'points').filter(pk=board_id).first()
+            if board is None:
+                raise ValueError(f"Game board {board_id} does not exist.")
+            self.board_cache.set(board_id, board)
+        return board
+
+    def _add_solution(self, record):
+        # Solutions may belong to boards of the current batch
+        self._flush_boards()
+        board = self._board(uuid.UUID(record['board']))
+        paths = _decoded(record['paths'], encoding.PATHS_FORMAT, encoding.decode_paths)
+        status = _choice(record, 'status', VERIFICATION_CHOICES, VERIFIED)
+        rejection_reason = record.get('rejection_reason', '')
+        if status == VERIFIED:
+            validate_solution_cached(board, paths)
+        elif status == PENDING:
+            # No verification is queued for imported rows, so pending solutions are verified here
+            try:
+                validate_solution_cached(board, paths)
+            except ValueError as e:
+                status, rejection_reason = REJECTED, str(e)
+            else:
+                status, rejection_reason = VERIFIED, ''
+
+        solution = Solution(
+            id=uuid.UUID(record['id']),
+            name=_name(record, Solution),
+            game_board_id=board.pk,
+            user_id=self.users(record['user']),
+            paths=paths,
+            status=status,
+            rejection_reason=rejection_reason,
+        )
+        # bulk_create skips Solution.save, which computes the length
+        solution.length = solution.compute_length()
+        self.solutions.append(solution)
+        if len(self.solutions) >= self.batch_size:
+            self._flush_solutions()
+
+    def _create(self, model, kind: str, batch: list):
+        existing = set(model.objects.filter(pk__in=[obj.pk for obj in batch]).values_list('pk', flat=True))
+        new = [obj for obj in batch if obj.pk not in existing]
+        model.objects.bulk_create(new)
+        self.created[kind] += len(new)
+        self.skipped[kind] += len(batch) - len(new)
+        return new
+
+    def _flush_boards(self):
+        if self.boards:
+            self._create(GameBoard, BOARD, self.boards)
+            self.boards = []
+
+    def _flush_solutions(self):
+        if self.solutions:
+            created = self._create(Solution, SOLUTION, self.solutions)
+            # bulk_create skips the signals keeping the board statistics
+            statistics.reconcile(GameBoard.objects.filter(pk__in={solution.game_board_id for solution in created}))
+            self.solutions = []
+
+    def flush(self):
+        self._flush_boards()
+        self._flush_solutions()
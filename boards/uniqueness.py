@@ -0,0 +1,57 @@
+import logging
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+
+from . import solver
+from .models import GameBoard
+from .solver import CHECKING, UNKNOWN
+from .verification import get_executor, run_solver
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_uniqueness(board_id) -> str | None:
+    """
+    Check whether a board has exactly one solution and store the result.
+
+    Like a difficulty estimate, the result is only stored if the layout version did not
+    change while the search ran. Returns the uniqueness status.
+    """
+    board = GameBoard.objects.only('columns', 'rows', 'points', 'layout_version').filter(pk=board_id).first()
+    if board is None:
+        return None
+
+    uniqueness = run_solver(
+        solver.check_uniqueness, board.columns, board.rows, board.points, settings.BOARDS_UNIQUENESS_DEADLINE
+    )
+    GameBoard.objects.filter(pk=board_id, layout_version=board.layout_version) \
+        .update(uniqueness=uniqueness, version=F('version') + 1)
+    return uniqueness
+
+
+def _run(board_id):
+    close_old_connections()
+    try:
+        refresh_uniqueness(board_id)
+    except Exception:
+        logger.exception(f"Uniqueness check of board {board_id} failed")
+        # The board must not stay checking forever
+        GameBoard.objects.filter(pk=board_id, uniqueness=CHECKING) \
+            .update(uniqueness=UNKNOWN, version=F('version') + 1)
+    finally:
+        connection.close()
+
+
+def submit(board_id):
+    """
+    Queue a uniqueness check of a board once the current transaction commits.
+
+    Checks share the worker pool of solution verification and search in the solver
+    processes; with ``BOARDS_VERIFICATION_WORKERS`` set to 0 they run in the calling thread.
+    """
+    if settings.BOARDS_VERIFICATION_WORKERS > 0:
+        transaction.on_commit(lambda: get_executor().submit(_run, board_id))
+    else:
+        transaction.on_commit(lambda: refresh_uniqueness(board_id))
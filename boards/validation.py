@@ -0,0 +1,258 @@
+from array import array
+from collections import Counter
+
+FREE = 0
+
+NUMBER_OF_POINTS_PER_COLOR = 2
+
+PENDING = 'pending'
+VERIFIED = 'verified'
+REJECTED = 'rejected'
+
+VERIFICATION_CHOICES = [
+    (PENDING, 'Pending'),
+    (VERIFIED, 'Verified'),
+    (REJECTED, 'Rejected'),
+]
+
+
+def _zeroed(typecode, length):
+    return array(typecode, bytes(length * array(typecode).itemsize))
+
+
+class OccupancyGrid:
+    """
+    Flat ``columns x rows`` grid recording which path owns every cell.
+
+    Owners are positive integers, ``FREE`` marks an empty cell.
+    """
+
+    def __init__(self, columns: int, rows: int):
+        self.columns = columns
+        self.rows = rows
+        self.cells = _zeroed('i', columns * rows)
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.columns and 0 <= y < self.rows
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.columns + x
+
+    def owner(self, x: int, y: int) -> int:
+        return self.cells[y * self.columns + x]
+
+    def claim(self, x: int, y: int, owner: int) -> int:
+        """Mark the cell as owned by ``owner`` unless it is taken; returns the previous owner."""
+        index = y * self.columns + x
+        previous = self.cells[index]
+        if previous == FREE:
+            self.cells[index] = owner
+        return previous
+
+    def release(self, x: int, y: int, owner: int):
+        index = y * self.columns + x
+        if self.cells[index] == owner:
+            self.cells[index] = FREE
+
+
+def points_to_columns(points):
+    """Split board points into ``(xs, ys, colors)`` lists."""
+    if not isinstance(points, list):
+        raise ValueError("There must be a non empty list of colored points.")
+    try:
+        return (
+            [point['x'] for point in points],
+            [point['y'] for point in points],
+            [point['color']['hex_value'] for point in points],
+        )
+    except (KeyError, TypeError):
+        raise ValueError("Each point must have x, y and color.hex_value.")
+
+
+def _is_hex_color(value) -> bool:
+    return value.startswith('#') and len(value) == 7
+
+
+def validate_points_columns(xs, ys, colors, columns: int, rows: int):
+    """
+    Validate board points given as parallel coordinate and color columns.
+
+    Each rule is checked for the whole board at once; the offending point is only
+    looked up once a rule is known to fail.
+    """
+    if not all(type(value) is int for value in xs) or not all(type(value) is int for value in ys):
+        raise ValueError("Coordinates must be integers.")
+    if xs and (min(xs) < 0 or min(ys) < 0):
+        raise ValueError("Coordinates must be non-negative integers.")
+
+    palette = set(colors)
+    if not all(isinstance(color, str) for color in palette):
+        raise ValueError("Hex value must be string.")
+    if not all(_is_hex_color(color) for color in palette):
+        raise ValueError("Hex value must be a valid hex color code (e.g., #RRGGBB).")
+
+    if xs and (max(xs) >= columns or max(ys) >= rows):
+        x, y = next((x, y) for x, y in zip(xs, ys) if x >= columns or y >= rows)
+        raise ValueError(f"Point ({x}, {y}) is out of bounds for the grid dimensions ({columns}x{rows}).")
+
+    cells = [y * columns + x for x, y in zip(xs, ys)]
+    if len(set(cells)) != len(cells):
+        duplicate = next(cell for cell, count in Counter(cells).items() if count > 1)
+        raise ValueError(f"Point ({duplicate % columns}, {duplicate // columns}) is used more than once.")
+
+    for color, count in Counter(colors).items():
+        if count != NUMBER_OF_POINTS_PER_COLOR:
+            raise ValueError(
+                f"{color} has invalid number of points. "
+                f"Each color must have exactly {NUMBER_OF_POINTS_PER_COLOR} points."
+            )
+
+
+def validate_board_points(points, columns: int, rows: int):
+    """Validate a board's points; raises ``ValueError`` describing the first broken rule."""
+    validate_points_columns(*points_to_columns(points), columns, rows)
+
+
+def board_cells(points) -> dict:
+    """Map every board point to its color as ``{(x, y): hex_value}``."""
+    return {(point['x'], point['y']): point['color']['hex_value'] for point in points}
+
+
+def validate_path_colors(paths):
+    """Ensure every color is connected by exactly one path."""
+    seen = set()
+    for path in paths:
+        color = path['color']['hex_value']
+        if color in seen:
+            raise ValueError(f"Color {color} must have exactly one path.")
+        seen.add(color)
+
+
+def trace_path(grid: OccupancyGrid, path, owner: int):
+    """
+    Rasterize a single path into the grid.
+
+    Checks bounds, continuity and overlaps with cells already owned by other paths.
+    Returns the owner of the crossed path when an overlap is found.
+    """
+    cells = path['path']
+    if len(cells) < 2:
+        raise ValueError("Path must have at least two points.")
+
+    columns = grid.columns
+    rows = grid.rows
+    occupied = grid.cells
+    previous_x = previous_y = None
+    for point in cells:
+        x = point['x']
+        y = point['y']
+        if not (0 <= x < columns) or not (0 <= y < rows):
+            raise ValueError(
+                f"Point ({x}, {y}) is out of bounds for the grid dimensions ({columns}x{rows})."
+            )
+        if previous_x is not None and abs(x - previous_x) + abs(y - previous_y) != 1:
+            raise ValueError("Path must be continuous, with each point adjacent to the next.")
+        previous_x = x
+        previous_y = y
+
+        index = y * columns + x
+        current = occupied[index]
+        if current == FREE:
+            occupied[index] = owner
+        elif current != owner:
+            return current
+    return None
+
+
+def validate_path_edges(grid: OccupancyGrid, path, owner: int, cells: dict):
+    """Ensure the path starts and ends on board points of its color and covers both of them."""
+    color = path['color']['hex_value']
+    start = (path['start']['x'], path['start']['y'])
+    end = (path['end']['x'], path['end']['y'])
+
+    if cells.get(start) != color or cells.get(end) != color:
+        raise ValueError(f"Path points don't match board points for color {color}")
+
+    if not grid.contains(*start) or not grid.contains(*end) \
+            or grid.owner(*start) != owner or grid.owner(*end) != owner:
+        raise ValueError("Path must include both start and end points")
+
+
+def validate_solution(columns: int, rows: int, points, paths) -> OccupancyGrid:
+    """
+    Validate solution paths against a board by rasterizing them into one occupancy grid.
+
+    Every path cell is visited once, so the cost is linear in the total path length.
+    A solution must connect every color of the board.
+    Raises ``ValueError`` on the first problem found and returns the filled grid otherwise.
+    """
+    validate_path_colors(paths)
+
+    grid = OccupancyGrid(columns, rows)
+    for owner, path in enumerate(paths, start=1):
+        crossed = trace_path(grid, path, owner)
+        if crossed is not None:
+            raise ValueError(
+                f"Paths for colors {paths[crossed - 1]['color']['hex_value']} "
+                f"and {path['color']['hex_value']} cross each other"
+            )
+
+    cells = board_cells(points)
+    for owner, path in enumerate(paths, start=1):
+        validate_path_edges(grid, path, owner, cells)
+
+    # Path colors are unique and all on the board, so a missing color means fewer paths
+    missing = set(cells.values()).difference(path['color']['hex_value'] for path in paths)
+    if missing:
+        raise ValueError(f"Solution doesn't connect colors {', '.join(sorted(missing))}")
+
+    return grid
+
+
+def merge_paths(paths, replacements) -> list:
+    """Replace the paths of the colors in ``replacements`` and append colors without a path yet."""
+    validate_path_colors(replacements)
+    replaced = {path['color']['hex_value']: path for path in replacements}
+    merged = [replaced.pop(path['color']['hex_value'], path) for path in paths]
+    return merged + list(replaced.values())
+
+
+def replace_paths(grid: OccupancyGrid, cells: dict, paths, replacements) -> list:
+    """
+    Replace the paths of some colors in an already validated solution.
+
+    ``grid`` holds the rasterized ``paths`` as returned by ``validate_solution`` and ``cells``
+    the board points as returned by ``board_cells``. Only the replaced paths are released
+    and traced again; a color without a path yet is appended. Returns the new list of
+    paths and leaves the grid matching it. Raises ``ValueError`` like ``validate_solution``,
+    after which the grid must be discarded.
+    """
+    validate_path_colors(replacements)
+
+    paths = list(paths)
+    owners = {path['color']['hex_value']: owner for owner, path in enumerate(paths, start=1)}
+    for replacement in replacements:
+        color = replacement['color']['hex_value']
+        owner = owners.get(color)
+        if owner is None:
+            paths.append(replacement)
+            owners[color] = len(paths)
+            continue
+        for point in paths[owner - 1]['path']:
+            grid.release(point['x'], point['y'], owner)
+        paths[owner - 1] = replacement
+
+    # All replaced paths are released first, so they may take over each other's cells
+    for replacement in replacements:
+        color = replacement['color']['hex_value']
+        crossed = trace_path(grid, replacement, owners[color])
+        if crossed is not None:
+            raise ValueError(
+                f"Paths for colors {paths[crossed - 1]['color']['hex_value']} and {color} cross each other"
+            )
+
+    for replacement in replacements:
+        validate_path_edges(grid, replacement, owners[replacement['color']['hex_value']], cells)
+
+    return paths
+
@@ -0,0 +1,130 @@
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .validation import board_cells, validate_solution
+
+KEY_PREFIX = 'boards:solution-validation:'
+
+# Outcome stored for a solution that passed validation; failures store the error message
+VALID = ''
+
+
+class LRUCache:
+    """Thread-safe mapping that keeps at most ``maxsize`` of the most recently used entries."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_cache = LRUCache(settings.BOARDS_VALIDATION_CACHE_SIZE)
+
+# Rasterized paths of recently edited solutions, see take_solution_grid
+occupancy_cache = LRUCache(settings.BOARDS_OCCUPANCY_CACHE_SIZE)
+
+
+def _digest(value) -> str:
+    canonical = json.dumps(value, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def board_key(board) -> str:
+    """Hash of everything a solution is validated against, including the board version."""
+    return _digest([str(board.pk), board.version, board.columns, board.rows, board.points])
+
+
+def paths_key(paths) -> str:
+    """Hash of the submitted paths; path order is kept since it decides which error is reported."""
+    return _digest(paths)
+
+
+def _shared_cache():
+    alias = settings.BOARDS_VALIDATION_CACHE
+    return caches[alias] if alias else None
+
+
+def validate_solution_cached(board, paths):
+    """
+    Validate solution paths against a board, reusing the outcome of identical submissions.
+
+    Outcomes are looked up in the in-process LRU first and in the shared Django cache
+    named by ``BOARDS_VALIDATION_CACHE`` next. Editing a board bumps its version, so
+    entries for the previous board content are never hit again and simply age out.
+    Raises ``ValueError`` like ``validate_solution``.
+    """
+    key = KEY_PREFIX + board_key(board) + ':' + paths_key(paths)
+    outcome = local_cache.get(key)
+
+    if outcome is None:
+        shared = _shared_cache()
+        if shared is not None:
+            outcome = shared.get(key)
+        if outcome is None:
+            try:
+                validate_solution(board.columns, board.rows, board.points, paths)
+                outcome = VALID
+            except ValueError as e:
+                outcome = str(e)
+            if shared is not None:
+                shared.set(key, outcome, settings.BOARDS_VALIDATION_CACHE_TIMEOUT)
+        local_cache.set(key, outcome)
+
+    if outcome != VALID:
+        raise ValueError(outcome)
+
+
+def _grid_key(solution):
+    return solution.pk, solution.revision, solution.game_board.version
+
+
+def take_solution_grid(solution):
+    """
+    Remove and return ``(grid, cells)`` for the stored paths of a verified solution.
+
+    The occupancy grid and board cells are built from scratch unless they were kept for
+    the same solution revision and board version. Taking the entry out of the cache
+    keeps concurrent edits from working on the same grid.
+    """
+    entry = occupancy_cache.pop(_grid_key(solution))
+    if entry is None:
+        board = solution.game_board
+        entry = validate_solution(board.columns, board.rows, board.points, solution.paths), board_cells(board.points)
+    return entry
+
+
+def keep_solution_grid(solution, grid, cells):
+    """Cache the grid matching the paths the solution was just saved with."""
+    occupancy_cache.set(_grid_key(solution), (grid, cells))
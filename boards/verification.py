@@ -0,0 +1,108 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+from .models import Solution
+from .validation import PENDING, REJECTED, VERIFIED
+from .validation_cache import validate_solution_cached
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = Lock()
+_solver_executor = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.BOARDS_VERIFICATION_WORKERS,
+                thread_name_prefix='solution-verification',
+            )
+        return _executor
+
+
+def get_solver_executor() -> ProcessPoolExecutor:
+    global _solver_executor
+    with _executor_lock:
+        if _solver_executor is None:
+            _solver_executor = ProcessPoolExecutor(max_workers=settings.BOARDS_SOLVER_WORKERS)
+        return _solver_executor
+
+
+def run_solver(function, *args):
+    """
+    Call a CPU-bound solver function in the solver processes and wait for its result.
+
+    The waiting worker thread releases the GIL, so a long search does not slow down
+    request threads. With ``BOARDS_SOLVER_WORKERS`` set to 0 the function runs in the
+    calling thread instead.
+    """
+    global _solver_executor
+    if settings.BOARDS_SOLVER_WORKERS <= 0:
+        return function(*args)
+
+    executor = get_solver_executor()
+    try:
+        return executor.submit(function, *args).result()
+    except BrokenProcessPool:
+        # A crashed process breaks the whole pool, the next job starts a new one
+        with _executor_lock:
+            if _solver_executor is executor:
+                _solver_executor = None
+        raise
+
+
+def verify_solution(solution_id) -> str | None:
+    """
+    Validate a pending solution and store the outcome.
+
+    The row stays locked while the paths are checked, so an edit that arrives meanwhile
+    waits and then queues its own verification. Returns the new status, or ``None`` when
+    the solution no longer exists or is not pending anymore.
+    """
+    with transaction.atomic():
+        solution = Solution.objects.select_for_update(of=('self',)).select_related('game_board') \
+            .filter(pk=solution_id, status=PENDING).first()
+        if solution is None:
+            return None
+
+        try:
+            validate_solution_cached(solution.game_board, solution.paths)
+        except ValueError as e:
+            solution.status = REJECTED
+            solution.rejection_reason = str(e)
+        else:
+            solution.status = VERIFIED
+            solution.rejection_reason = ''
+        solution.save(update_fields=['status', 'rejection_reason'])
+    return solution.status
+
+
+def _run(solution_id):
+    close_old_connections()
+    try:
+        verify_solution(solution_id)
+    except Exception:
+        logger.exception(f"Verification of solution {solution_id} failed")
+    finally:
+        connection.close()
+
+
+def submit(solution_id):
+    """
+    Queue verification of a pending solution once the current transaction commits.
+
+    With ``BOARDS_VERIFICATION_WORKERS`` set to 0 the solution is verified in the
+    calling thread instead.
+    """
+    if settings.BOARDS_VERIFICATION_WORKERS > 0:
+        transaction.on_commit(lambda: get_executor().submit(_run, solution_id))
+    else:
+        transaction.on_commit(lambda: verify_solution(solution_id))
@@ -1,9 +1,11 @@
 from django.http import Http404
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
+from rest_framework.request import Request
 
 from .forms import GameBoardForm
 from .models import GameBoard, Solution
+from .pagination import BoardCursorPagination, filter_by_difficulty
 
 
 @login_required
@@ -24,14 +26,25 @@ def edit_background_view(request, board_id):
     form = GameBoardForm(instance=game_board)
     return render(request, 'boards/createEdit.html', {'form': form, 'game_board': game_board})
 
+def _render_board_page(request, game_boards):
+    try:
+        game_boards = filter_by_difficulty(game_boards, request.GET)
+    except ValueError:
+        pass
+    paginator = BoardCursorPagination()
+    page = paginator.paginate_queryset(game_boards.defer('points').select_related('user'), Request(request))
+    return render(request, 'boards/list.html', {
+        'game_boards': page,
+        'next_page_url': paginator.get_next_link(),
+        'previous_page_url': paginator.get_previous_link(),
+    })
+
 def list_backgrounds_view(request):
-    game_boards = GameBoard.objects.all().defer('points')
-    return render(request, 'boards/list.html', {'game_boards': game_boards})
+    return _render_board_page(request, GameBoard.objects.all())
 
 @login_required
 def list_my_backgrounds_view(request):
-    game_boards = GameBoard.objects.defer('points').filter(user=request.user)
-    return render(request, 'boards/list.html', {'game_boards': game_boards})
+    return _render_board_page(request, GameBoard.objects.filter(user=request.user))
 
 @login_required
 def create_solution_view(request, board_id):
@@ -0,0 +1,23 @@
+def batches(queryset, size):
+    """Yield the rows of ``queryset`` ``size`` at a time by primary key ranges, holding no cursor open in between."""
+    queryset = queryset.order_by('pk')
+    batch = list(queryset[:size])
+    while batch:
+        yield batch
+        batch = list(queryset.filter(pk__gt=batch[-1].pk)[:size])
+
+
+def update_in_batches(queryset, fields, size, change) -> int:
+    """
+    Call ``change(obj)`` on every row and save the rows it returns true for with ``bulk_update``.
+
+    Rows are read and written ``size`` at a time, so one update covers a whole batch.
+    Returns the number of updated rows.
+    """
+    updated = 0
+    for batch in batches(queryset, size):
+        changed = [obj for obj in batch if change(obj)]
+        if changed:
+            queryset.model.objects.bulk_update(changed, fields)
+            updated += len(changed)
+    return updated
@@ -10,4 +10,19 @@ class ImageHelper:
         image = PILImage.new("RGB", size=size, color=color)
         image.save(file_obj, ext)
         file_obj.seek(0)
-        return File(file_obj, name=name)
\ No newline at end of file
+        return File(file_obj, name=name)
+
+class BoardHelper:
+
+    @staticmethod
+    def point(x, y, color):
+        return {'x': x, 'y': y, 'color': {'hex_value': color}}
+
+    @staticmethod
+    def path(color, cells):
+        return {
+            'start': {'x': cells[0][0], 'y': cells[0][1]},
+            'end': {'x': cells[-1][0], 'y': cells[-1][1]},
+            'color': {'hex_value': color},
+            'path': [{'x': x, 'y': y} for x, y in cells],
+        }
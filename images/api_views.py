@@ -1,6 +1,8 @@
 ﻿from rest_framework.views import APIView
 from rest_framework.response import Response
+from django.db.models import Q
 from .models import Image
+from common.conditional import versioned_etag
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 from images.serializers import ImageSerializer, ImageDetailsSerializer
 
@@ -18,6 +20,14 @@ class ImageListAPIView(APIView):
         serializer = ImageSerializer(images, many=True)
         return Response(serializer.data)
 
+def _image_version(request, image_id):
+    images = Image.objects.filter(id=image_id)
+    if request.user.is_authenticated:
+        images = images.filter(Q(is_public=True) | Q(author=request.user))
+    else:
+        images = images.filter(is_public=True)
+    return images.values_list('version', flat=True).first()
+
 class ImageGetAPIView(APIView):
     permission_classes = []
     @extend_schema(
@@ -25,6 +35,7 @@ class ImageGetAPIView(APIView):
                    404: OpenApiResponse(description="Image not found")},
         description="Get image",
         tags=["Images"])
+    @versioned_etag(_image_version)
     def get(self, request, image_id):
         try:
             image = Image.objects.get(id=image_id)
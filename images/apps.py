@@ -5,3 +5,7 @@ class ImagesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'images'
     verbose_name = 'Images'
+
+    def ready(self):
+        # Import the signals to register them
+        import images.signals
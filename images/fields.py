@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class DimensionsImageField(models.ImageField):
+    """
+    Image field filling its ``width_field`` and ``height_field`` when a file is assigned.
+
+    Unlike ``ImageField`` it does not open the file of a row loaded without stored
+    dimensions, which would happen on every load until they are backfilled, and a file
+    that cannot be opened leaves the dimensions empty instead of raising.
+    """
+
+    def update_dimension_fields(self, instance, force=False, *args, **kwargs):
+        # A file name rather than a file means the value came from the database
+        if not force and isinstance(instance.__dict__.get(self.attname), str):
+            return
+        try:
+            super().update_dimension_fields(instance, force, *args, **kwargs)
+        except OSError:
+            setattr(instance, self.width_field, None)
+            setattr(instance, self.height_field, None)
@@ -0,0 +1,49 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.files.images import get_image_dimensions
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from common.batches import batches
+from images.models import Image
+
+
+def read_dimensions(name):
+    try:
+        with default_storage.open(name) as file:
+            return get_image_dimensions(file)
+    except OSError:
+        return None, None
+
+
+class Command(BaseCommand):
+    help = "Store the width and height of images uploaded before they were recorded."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="Read every image again, not only those without a size.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Number of threads reading files.")
+        parser.add_argument('--batch-size', type=int, default=500, help="Rows per bulk update.")
+
+    def handle(self, *args, **options):
+        images = Image.objects.only('pk', 'image', 'width', 'height')
+        if not options['all']:
+            images = images.filter(Q(width__isnull=True) | Q(height__isnull=True))
+
+        stored = 0
+        unreadable = []
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            for batch in batches(images, options['batch_size']):
+                # Files are read in parallel, the rows of a batch are written with one update
+                dimensions = executor.map(read_dimensions, [image.image.name for image in batch])
+                for image, (width, height) in zip(batch, dimensions):
+                    image.width, image.height = width, height
+                    if width is None or height is None:
+                        unreadable.append(image.pk)
+                Image.objects.bulk_update(batch, ['width', 'height'])
+                stored += len(batch)
+
+        for image_id in unreadable:
+            self.stdout.write(self.style.WARNING(f"{image_id}: not a readable image"))
+        self.stdout.write(self.style.SUCCESS(f"Stored the size of {stored - len(unreadable)} images."))
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0003_image_is_public'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='image',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.25 on 2026-10-18 18:19
+
+from django.db import migrations
+import images.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0005_image_dimensions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='image',
+            name='image',
+            field=images.fields.DimensionsImageField(height_field='height', upload_to='images/', width_field='width'),
+        ),
+    ]
@@ -1,20 +1,43 @@
 from django.db import models
 from django.conf import settings
 
+from .fields import DimensionsImageField
+
 class Image(models.Model):
     id = models.AutoField(primary_key=True),
     name = models.CharField(max_length=250,default="")
-    image = models.ImageField(upload_to='images/')
+    image = DimensionsImageField(upload_to='images/', width_field='width', height_field='height')
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     is_public = models.BooleanField(default=False)
+    version = models.PositiveIntegerField(default=1)
+    # Filled in by the image field when a file is assigned, so checking coordinates does not open it
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    height = models.PositiveIntegerField(null=True, blank=True, editable=False)
 
     def can_access(self, user):
         if self.is_public:
             return True
         return self.author == user
 
+    def dimensions(self):
+        """
+        Stored width and height of the image, ``(None, None)`` when it is not a readable image.
+
+        Rows stored before the size was recorded read it from the file until
+        ``backfill_image_dimensions`` fills them in.
+        """
+        if self.width is None or self.height is None:
+            try:
+                return self.image.width, self.image.height
+            except (OSError, ValueError):
+                return None, None
+        return self.width, self.height
+
     def are_valid_coordinates(self, x, y):
-        return self.image.height >= y >= 0 and self.image.width >= x >= 0
+        width, height = self.dimensions()
+        if width is None or height is None:
+            return False
+        return height >= y >= 0 and width >= x >= 0
 
     def __str__(self):
         return self.name
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from common.conditional import bump_version
+from .models import Image
+
+
+@receiver(post_save, sender=Image)
+def handle_image_change(sender, instance, created, **kwargs):
+    """
+    Signal handler that marks an edited Image as changed
+    """
+    if not created:
+        bump_version(Image, instance.pk)
@@ -98,4 +98,32 @@ class ImageViewTests(APITestCase):
 
         response = self.client.get(f'/api/images/{self.private_image.id}')
 
-        self.assertEqual(response.status_code, 404)
\ No newline at end of file
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_image_not_modified(self):
+        self.client.logout()
+        etag = self.client.get(f'/api/images/{self.public_image.id}')['ETag']
+
+        response = self.client.get(f'/api/images/{self.public_image.id}', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_edited_image_invalidates_etag(self):
+        self.client.logout()
+        etag = self.client.get(f'/api/images/{self.public_image.id}')['ETag']
+        self.public_image.name = 'Renamed'
+        self.public_image.save()
+
+        response = self.client.get(f'/api/images/{self.public_image.id}', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['name'], 'Renamed')
+
+    def test_private_image_etag_does_not_bypass_access_check(self):
+        self.client.force_login(self.author)
+        etag = self.client.get(f'/api/images/{self.private_image.id}')['ETag']
+        self.client.force_login(self.user)
+
+        response = self.client.get(f'/api/images/{self.private_image.id}', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,48 @@
+﻿from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+
+from common.tests.helpers import ImageHelper
+from images.models import Image
+
+
+class BackfillImageDimensionsCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.images = [
+            Image.objects.create(name=f"Image {i}", author=self.user,
+                                 image=ImageHelper.get_image_file(name=f'image_{i}.png', size=(10 + i, 20 + i)))
+            for i in range(5)
+        ]
+        self.broken = Image.objects.create(
+            name="Broken", author=self.user,
+            image=SimpleUploadedFile("broken.jpg", b"file_content", content_type="image/jpeg"),
+        )
+        Image.objects.update(width=None, height=None)
+
+    def test_backfill(self):
+        out = StringIO()
+        call_command('backfill_image_dimensions', '--workers', '2', '--batch-size', '2', stdout=out)
+
+        for i, image in enumerate(self.images):
+            image.refresh_from_db()
+            self.assertEqual((image.width, image.height), (10 + i, 20 + i))
+        self.assertIn(f"{self.broken.pk}: not a readable image", out.getvalue())
+        self.assertIn("Stored the size of 5 images.", out.getvalue())
+
+    def test_backfill_skips_stored_images(self):
+        Image.objects.filter(pk=self.images[0].pk).update(width=1, height=1)
+
+        out = StringIO()
+        call_command('backfill_image_dimensions', stdout=out)
+
+        self.images[0].refresh_from_db()
+        self.assertEqual((self.images[0].width, self.images[0].height), (1, 1))
+        self.assertIn("Stored the size of 4 images.", out.getvalue())
+
+        call_command('backfill_image_dimensions', '--all', stdout=out)
+        self.images[0].refresh_from_db()
+        self.assertEqual((self.images[0].width, self.images[0].height), (10, 20))
@@ -1,4 +1,7 @@
-﻿from django.test import TestCase
+﻿from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.test import TestCase
 from django.contrib.auth.models import User
 from images.models import Image
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -55,3 +58,39 @@ class ImageModelTests(TestCase):
         self.assertFalse(self.image.are_valid_coordinates(-1, 1080))
         self.assertFalse(self.image.are_valid_coordinates(-1, -1))
 
+    def test_dimensions_stored_on_upload(self):
+        # Neither loading the image nor checking coordinates touches the file anymore
+        with mock.patch.object(default_storage, 'open', side_effect=AssertionError("file opened")):
+            image = Image.objects.get(pk=self.image.pk)
+            self.assertEqual((image.width, image.height), (1920, 1080))
+            self.assertTrue(image.are_valid_coordinates(1920, 1080))
+            self.assertFalse(image.are_valid_coordinates(1921, 1080))
+
+    def test_missing_file_has_no_dimensions(self):
+        image = Image.objects.create(name="Missing Image", image='images/missing.png', author=self.user)
+
+        self.assertEqual(Image.objects.get(pk=image.pk).dimensions(), (None, None))
+
+    def test_dimensions_replaced_with_image(self):
+        self.image.image = ImageHelper.get_image_file(name='smaller.png', size=(30, 20))
+        self.image.save()
+
+        self.assertEqual((self.image.width, self.image.height), (30, 20))
+        self.assertFalse(Image.objects.get(pk=self.image.pk).are_valid_coordinates(31, 0))
+
+    def test_dimensions_read_from_file_until_stored(self):
+        Image.objects.filter(pk=self.image.pk).update(width=None, height=None)
+        image = Image.objects.get(pk=self.image.pk)
+
+        self.assertEqual(image.dimensions(), (1920, 1080))
+        self.assertTrue(image.are_valid_coordinates(1920, 1080))
+
+    def test_unreadable_image_has_no_valid_coordinates(self):
+        image = Image.objects.create(
+            name="Broken Image",
+            image=SimpleUploadedFile("broken.jpg", b"file_content", content_type="image/jpeg"),
+            author=self.user,
+        )
+
+        self.assertEqual((image.width, image.height), (None, None))
+        self.assertFalse(image.are_valid_coordinates(0, 0))
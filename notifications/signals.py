@@ -3,6 +3,7 @@ from django.dispatch import receiver
 from django.apps import apps
 from django.conf import settings
 import logging
+from boards.validation import PENDING, VERIFIED
 from .views import add_event
 
 logger = logging.getLogger(__name__)
@@ -27,11 +28,17 @@ def handle_new_gameboard(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender='boards.Solution')
-def handle_new_solution(sender, instance, created, **kwargs):
+def handle_new_solution(sender, instance, created, update_fields, **kwargs):
     """
-    Signal handler that triggers when a new Solution (Path) is created
+    Signal handler that triggers when a new Solution (Path) is created, or when an
+    asynchronously submitted one is verified before it was ever edited
     """
     if created:
+        new = instance.status != PENDING
+    else:
+        new = bool(update_fields) and 'status' in update_fields \
+            and instance.status == VERIFIED and instance.revision == 1
+    if new:
         try:
             # Only trigger for new solutions, not updates
             data = {
@@ -44,3 +51,23 @@ def handle_new_solution(sender, instance, created, **kwargs):
             logger.info(f"SSE event generated for new path: {event}")
         except Exception as e:
             logger.error(f"Error generating SSE event for new path: {e}")
+
+
+@receiver(post_save, sender='boards.Solution')
+def handle_solution_verified(sender, instance, created, update_fields, **kwargs):
+    """
+    Signal handler that triggers when an asynchronously submitted Solution has been verified
+    """
+    if not created and update_fields and 'status' in update_fields:
+        try:
+            data = {
+                "path_id": str(instance.id),
+                "board_id": str(instance.game_board_id),
+                "status": instance.status,
+                "rejection_reason": instance.rejection_reason,
+                "user_username": instance.user.username
+            }
+            event = add_event("pathVerified", data)
+            logger.info(f"SSE event generated for verified path: {event}")
+        except Exception as e:
+            logger.error(f"Error generating SSE event for verified path: {e}")
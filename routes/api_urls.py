@@ -5,6 +5,10 @@ urlpatterns = [
     path('', RouteListAPIView.as_view(), name='api_routes_list'),
     path('<int:route_id>/', RouteAPIView.as_view(), name='api_route'),
     path('<int:route_id>/points/', PointCreateAPIView.as_view(), name='api_point_create'),
+    path('<int:route_id>/points/stream/', PointStreamAPIView.as_view(), name='api_points_stream'),
+    path('<int:route_id>/points/batch/', PointBatchAPIView.as_view(), name='api_points_batch'),
+    path('<int:route_id>/points/reorder/', PointReorderAPIView.as_view(), name='api_points_reorder'),
     path('<int:route_id>/points/<int:point_id>/', PointAPIView.as_view(), name='api_point_detail'),
+    path('<int:route_id>/points/<int:point_id>/move/', PointMoveAPIView.as_view(), name='api_point_move'),
     path('<int:route_id>/points/<int:point_id>/delete/', PointDeleteAPIView.as_view(), name='api_point_delete'),
 ]
\ No newline at end of file
@@ -1,10 +1,15 @@
 ﻿from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.conf import settings
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from images import models as images_models
 from .serializers import *
+from . import batch, ordering, streaming
 
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from common.conditional import bump_version, versioned_etag
 
 class RouteListAPIView(APIView):
     @extend_schema(
@@ -42,6 +47,10 @@ class RouteListAPIView(APIView):
         serializer.save(author=request.user)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+def _route_version(request, route_id):
+    # The details embed the image, so its edits change the representation as well
+    return Route.objects.filter(id=route_id).values_list('version', 'image__version').first()
+
 class RouteAPIView(APIView):
     serializer_class = RouteDetailsSerializer
 
@@ -51,6 +60,7 @@ class RouteAPIView(APIView):
         description="Get details of a specific route.",
         tags=["Routes"]
     )
+    @versioned_etag(_route_version)
     def get(self, request, route_id):
         try:
             route = Route.objects.get(id=route_id)
@@ -86,8 +96,8 @@ class RouteAPIView(APIView):
     responses={201: PointSerializer,
                400: OpenApiResponse(description="Invalid data"),
                403: OpenApiResponse(description="You do not have permission to modify this route", examples={"application/json": {"error": "You do not have permission to modify this route"}}),
-               404: OpenApiResponse(description="Route not found")},
-    description="Create a new point in a route.",
+               404: OpenApiResponse(description="Route or point to insert after not found")},
+    description="Create a new point in a route, at its end or right after a given point.",
     tags=["Routes"],
 )
 class PointCreateAPIView(APIView):
@@ -109,7 +119,15 @@ class PointCreateAPIView(APIView):
         if not route.image.are_valid_coordinates(request.data['lat'], request.data['lon']):
             return Response({"error": "Invalid coordinates"}, status=status.HTTP_400_BAD_REQUEST)
 
-        serializer.save(route=route, order=route.get_points().count() + 1)
+        with transaction.atomic():
+            if 'after' in serializer.validated_data:
+                try:
+                    order = ordering.order_after(route, serializer.validated_data.pop('after'))
+                except Point.DoesNotExist as e:
+                    return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+            else:
+                order = ordering.append_order(route)
+            serializer.save(route=route, order=order)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 @extend_schema(
@@ -161,4 +179,169 @@ class PointDeleteAPIView(APIView):
             return Response({"error": "You do not have permission to modify this route"}, status=status.HTTP_403_FORBIDDEN)
 
         point.delete()
+        bump_version(Route, point.route_id)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+class PointStreamAPIView(APIView):
+    @extend_schema(
+        responses={
+            200: OpenApiResponse(description="Newline delimited JSON, one point per line in route order"),
+            400: OpenApiResponse(description="Invalid query parameters"),
+            404: OpenApiResponse(description="Route not found"),
+            412: OpenApiResponse(description="The route changed since the given version"),
+        },
+        parameters=[
+            OpenApiParameter(name='after_order', type=int, required=False,
+                             description="Order of the last point already received, together with after_id."),
+            OpenApiParameter(name='after_id', type=int, required=False,
+                             description="Id of the last point already received, together with after_order."),
+            OpenApiParameter(name='limit', type=int, required=False,
+                             description="Return at most this many points. All remaining points are streamed when omitted."),
+            OpenApiParameter(name='version', type=int, required=False,
+                             description="Version of the route the previous pages were read at."),
+        ],
+        description="Stream the points of a route without loading them all into memory. "
+                    "Pages follow each other by passing the order and id of the last point received. "
+                    "Points are renumbered when moved, so clients paging through a route pass the route version "
+                    "as well: once the route has changed the request fails with 412 and the current version, "
+                    "and paging restarts from the first point.",
+        tags=["Routes"]
+    )
+    @versioned_etag(_route_version)
+    def get(self, request, route_id):
+        current_version = Route.objects.filter(id=route_id).values_list('version', flat=True).first()
+        if current_version is None:
+            return Response({"error": "Route not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            after_order, after_id, limit, version = (
+                int(request.query_params[name]) if name in request.query_params else None
+                for name in ('after_order', 'after_id', 'limit', 'version')
+            )
+        except ValueError:
+            return Response({"error": "after_order, after_id, limit and version must be integers"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if (after_order is None) != (after_id is None) or (limit is not None and limit < 1):
+            return Response({"error": "Pass both after_order and after_id, and a positive limit"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if version is not None and version != current_version:
+            return Response({"error": "Route changed", "version": current_version},
+                            status=status.HTTP_412_PRECONDITION_FAILED)
+
+        points = Point.objects.filter(route_id=route_id).order_by('order', 'id')
+        if after_order is not None:
+            points = streaming.after(points, after_order, after_id)
+        if limit is not None:
+            points = points[:limit]
+
+        chunk_size = settings.ROUTES_POINT_STREAM_CHUNK_SIZE
+        return StreamingHttpResponse(streaming.to_ndjson(points, chunk_size), content_type=streaming.CONTENT_TYPE)
+
+@extend_schema(
+    request=PointBatchSerializer,
+    responses={
+        200: PointBatchResultSerializer,
+        400: OpenApiResponse(description="Invalid data or coordinates"),
+        403: OpenApiResponse(description="You do not have permission to modify this route"),
+        404: OpenApiResponse(description="Route or point not found")
+    },
+    description="Delete and append many points of a route at once. Either all changes are applied or none.",
+    tags=["Routes"],
+)
+class PointBatchAPIView(APIView):
+    def post(self, request, route_id):
+        try:
+            route = Route.objects.select_related('image').get(id=route_id)
+        except Route.DoesNotExist:
+            return Response({"error": "Route not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        if not route.can_modify(request.user):
+            return Response({"error": "You do not have permission to modify this route"}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = PointBatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        coordinates = [(point['lat'], point['lon']) for point in serializer.validated_data.get('add', [])]
+        try:
+            batch.validate_coordinates(route.image, coordinates)
+            with transaction.atomic():
+                deleted = batch.delete_points(route, serializer.validated_data.get('delete', []))
+                points = batch.append_points(route, coordinates)
+        except Point.DoesNotExist as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(PointBatchResultSerializer({'deleted': deleted, 'points': points}).data)
+
+@extend_schema(
+    request=MovePointSerializer,
+    responses={
+        200: PointSerializer,
+        400: OpenApiResponse(description="Invalid data"),
+        403: OpenApiResponse(description="You do not have permission to modify this route"),
+        404: OpenApiResponse(description="Route or point not found")
+    },
+    description="Move a point right after another point of the route, without renumbering the others.",
+    tags=["Routes"],
+)
+class PointMoveAPIView(APIView):
+    def post(self, request, route_id, point_id):
+        try:
+            route = Route.objects.get(id=route_id)
+            point = route.get_points().get(id=point_id)
+        except Route.DoesNotExist:
+            return Response({"error": "Route not found"}, status=status.HTTP_404_NOT_FOUND)
+        except Point.DoesNotExist:
+            return Response({"error": "Point not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        if not route.can_modify(request.user):
+            return Response({"error": "You do not have permission to modify this route"}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = MovePointSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            ordering.move_point(route, point, serializer.validated_data['after'])
+        except Point.DoesNotExist as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(PointSerializer(point).data)
+
+@extend_schema(
+    request=ReorderPointsSerializer,
+    responses={
+        204: OpenApiResponse(description="Points reordered"),
+        400: OpenApiResponse(description="Invalid data or duplicate order values"),
+        403: OpenApiResponse(description="You do not have permission to modify this route"),
+        404: OpenApiResponse(description="Route or point not found")
+    },
+    description="Set the order of points in a route.",
+    tags=["Routes"],
+)
+class PointReorderAPIView(APIView):
+    def post(self, request, route_id):
+        try:
+            route = Route.objects.get(id=route_id)
+        except Route.DoesNotExist:
+            return Response({"error": "Route not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        if not route.can_modify(request.user):
+            return Response({"error": "You do not have permission to modify this route"}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = ReorderPointsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            route.reorder_points((item['id'], item['order']) for item in serializer.validated_data['order'])
+        except Point.DoesNotExist as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
         return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.db import transaction
+
+from common.conditional import bump_version
+from . import ordering
+from .models import Point, Route
+
+
+def validate_coordinates(image, coordinates):
+    """
+    Check every ``(lat, lon)`` pair against the image bounds in one pass.
+
+    The bounds come from the stored image dimensions, so the file is not opened. Raises
+    ``ValueError`` naming the position of the first pair outside the image.
+    """
+    for index, (lat, lon) in enumerate(coordinates):
+        if not image.are_valid_coordinates(lat, lon):
+            raise ValueError(f"Invalid coordinates of point {index}")
+
+
+def delete_points(route, point_ids) -> int:
+    """
+    Delete points of the route with a single ``DELETE ... IN``.
+
+    Must run inside a transaction. Raises ``Point.DoesNotExist`` when an id is not a
+    point of the route, before anything is deleted. Returns the number of deleted points.
+    """
+    point_ids = set(point_ids)
+    if not point_ids:
+        return 0
+
+    points = route.get_points().filter(id__in=point_ids).order_by()
+    found = set(points.select_for_update().values_list('id', flat=True))
+    missing = point_ids - found
+    if missing:
+        raise Point.DoesNotExist(f"Point with id {min(missing)} not found")
+
+    # Nothing references points and no delete signals are connected, so this is one fast
+    # DELETE; the route is marked as changed once here
+    deleted, _ = points.delete()
+    bump_version(Route, route.pk)
+    return deleted
+
+
+def append_points(route, coordinates) -> list[Point]:
+    """
+    Append points at ``(lat, lon)`` pairs to the route with ``bulk_create``.
+
+    Must run inside a transaction. The points follow each other at the regular order
+    gap after the last point of the route, in the given order. Coordinates are not
+    checked here, see ``validate_coordinates``.
+    """
+    if not coordinates:
+        return []
+
+    start = ordering.append_order(route)
+    gap = settings.ROUTES_POINT_ORDER_GAP
+    points = Point.objects.bulk_create([
+        Point(route=route, lat=lat, lon=lon, order=start + index * gap)
+        for index, (lat, lon) in enumerate(coordinates)
+    ])
+    # bulk_create sends no post_save signals, so the route is marked as changed here
+    bump_version(Route, route.pk)
+    return points
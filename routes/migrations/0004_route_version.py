@@ -0,0 +1,18 @@
+# Generated by Django 4.2.25 on 2026-10-18 16:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0003_alter_point_route'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='route',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
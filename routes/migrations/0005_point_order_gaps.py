@@ -0,0 +1,31 @@
+# Generated by Django 4.2.25 on 2026-10-18 17:31
+
+from django.db import migrations, models
+
+# ROUTES_POINT_ORDER_GAP when the migration was written; later changes to the setting apply on rebalance
+ORDER_GAP = 1024
+
+
+def spread_point_orders(apps, schema_editor):
+    Point = apps.get_model('routes', 'Point')
+    route_ids = list(Point.objects.order_by().values_list('route_id', flat=True).distinct())
+    for route_id in route_ids:
+        points = list(Point.objects.filter(route_id=route_id).order_by('order', 'id').only('id', 'order'))
+        for position, point in enumerate(points, 1):
+            point.order = position * ORDER_GAP
+        Point.objects.bulk_update(points, ['order'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0004_route_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='point',
+            index=models.Index(fields=['route', 'order'], name='point_route_order_idx'),
+        ),
+        migrations.RunPython(spread_point_orders, migrations.RunPython.noop),
+    ]
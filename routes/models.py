@@ -1,12 +1,14 @@
-from django.db import models
+from django.db import models, transaction
 from images import models as img_models
 from django.conf import settings
+from common.conditional import bump_version
 
 class Route(models.Model):
     id = models.AutoField(primary_key=True)
     name = models.CharField(max_length=250, default="")
     image = models.ForeignKey(img_models.Image, on_delete=models.CASCADE)
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    version = models.PositiveIntegerField(default=1)
 
     def can_modify(self, user):
         return self.author == user
@@ -14,6 +16,30 @@ class Route(models.Model):
     def get_points(self):
         return Point.objects.filter(route=self)
 
+    def reorder_points(self, orders):
+        """
+        Give points of this route new ``order`` values from ``(point_id, order)`` pairs.
+
+        The points are loaded with one query and written with one ``bulk_update``, in a
+        transaction. Raises ``Point.DoesNotExist`` for an id outside the route and
+        ``ValueError`` for repeated order values; nothing is written in either case.
+        """
+        orders = list(orders)
+        with transaction.atomic():
+            points = {point.id: point for point in self.get_points().filter(id__in={pk for pk, _ in orders})
+                      .order_by().select_for_update().only('id', 'order')}
+            for point_id, order in orders:
+                if point_id not in points:
+                    raise Point.DoesNotExist(f"Point with id {point_id} not found")
+                points[point_id].order = order
+
+            if len({order for _, order in orders}) != len(orders):
+                raise ValueError("Duplicate order values found")
+
+            Point.objects.bulk_update(points.values(), ['order'])
+            # bulk_update sends no post_save signals, so the route is marked as changed here
+            bump_version(Route, self.pk)
+
     def __str__(self):
         return self.name
 
@@ -26,6 +52,9 @@ class Point(models.Model):
 
     class Meta:
         ordering = ['order']
+        indexes = [
+            models.Index(fields=['route', 'order'], name='point_route_order_idx'),
+        ]
 
     def __str__(self):
         return f"Point <{self.lat}, {self.lon}: {self.order}>"
\ No newline at end of file
@@ -0,0 +1,157 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Max
+
+from common.conditional import bump_version
+from .models import Point, Route
+
+logger = logging.getLogger(__name__)
+
+# A renumbering is queued once the gap left next to an inserted point is smaller than this
+CROWDED_GAP = 8
+
+_executor = None
+_executor_lock = Lock()
+
+# Routes with a renumbering queued but not started yet
+_pending = set()
+_pending_lock = Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.ROUTES_REBALANCE_WORKERS,
+                thread_name_prefix='route-rebalance',
+            )
+        return _executor
+
+
+def rebalance(route_id) -> int:
+    """
+    Renumber the points of a route to multiples of ``ROUTES_POINT_ORDER_GAP``, keeping their order.
+
+    Only points whose order changes are written, with one ``bulk_update``. Returns how
+    many points were renumbered. The route row is locked first, like for insertions,
+    so a point cannot be placed between orders that are about to be rewritten.
+    """
+    gap = settings.ROUTES_POINT_ORDER_GAP
+    with transaction.atomic():
+        _lock(route_id)
+        points = list(Point.objects.select_for_update().filter(route_id=route_id)
+                      .order_by('order', 'id').only('id', 'order'))
+        changed = []
+        for position, point in enumerate(points, 1):
+            if point.order != position * gap:
+                point.order = position * gap
+                changed.append(point)
+        if changed:
+            Point.objects.bulk_update(changed, ['order'])
+            # bulk_update sends no post_save signals, so the route is marked as changed here
+            bump_version(Route, route_id)
+    return len(changed)
+
+
+def _run(route_id):
+    with _pending_lock:
+        _pending.discard(route_id)
+    close_old_connections()
+    try:
+        rebalance(route_id)
+    except Exception:
+        logger.exception(f"Renumbering points of route {route_id} failed")
+    finally:
+        connection.close()
+
+
+def submit_rebalance(route_id):
+    """
+    Queue a renumbering of the route points once the current transaction commits.
+
+    A route already waiting for one is not queued again. With ``ROUTES_REBALANCE_WORKERS``
+    set to 0 the points are renumbered in the calling thread instead.
+    """
+    if settings.ROUTES_REBALANCE_WORKERS <= 0:
+        transaction.on_commit(lambda: rebalance(route_id))
+        return
+
+    with _pending_lock:
+        if route_id in _pending:
+            return
+        _pending.add(route_id)
+    transaction.on_commit(lambda: get_executor().submit(_run, route_id))
+
+
+def _neighbours(route, after_id, exclude):
+    points = route.get_points()
+    if exclude is not None:
+        points = points.exclude(pk=exclude)
+
+    low = None
+    if after_id is not None:
+        low = points.filter(pk=after_id).values_list('order', flat=True).first()
+        if low is None:
+            raise Point.DoesNotExist(f"Point with id {after_id} not found")
+        points = points.filter(order__gt=low)
+    high = points.order_by('order').values_list('order', flat=True).first()
+    return low, high
+
+
+def _lock(route_id):
+    Route.objects.select_for_update().filter(pk=route_id).values_list('pk', flat=True).first()
+
+
+def append_order(route) -> int:
+    """
+    Order value placing a new point after every point of the route.
+
+    Like ``order_after`` it must run in the transaction that saves the point.
+    """
+    _lock(route.pk)
+    last = route.get_points().aggregate(last=Max('order'))['last']
+    return (last or 0) + settings.ROUTES_POINT_ORDER_GAP
+
+
+def order_after(route, after_id=None, exclude=None) -> int:
+    """
+    Order value placing a point right after the point ``after_id``, or first when it is ``None``.
+
+    Must run in the transaction that then saves the point: the route row stays locked
+    until it commits, so concurrent insertions cannot pick the same value. The value is
+    halfway between the neighbours, found with two indexed lookups. Only when they are
+    adjacent is the route renumbered on the spot; a gap that merely got small queues a
+    renumbering in the background. ``exclude`` is the point being moved, which is not
+    its own neighbour. Raises ``Point.DoesNotExist`` when ``after_id`` is not a point of
+    the route.
+    """
+    gap = settings.ROUTES_POINT_ORDER_GAP
+    _lock(route.pk)
+    low, high = _neighbours(route, after_id, exclude)
+    if high is None:
+        return append_order(route) if low is None else low + gap
+    if low is None:
+        return high - gap
+
+    if high - low < 2:
+        rebalance(route.pk)
+        low, high = _neighbours(route, after_id, exclude)
+
+    order = (low + high) // 2
+    if min(order - low, high - order) < CROWDED_GAP:
+        submit_rebalance(route.pk)
+    return order
+
+
+def move_point(route, point, after_id=None):
+    """Move a point of the route right after the point ``after_id``, or to the front when it is ``None``."""
+    if after_id == point.pk:
+        raise ValueError("A point cannot be moved after itself")
+    with transaction.atomic():
+        point.order = order_after(route, after_id, exclude=point.pk)
+        point.save(update_fields=['order'])
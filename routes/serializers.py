@@ -1,5 +1,6 @@
 ﻿from common.serializers import UserSerializer
 from images.serializers import ImageSerializer
+from django.conf import settings
 from rest_framework import serializers
 from .models import Route, Point
 
@@ -13,16 +14,51 @@ class PointSerializer(serializers.ModelSerializer):
             'order': {'required': True}
         }
 
+class PointOrderSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    order = serializers.IntegerField()
+
+class ReorderPointsSerializer(serializers.Serializer):
+    order = PointOrderSerializer(many=True)
+
 class CreatePointSerializer(serializers.ModelSerializer):
+    after = serializers.IntegerField(required=False, allow_null=True, write_only=True,
+                                     help_text="Insert the point right after this point, or first when null. "
+                                               "Points are appended when omitted.")
+
     class Meta:
         model = Point
-        fields = ['lat', 'lon']
+        fields = ['lat', 'lon', 'after']
         extra_kwargs = {
             'lat': {'required': True},
             'lon': {'required': True},
             'order': {'required': False}
         }
 
+class MovePointSerializer(serializers.Serializer):
+    after = serializers.IntegerField(allow_null=True,
+                                     help_text="Move the point right after this point, or to the front when null.")
+
+class PointCoordinatesSerializer(serializers.Serializer):
+    lat = serializers.IntegerField()
+    lon = serializers.IntegerField()
+
+class PointBatchSerializer(serializers.Serializer):
+    delete = serializers.ListField(child=serializers.IntegerField(), required=False,
+                                   max_length=settings.ROUTES_MAX_POINT_BATCH,
+                                   help_text="Ids of points to delete, applied before points are added.")
+    add = PointCoordinatesSerializer(many=True, required=False, max_length=settings.ROUTES_MAX_POINT_BATCH,
+                                     help_text="Points appended to the route in the given order.")
+
+    def validate(self, attrs):
+        if not attrs.get('delete') and not attrs.get('add'):
+            raise serializers.ValidationError("Nothing to add or delete.")
+        return attrs
+
+class PointBatchResultSerializer(serializers.Serializer):
+    deleted = serializers.IntegerField()
+    points = PointSerializer(many=True, help_text="The added points.")
+
 class RouteDetailsSerializer(serializers.ModelSerializer):
     points = PointSerializer(many=True, read_only=True)
     author = UserSerializer(read_only=True)
@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from common.conditional import bump_version
+from .models import Point, Route
+
+
+# Deleted points are handled by the views deleting them: a post_delete receiver would
+# turn off fast deletes and bump the version once per point when a route is deleted
+@receiver(post_save, sender=Point)
+def handle_point_change(sender, instance, **kwargs):
+    """
+    Signal handler that marks the route of a created or edited Point as changed
+    """
+    bump_version(Route, instance.route_id)
+
+
+@receiver(post_save, sender=Route)
+def handle_route_change(sender, instance, created, **kwargs):
+    """
+    Signal handler that marks an edited Route as changed
+    """
+    if not created:
+        bump_version(Route, instance.pk)
@@ -0,0 +1,26 @@
+from itertools import islice
+
+from django.db.models import Q
+
+CONTENT_TYPE = 'application/x-ndjson'
+
+FIELDS = ('id', 'lat', 'lon', 'order')
+
+
+def after(points, order: int, point_id: int):
+    """Points following the point at ``(order, point_id)``, the cursor of the previous page."""
+    return points.filter(Q(order__gt=order) | Q(order=order, id__gt=point_id))
+
+
+def to_ndjson(points, chunk_size: int):
+    """
+    Yield the points as NDJSON, one line per point with the fields of ``PointSerializer``.
+
+    The points keep the order of the queryset, usually ``('order', 'id')``. Rows are read
+    as tuples with a server-side cursor, ``chunk_size`` at a time, and every chunk is
+    yielded as one string, so memory does not grow with the route.
+    """
+    rows = points.values_list(*FIELDS).iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        # Every field is an integer, so formatting the line directly is safe and much faster than json.dumps
+        yield ''.join(f'{{"id":{pk},"lat":{lat},"lon":{lon},"order":{order}}}\n' for pk, lat, lon, order in chunk)
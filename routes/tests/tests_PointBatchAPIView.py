@@ -0,0 +1,148 @@
+﻿from io import BytesIO
+
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from routes.models import Route, Point
+from images.models import Image
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image as PILImage
+
+
+def png(width, height):
+    output = BytesIO()
+    PILImage.new('RGB', (width, height)).save(output, 'PNG')
+    return output.getvalue()
+
+
+class PointBatchAPIViewTests(TestCase):
+    def setUp(self):
+        # Create test users
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.other_user = User.objects.create_user(username="otheruser", password="otherpassword")
+
+        # Setup API client
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        # Create test image of 100x50 pixels
+        self.image = Image.objects.create(
+            name="Test Image",
+            image=SimpleUploadedFile("test_image.png", png(100, 50), content_type="image/png"),
+            author=self.user,
+            is_public=True
+        )
+
+        # Create test route with points
+        self.route = Route.objects.create(name="Test Route", image=self.image, author=self.user)
+        self.first = Point.objects.create(route=self.route, lat=1, lon=1, order=1024)
+        self.second = Point.objects.create(route=self.route, lat=2, lon=2, order=2048)
+
+        self.url = reverse('api_points_batch', kwargs={'route_id': self.route.id})
+
+    def version(self):
+        return Route.objects.get(id=self.route.id).version
+
+    def test_add_points(self):
+        gap = settings.ROUTES_POINT_ORDER_GAP
+        version = self.version()
+        added = [{'lat': i % 100, 'lon': i % 50} for i in range(500)]
+
+        response = self.client.post(self.url, {'add': added}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['deleted'], 0)
+        self.assertEqual(len(response.data['points']), 500)
+        points = list(self.route.get_points())[2:]
+        self.assertEqual([{'lat': point.lat, 'lon': point.lon} for point in points], added)
+        self.assertEqual([point.order for point in points], [2048 + gap * (i + 1) for i in range(500)])
+        self.assertEqual(response.data['points'][0]['id'], points[0].id)
+        self.assertEqual(self.version(), version + 1)
+
+    def test_query_count_does_not_depend_on_batch_size(self):
+        def count_queries(size):
+            with CaptureQueriesContext(connection) as context:
+                self.client.post(self.url, {'add': [{'lat': 1, 'lon': 1}] * size}, format='json')
+            return len(context.captured_queries)
+
+        # Both fit into a single INSERT on every backend
+        self.assertEqual(count_queries(3), count_queries(200))
+
+    def test_delete_points(self):
+        version = self.version()
+
+        response = self.client.post(self.url, {'delete': [self.first.id, self.second.id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'deleted': 2, 'points': []})
+        self.assertFalse(self.route.get_points().exists())
+        self.assertEqual(self.version(), version + 1)
+
+    def test_delete_query_count_does_not_depend_on_batch_size(self):
+        def count_queries(size):
+            points = Point.objects.bulk_create([Point(route=self.route, lat=1, lon=1, order=order)
+                                                for order in range(10000, 10000 + size)])
+            with CaptureQueriesContext(connection) as context:
+                self.client.post(self.url, {'delete': [point.id for point in points]}, format='json')
+            return len(context.captured_queries)
+
+        self.assertEqual(count_queries(3), count_queries(200))
+
+    def test_delete_and_add_points(self):
+        response = self.client.post(self.url, {'delete': [self.second.id], 'add': [{'lat': 100, 'lon': 50}]},
+                                    format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['deleted'], 1)
+        self.assertEqual([(point.lat, point.lon) for point in self.route.get_points()], [(1, 1), (100, 50)])
+
+    def test_delete_missing_point(self):
+        other_route = Route.objects.create(name="Other Route", image=self.image, author=self.other_user)
+        other_point = Point.objects.create(route=other_route, lat=1, lon=1, order=1)
+
+        response = self.client.post(self.url, {'delete': [self.first.id, other_point.id], 'add': [{'lat': 1, 'lon': 1}]},
+                                    format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {"error": f"Point with id {other_point.id} not found"})
+        self.assertEqual(Point.objects.count(), 3)
+
+    def test_invalid_coordinates(self):
+        response = self.client.post(self.url, {'delete': [self.first.id], 'add': [{'lat': 1, 'lon': 1}, {'lat': 101, 'lon': 1}]},
+                                    format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "Invalid coordinates of point 1"})
+        self.assertEqual(self.route.get_points().count(), 2)
+
+    def test_empty_batch(self):
+        response = self.client.post(self.url, {'add': [], 'delete': []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_data(self):
+        response = self.client.post(self.url, {'add': [{'lat': 1}]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('add', response.data)
+
+    def test_route_not_found(self):
+        url = reverse('api_points_batch', kwargs={'route_id': 99999})
+
+        response = self.client.post(url, {'add': [{'lat': 1, 'lon': 1}]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {"error": "Route not found"})
+
+    def test_permission_denied(self):
+        self.client.force_authenticate(user=self.other_user)
+
+        response = self.client.post(self.url, {'delete': [self.first.id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.route.get_points().count(), 2)
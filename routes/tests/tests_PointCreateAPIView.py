@@ -1,4 +1,5 @@
-﻿from django.test import TestCase
+﻿from django.conf import settings
+from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth.models import User
 from rest_framework.test import APIClient
@@ -56,7 +57,7 @@ class PointCreateAPIViewTests(TestCase):
         self.assertEqual(point.lat, self.valid_point_data['lat'])
         self.assertEqual(point.lon, self.valid_point_data['lon'])
         self.assertEqual(point.route, self.route)
-        self.assertEqual(point.order, 1)
+        self.assertEqual(point.order, settings.ROUTES_POINT_ORDER_GAP)
 
     def test_create_point_route_not_found(self):
         url = reverse('api_point_create', kwargs={'route_id': 9999})
@@ -116,4 +117,27 @@ class PointCreateAPIViewTests(TestCase):
         self.assertEqual(Point.objects.count(), 2)
 
         new_point = Point.objects.get(lat=self.valid_point_data['lat'], lon=self.valid_point_data['lon'])
-        self.assertEqual(new_point.order, 2)
\ No newline at end of file
+        self.assertEqual(new_point.order, 1 + settings.ROUTES_POINT_ORDER_GAP)
+
+    @patch('images.models.Image.are_valid_coordinates')
+    def test_create_point_after_point(self, mock_are_valid_coordinates):
+        mock_are_valid_coordinates.return_value = True
+        first = Point.objects.create(route=self.route, lat=5, lon=5, order=1024)
+        last = Point.objects.create(route=self.route, lat=6, lon=6, order=2048)
+
+        response = self.client.post(self.url, {**self.valid_point_data, 'after': first.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        new_point = Point.objects.get(lat=self.valid_point_data['lat'], lon=self.valid_point_data['lon'])
+        self.assertEqual(new_point.order, 1536)
+        self.assertEqual(list(self.route.get_points()), [first, new_point, last])
+
+    @patch('images.models.Image.are_valid_coordinates')
+    def test_create_point_after_missing_point(self, mock_are_valid_coordinates):
+        mock_are_valid_coordinates.return_value = True
+
+        response = self.client.post(self.url, {**self.valid_point_data, 'after': 9999}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {"error": "Point with id 9999 not found"})
+        self.assertEqual(Point.objects.count(), 0)
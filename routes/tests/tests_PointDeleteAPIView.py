@@ -66,6 +66,15 @@ class PointDeleteAPIViewTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Point.objects.filter(id=self.point.id).exists())
 
+    def test_delete_point_bumps_route_version(self):
+        self.route.refresh_from_db()
+        version = self.route.version
+
+        self.client.delete(self.url)
+
+        self.route.refresh_from_db()
+        self.assertEqual(self.route.version, version + 1)
+
     def test_delete_point_route_not_found(self):
         url = reverse('api_point_delete', kwargs={'route_id': 9999, 'point_id': self.point.id})
 
@@ -0,0 +1,97 @@
+﻿from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from routes.models import Route, Point
+from images.models import Image
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+class PointReorderAPIViewTests(TestCase):
+    def setUp(self):
+        # Create test users
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.other_user = User.objects.create_user(username="otheruser", password="otherpassword")
+
+        # Setup API client
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        # Create test image
+        self.image = Image.objects.create(
+            name="Test Image",
+            image=SimpleUploadedFile("test_image.jpg", b"file_content", content_type="image/jpeg"),
+            author=self.user,
+            is_public=True
+        )
+
+        # Create test route with points
+        self.route = Route.objects.create(name="Test Route", image=self.image, author=self.user)
+        self.points = [Point.objects.create(route=self.route, lat=i, lon=i, order=i + 1) for i in range(20)]
+
+        # Create point in a route owned by other user
+        self.other_route = Route.objects.create(name="Other Route", image=self.image, author=self.other_user)
+        self.other_point = Point.objects.create(route=self.other_route, lat=15, lon=25, order=1)
+
+        self.url = reverse('api_points_reorder', kwargs={'route_id': self.route.id})
+
+    def reversed_order(self):
+        return [{'id': point.id, 'order': len(self.points) - i} for i, point in enumerate(self.points)]
+
+    def test_reorder_points_success(self):
+        version = Route.objects.get(id=self.route.id).version
+
+        # Route, user, savepoint, locked points, bulk update and version bump
+        # do not depend on the number of points
+        with self.assertNumQueries(7):
+            response = self.client.post(self.url, {'order': self.reversed_order()}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(list(self.route.get_points().values_list('id', flat=True)),
+                         [point.id for point in reversed(self.points)])
+        self.assertEqual(Route.objects.get(id=self.route.id).version, version + 1)
+
+    def test_reorder_points_partial(self):
+        response = self.client.post(self.url, {'order': [{'id': self.points[0].id, 'order': 100}]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.route.get_points().last(), self.points[0])
+
+    def test_reorder_points_duplicate_orders(self):
+        order = [{'id': self.points[0].id, 'order': 5}, {'id': self.points[1].id, 'order': 5}]
+
+        response = self.client.post(self.url, {'order': order}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], "Duplicate order values found")
+        self.assertEqual(Point.objects.get(id=self.points[0].id).order, 1)
+
+    def test_reorder_points_invalid_data(self):
+        response = self.client.post(self.url, {'order': [{'id': self.points[0].id}]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_reorder_points_of_other_route(self):
+        order = [{'id': self.points[0].id, 'order': 2}, {'id': self.other_point.id, 'order': 1}]
+
+        response = self.client.post(self.url, {'order': order}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['error'], f"Point with id {self.other_point.id} not found")
+        self.assertEqual(Point.objects.get(id=self.points[0].id).order, 1)
+
+    def test_reorder_points_route_not_found(self):
+        url = reverse('api_points_reorder', kwargs={'route_id': 99999})
+
+        response = self.client.post(url, {'order': self.reversed_order()}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['error'], "Route not found")
+
+    def test_reorder_points_permission_denied(self):
+        url = reverse('api_points_reorder', kwargs={'route_id': self.other_route.id})
+
+        response = self.client.post(url, {'order': [{'id': self.other_point.id, 'order': 2}]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Point.objects.get(id=self.other_point.id).order, 1)
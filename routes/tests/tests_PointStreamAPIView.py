@@ -0,0 +1,98 @@
+﻿import json
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from routes.models import Route, Point
+from images.models import Image
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+
+class PointStreamAPIViewTests(TestCase):
+    def setUp(self):
+        # Create test user
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+
+        # Setup API client
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        # Create test image
+        self.image = Image.objects.create(
+            name="Test Image",
+            image=SimpleUploadedFile("test_image.jpg", b"file_content", content_type="image/jpeg"),
+            author=self.user,
+            is_public=True
+        )
+
+        # Create test route with points, two of them sharing an order value
+        self.route = Route.objects.create(name="Test Route", image=self.image, author=self.user)
+        self.points = [Point.objects.create(route=self.route, lat=i, lon=2 * i, order=(i + 1) * 10) for i in range(6)]
+        self.points.insert(3, Point.objects.create(route=self.route, lat=9, lon=9, order=30))
+
+        self.url = reverse('api_points_stream', kwargs={'route_id': self.route.id})
+
+    def stream(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        return [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+
+    def expected(self, points):
+        return [{'id': point.id, 'lat': point.lat, 'lon': point.lon, 'order': point.order} for point in points]
+
+    def test_stream_all_points(self):
+        self.assertEqual(self.stream(), self.expected(self.points))
+
+    @override_settings(ROUTES_POINT_STREAM_CHUNK_SIZE=2)
+    def test_stream_in_chunks(self):
+        response = self.client.get(self.url)
+
+        chunks = list(response.streaming_content)
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual([json.loads(line) for line in b''.join(chunks).splitlines()], self.expected(self.points))
+
+    def test_pages(self):
+        received = []
+        page = self.stream(limit=2)
+        while page:
+            received += page
+            page = self.stream(after_order=page[-1]['order'], after_id=page[-1]['id'], limit=2)
+
+        self.assertEqual(received, self.expected(self.points))
+
+    def test_pages_of_changed_route_fail(self):
+        self.route.refresh_from_db()
+        version = self.route.version
+        page = self.stream(limit=2, version=version)
+        self.points[0].order = 100
+        self.points[0].save()
+
+        response = self.client.get(self.url, {'after_order': page[-1]['order'], 'after_id': page[-1]['id'],
+                                              'limit': 2, 'version': version})
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response.data, {"error": "Route changed", "version": version + 1})
+        self.assertEqual(len(self.stream(limit=2, version=version + 1)), 2)
+
+    def test_not_modified(self):
+        response = self.client.get(self.url)
+        b''.join(response.streaming_content)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_invalid_parameters(self):
+        for params in ({'limit': 'x'}, {'limit': 0}, {'after_order': 10}, {'after_id': 1, 'after_order': 'a'},
+                       {'version': 'x'}):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_route_not_found(self):
+        response = self.client.get(reverse('api_points_stream', kwargs={'route_id': 99999}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {"error": "Route not found"})
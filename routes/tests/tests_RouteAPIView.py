@@ -119,4 +119,42 @@ class RouteAPIViewTests(APITestCase):
         response = self.client.delete(self.route_url)
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-        self.assertTrue(Route.objects.filter(id=self.route.id).exists())
\ No newline at end of file
+        self.assertTrue(Route.objects.filter(id=self.route.id).exists())
+
+    def test_get_route_not_modified(self):
+        self.client.force_login(self.user)
+        etag = self.client.get(self.route_url)['ETag']
+
+        response = self.client.get(self.route_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_point_changes_invalidate_etag(self):
+        self.client.force_login(self.user)
+        etag = self.client.get(self.route_url)['ETag']
+        self.pointA.lat = 13
+        self.pointA.save()
+
+        response = self.client.get(self.route_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+        self.client.delete(f"/api/routes/{self.route.id}/points/{self.pointB.id}/delete/")
+
+        response = self.client.get(self.route_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["points"]), 1)
+
+    def test_delete_route_does_not_touch_points_one_by_one(self):
+        self.client.force_login(self.user)
+        Point.objects.bulk_create([Point(lat=1, lon=1, route=self.route, order=order) for order in range(3, 53)])
+
+        # Points are removed with the route by one cascaded DELETE, not loaded and signalled per point
+        with self.assertNumQueries(6):
+            response = self.client.delete(self.route_url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Point.objects.filter(route_id=self.route.id).exists())
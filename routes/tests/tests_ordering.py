@@ -0,0 +1,161 @@
+﻿from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from images.models import Image
+from routes import ordering
+from routes.models import Route, Point
+
+
+@override_settings(ROUTES_POINT_ORDER_GAP=1024, ROUTES_REBALANCE_WORKERS=0)
+class OrderingTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.image = Image.objects.create(
+            name="Test Image",
+            image=SimpleUploadedFile("test_image.jpg", b"file_content", content_type="image/jpeg"),
+            author=self.user,
+            is_public=True
+        )
+        self.route = Route.objects.create(name="Test Route", image=self.image, author=self.user)
+
+    def add(self, order):
+        return Point.objects.create(route=self.route, lat=0, lon=0, order=order)
+
+    def orders(self):
+        return list(self.route.get_points().values_list('order', flat=True))
+
+    def test_append_order(self):
+        with transaction.atomic():
+            self.assertEqual(ordering.append_order(self.route), 1024)
+        self.add(3000)
+        with transaction.atomic():
+            self.assertEqual(ordering.append_order(self.route), 4024)
+
+    def test_order_after_takes_the_middle(self):
+        first, second = self.add(1024), self.add(2048)
+
+        with transaction.atomic():
+            self.assertEqual(ordering.order_after(self.route, first.id), 1536)
+            self.assertEqual(ordering.order_after(self.route, second.id), 3072)
+            self.assertEqual(ordering.order_after(self.route, None), 0)
+
+    def test_order_after_point_of_other_route(self):
+        other_route = Route.objects.create(name="Other Route", image=self.image, author=self.user)
+        other = Point.objects.create(route=other_route, lat=0, lon=0, order=1)
+
+        with transaction.atomic(), self.assertRaisesMessage(Point.DoesNotExist, f"Point with id {other.id} not found"):
+            ordering.order_after(self.route, other.id)
+
+    def test_order_after_renumbers_adjacent_points(self):
+        first, second, third = self.add(1), self.add(2), self.add(3)
+
+        with transaction.atomic():
+            order = ordering.order_after(self.route, first.id)
+
+        self.assertEqual(self.orders(), [1024, 2048, 3072])
+        self.assertEqual(order, 1536)
+
+    def test_crowded_gap_queues_rebalance(self):
+        first, second = self.add(1024), self.add(1034)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.assertEqual(ordering.order_after(self.route, first.id), 1029)
+
+        self.assertEqual(self.orders(), [1024, 2048])
+
+    def test_rebalance_keeps_order_and_bumps_version(self):
+        points = [self.add(order) for order in (-5, 7, 7, 100)]
+        version = Route.objects.get(pk=self.route.pk).version
+
+        self.assertEqual(ordering.rebalance(self.route.pk), 4)
+
+        self.assertEqual(list(self.route.get_points()), points)
+        self.assertEqual(self.orders(), [1024, 2048, 3072, 4096])
+        self.assertEqual(Route.objects.get(pk=self.route.pk).version, version + 1)
+        self.assertEqual(ordering.rebalance(self.route.pk), 0)
+
+    def test_rebalance_locks_route(self):
+        self.add(7)
+
+        with patch.object(ordering, '_lock', wraps=ordering._lock) as lock:
+            ordering.rebalance(self.route.pk)
+
+        lock.assert_called_once_with(self.route.pk)
+
+    @override_settings(ROUTES_REBALANCE_WORKERS=1)
+    def test_rebalance_queued_once(self):
+        with patch.object(ordering, 'get_executor') as get_executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                ordering.submit_rebalance(self.route.pk)
+                ordering.submit_rebalance(self.route.pk)
+
+        get_executor.return_value.submit.assert_called_once_with(ordering._run, self.route.pk)
+        ordering._pending.discard(self.route.pk)
+
+    def test_move_point(self):
+        first, second, third = self.add(1024), self.add(2048), self.add(3072)
+
+        ordering.move_point(self.route, third, first.id)
+        self.assertEqual(list(self.route.get_points()), [first, third, second])
+
+        ordering.move_point(self.route, first, None)
+        self.assertEqual(list(self.route.get_points()), [first, third, second])
+
+        ordering.move_point(self.route, first, second.id)
+        self.assertEqual(list(self.route.get_points()), [third, second, first])
+
+        with self.assertRaisesMessage(ValueError, "A point cannot be moved after itself"):
+            ordering.move_point(self.route, first, first.id)
+
+
+class PointMoveAPIViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.other_user = User.objects.create_user(username="otheruser", password="otherpassword")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.image = Image.objects.create(
+            name="Test Image",
+            image=SimpleUploadedFile("test_image.jpg", b"file_content", content_type="image/jpeg"),
+            author=self.user,
+            is_public=True
+        )
+        self.route = Route.objects.create(name="Test Route", image=self.image, author=self.user)
+        self.first = Point.objects.create(route=self.route, lat=1, lon=1, order=1024)
+        self.second = Point.objects.create(route=self.route, lat=2, lon=2, order=2048)
+        self.url = reverse('api_point_move', kwargs={'route_id': self.route.id, 'point_id': self.second.id})
+
+    def test_move_point_to_front(self):
+        response = self.client.post(self.url, {'after': None}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], self.second.id)
+        self.assertEqual(list(self.route.get_points()), [self.second, self.first])
+
+    def test_move_point_after_missing_point(self):
+        response = self.client.post(self.url, {'after': 9999}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {"error": "Point with id 9999 not found"})
+
+    def test_move_point_invalid_data(self):
+        response = self.client.post(self.url, {}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('after', response.data)
+
+    def test_move_point_permission_denied(self):
+        self.client.force_authenticate(user=self.other_user)
+
+        response = self.client.post(self.url, {'after': None}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(list(self.route.get_points()), [self.first, self.second])
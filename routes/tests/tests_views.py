@@ -114,6 +114,16 @@ class RouteViewsTestCase(TestCase):
         self.assertTemplateUsed(response, 'routes/detail.html')
         self.assertEqual(response.context['route'], self.route)
         self.assertEqual(len(response.context['points']), 2)
+        self.assertFalse(response.context['more_points'])
+
+    def test_get_route_view_renders_first_page(self):
+        self.client.login(username="testuser", password="testpassword")
+        with self.settings(ROUTES_POINT_PAGE_SIZE=1):
+            response = self.client.get(self.route_detail_url)
+
+        self.assertEqual(response.context['points'], [self.point1])
+        self.assertTrue(response.context['more_points'])
+        self.assertContains(response, "loadRemainingPoints();")
 
     def test_get_route_view_not_found(self):
         self.client.login(username="testuser", password="testpassword")
@@ -308,4 +318,27 @@ class RouteViewsTestCase(TestCase):
         )
 
         self.assertEqual(response.status_code, 404)
-        self.assertContains(response, "Point with id 99999 not found", status_code=404)
\ No newline at end of file
+        self.assertContains(response, "Point with id 99999 not found", status_code=404)
+
+    def test_reorder_points_accepts_string_ids(self):
+        self.client.login(username="testuser", password="testpassword")
+        data = {'order': [{'id': str(self.point1.id), 'order': 2}, {'id': str(self.point2.id), 'order': 1}]}
+        self.route.refresh_from_db()
+        version = self.route.version
+
+        response = self.client.post(self.reorder_points_url, json.dumps(data), content_type='application/json')
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(list(self.route.get_points().values_list('id', flat=True)), [self.point2.id, self.point1.id])
+        self.route.refresh_from_db()
+        self.assertEqual(self.route.version, version + 1)
+
+    def test_reorder_points_duplicate_orders(self):
+        self.client.login(username="testuser", password="testpassword")
+        data = {'order': [{'id': self.point1.id, 'order': 1}, {'id': self.point2.id, 'order': 1}]}
+
+        response = self.client.post(self.reorder_points_url, json.dumps(data), content_type='application/json')
+
+        self.assertContains(response, "Duplicate order values found", status_code=400)
+        self.point2.refresh_from_db()
+        self.assertEqual(self.point2.order, 2)
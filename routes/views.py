@@ -1,11 +1,15 @@
+from django.conf import settings
 from django.shortcuts import render, redirect
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.http import HttpResponseNotFound, HttpResponseForbidden, HttpResponseBadRequest, HttpResponse
 from .forms import RouteForm, CreatePointForm
 from images.models import Image
 import json
 from routes.models import Route, Point
+from routes import ordering
+from common.conditional import bump_version
 
 @require_http_methods(['GET', 'POST'])
 @login_required()
@@ -44,8 +48,16 @@ def get_route_view(request, route_id):
     except Route.DoesNotExist:
         return HttpResponseNotFound("Route not found")
 
-    points = route.get_points()
-    return render(request, 'routes/detail.html', {'route': route, 'points': points, 'current_user': request.user})
+    # Only the first page is rendered, the page fetches the remaining points as needed
+    page_size = settings.ROUTES_POINT_PAGE_SIZE
+    points = list(route.get_points().order_by('order', 'id')[:page_size + 1])
+    return render(request, 'routes/detail.html', {
+        'route': route,
+        'points': points[:page_size],
+        'more_points': len(points) > page_size,
+        'point_page_size': page_size,
+        'current_user': request.user,
+    })
 
 @require_http_methods(['POST'])
 @login_required()
@@ -78,8 +90,9 @@ def create_point(request, route_id):
 
     point = form.save(commit=False)
     point.route = route
-    point.order = route.points.count() + 1
-    point.save()
+    with transaction.atomic():
+        point.order = ordering.append_order(route)
+        point.save()
 
     return redirect('get_route_view', route_id=route.id)
 
@@ -99,6 +112,7 @@ def delete_point(request, route_id, point_id):
         return HttpResponseNotFound("Point not found")
 
     point.delete()
+    bump_version(Route, route.pk)
     return redirect('get_route_view', route_id=route.id)
 
 @require_http_methods(['POST'])
@@ -117,33 +131,19 @@ def reorder_points(request, route_id):
     if 'order' not in data:
         return HttpResponseBadRequest("Invalid data format")
 
-    points = route.get_points()
-
-    # Validate all data before saving
-    new_orders = []
+    orders = []
     for item in data.get('order', []):
-        if 'id' in item and 'order' in item:
-            point_id = item['id']
-            new_order = item['order']
-            point = points.filter(id=point_id).first()
-            if not point:
-                return HttpResponseNotFound(f"Point with id {point_id} not found")
-            new_orders.append((point, new_order))
-        else:
+        try:
+            # The page sends point ids taken from data attributes, i.e. as strings
+            orders.append((int(item['id']), int(item['order'])))
+        except (KeyError, TypeError, ValueError):
             return HttpResponseBadRequest("Invalid data format")
 
-    # Validate points order
-    order_set = set()
-    for _, new_order in new_orders:
-        if new_order in order_set:
-            return HttpResponseBadRequest("Duplicate order values found")
-        order_set.add(new_order)
-
-    # Save points only if validation passes
-    for point, new_order in new_orders:
-        point.order = new_order
-        point.save()
-
-    route.save()
+    try:
+        route.reorder_points(orders)
+    except Point.DoesNotExist as e:
+        return HttpResponseNotFound(str(e))
+    except ValueError as e:
+        return HttpResponseBadRequest(str(e))
 
-    return HttpResponse(status=204)
\ No newline at end of file
+    return HttpResponse(status=204)
@@ -191,8 +191,63 @@ SPECTACULAR_SETTINGS = {
         {'name': 'Routes', 'description': 'Endpoints for managing routes'},
         {'name': 'Images', 'description': 'Endpoints for managing images'},
     ],
+    'ENUM_NAME_OVERRIDES': {
+        'SolvabilityEnum': 'boards.solver.SOLVABILITY_CHOICES',
+        'UniquenessEnum': 'boards.solver.UNIQUENESS_CHOICES',
+        'VerificationEnum': 'boards.validation.VERIFICATION_CHOICES',
+    },
 }
 
+# Boards
+
+# Store board points and solution paths in the compact encoding instead of plain JSON
+BOARDS_COMPACT_STORAGE = os.getenv('BOARDS_COMPACT_STORAGE', 'True') == 'True'
+
+# Seconds the solver may spend on a board before reporting it as unknown
+BOARDS_SOLVER_DEADLINE = float(os.getenv('BOARDS_SOLVER_DEADLINE', '0.5'))
+# Seconds the solution counter may spend proving that a board has a single solution
+BOARDS_UNIQUENESS_DEADLINE = float(os.getenv('BOARDS_UNIQUENESS_DEADLINE', '10'))
+# Seconds the search may spend estimating the difficulty of a board
+BOARDS_DIFFICULTY_DEADLINE = float(os.getenv('BOARDS_DIFFICULTY_DEADLINE', '2'))
+# Threads verifying solutions submitted asynchronously and estimating board difficulty, 0 does it in the request
+BOARDS_VERIFICATION_WORKERS = int(os.getenv('BOARDS_VERIFICATION_WORKERS', '2'))
+# Processes running the searches of difficulty estimates and uniqueness checks, 0 runs them in the worker thread
+BOARDS_SOLVER_WORKERS = int(os.getenv('BOARDS_SOLVER_WORKERS', '2'))
+
+# Validation outcomes of recently submitted solutions kept in each process, 0 disables the cache
+BOARDS_VALIDATION_CACHE_SIZE = int(os.getenv('BOARDS_VALIDATION_CACHE_SIZE', '1024'))
+# Name of a Django cache shared between processes, empty to use the in-process cache only
+BOARDS_VALIDATION_CACHE = os.getenv('BOARDS_VALIDATION_CACHE', '')
+BOARDS_VALIDATION_CACHE_TIMEOUT = int(os.getenv('BOARDS_VALIDATION_CACHE_TIMEOUT', '3600'))
+# Occupancy grids of solutions being edited kept in each process, a grid takes 4 bytes per board cell
+BOARDS_OCCUPANCY_CACHE_SIZE = int(os.getenv('BOARDS_OCCUPANCY_CACHE_SIZE', '32'))
+# Play sessions kept in each process with their board state, others are rebuilt from the move log
+BOARDS_PLAY_SESSION_CACHE_SIZE = int(os.getenv('BOARDS_PLAY_SESSION_CACHE_SIZE', '128'))
+
+# Game boards per page of the board listings, clients may ask for up to the maximum
+BOARDS_PAGE_SIZE = int(os.getenv('BOARDS_PAGE_SIZE', '24'))
+BOARDS_MAX_PAGE_SIZE = int(os.getenv('BOARDS_MAX_PAGE_SIZE', '200'))
+
+# Longer side in pixels and Pillow format of the board previews shown on the list pages
+BOARDS_THUMBNAIL_SIZE = int(os.getenv('BOARDS_THUMBNAIL_SIZE', '160'))
+BOARDS_THUMBNAIL_FORMAT = os.getenv('BOARDS_THUMBNAIL_FORMAT', 'PNG')
+
+# Entries on a board leaderboard
+BOARDS_LEADERBOARD_SIZE = int(os.getenv('BOARDS_LEADERBOARD_SIZE', '10'))
+
+# Routes
+
+# Distance between the order values of consecutive route points, so that a point can be inserted between them
+ROUTES_POINT_ORDER_GAP = int(os.getenv('ROUTES_POINT_ORDER_GAP', '1024'))
+# Threads renumbering route points whose order gaps are running out, 0 does it when the request commits
+ROUTES_REBALANCE_WORKERS = int(os.getenv('ROUTES_REBALANCE_WORKERS', '1'))
+# Points a single batch request may add or delete
+ROUTES_MAX_POINT_BATCH = int(os.getenv('ROUTES_MAX_POINT_BATCH', '10000'))
+# Points rendered with the route page, further pages of this size are fetched by the page as needed
+ROUTES_POINT_PAGE_SIZE = int(os.getenv('ROUTES_POINT_PAGE_SIZE', '500'))
+# Rows read from the database at a time when streaming the points of a route
+ROUTES_POINT_STREAM_CHUNK_SIZE = int(os.getenv('ROUTES_POINT_STREAM_CHUNK_SIZE', '2000'))
+
 os.makedirs(os.path.join(BASE_DIR, 'logs'), exist_ok=True)
 
 # Logging Configuration